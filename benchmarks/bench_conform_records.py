@@ -0,0 +1,62 @@
+"""
+Benchmark conforming records to a schema (`conform_records_to_schema`), once with
+values already of the schema's types and once with every value a string.
+
+    python benchmarks/bench_conform_records.py --rows 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from datetime import datetime
+
+from snapflow.core.typing.inference import conform_records_to_schema
+from snapflow.schema.base import create_quick_schema
+
+BenchSchema = create_quick_schema(
+    "BenchSchema",
+    [
+        ("id", "Integer"),
+        ("name", "Text"),
+        ("amount", "Float"),
+        ("created_at", "DateTime"),
+        ("attrs", "JSON"),
+    ],
+    module_name="core",
+)
+
+
+def make_records(n: int):
+    now = datetime(2020, 1, 1)
+    return [
+        {
+            "id": i,
+            "name": f"name {i}",
+            "amount": i * 1.5,
+            "created_at": now,
+            "attrs": {"i": i},
+        }
+        for i in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    typed = make_records(args.rows)
+    strings = [
+        {"id": str(r["id"]), "name": r["name"], "amount": str(r["amount"])}
+        for r in typed
+    ]
+    for label, records in [("typed", typed), ("strings", strings)]:
+        start = time.perf_counter()
+        conformed = conform_records_to_schema(records, BenchSchema)
+        secs = time.perf_counter() - start
+        assert len(conformed) == args.rows
+        print(f"{label}: {secs:.2f}s ({args.rows / secs:,.0f} records/s)")
+
+
+if __name__ == "__main__":
+    main()
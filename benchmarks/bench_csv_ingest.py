@@ -0,0 +1,57 @@
+"""
+Benchmark parsing a delimited file into records: the python `csv` reader
+(`snapflow.utils.data.read_csv`) vs the chunked pandas C engine reader
+(`snapflow.utils.pandas.read_csv_chunks`) used by the DelimitedFile copiers.
+
+    python benchmarks/bench_csv_ingest.py --rows 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+
+from snapflow.utils.data import read_csv
+from snapflow.utils.pandas import dataframe_to_records, read_csv_chunks
+
+
+def write_file(path: str, n: int):
+    with open(path, "w") as f:
+        f.write("id,name,amount,created_at,note\n")
+        for i in range(n):
+            amount = "" if i % 10 == 0 else f"{i * 1.5}"
+            f.write(f'{i},"name {i}, with comma",{amount},2020-01-01 00:00:00,NULL\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.csv")
+    write_file(path, args.rows)
+
+    start = time.perf_counter()
+    with open(path) as f:
+        n_python = sum(1 for _ in read_csv(f))
+    python_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with open(path) as f:
+        n_chunks = sum(len(df) for df in read_csv_chunks(f))
+    chunks_secs = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with open(path) as f:
+        n_records = sum(len(dataframe_to_records(df)) for df in read_csv_chunks(f))
+    records_secs = time.perf_counter() - start
+
+    assert n_python == n_chunks == n_records == args.rows
+    print(f"csv module records:   {python_secs:.2f}s")
+    print(f"C engine DataFrames:  {chunks_secs:.2f}s")
+    print(f"C engine records:     {records_secs:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
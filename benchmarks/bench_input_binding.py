@@ -0,0 +1,141 @@
+"""
+Benchmark input binding against a large metadata history.
+
+Seeds a sqlite metadata db with `--rows` DataBlockLogs (half OUTPUT logs from a
+source node, half INPUT logs of those blocks into a sink node) plus a few
+unprocessed blocks, each block stored once in local memory storage. Then times
+`NodeInterfaceManager.get_bound_interface` for the sink node.
+
+    python benchmarks/bench_input_binding.py --rows 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from snapflow import DataBlock, Environment, Graph
+from snapflow.core.data_block import DataBlockMetadata, StoredDataBlockMetadata
+from snapflow.core.node import DataBlockLog, Direction, SnapLog
+from snapflow.core.snap_interface import NodeInterfaceManager
+from snapflow.storage.data_formats import RecordsFormat
+from snapflow.storage.db.utils import get_tmp_sqlite_db_url
+from snapflow.utils.common import utcnow
+
+BATCH_SIZE = 10000
+BLOCKS_PER_SNAP_LOG = 1000
+
+
+def bench_source():
+    pass
+
+
+def bench_sink(input: DataBlock):
+    pass
+
+
+def seed(env: Environment, g: Graph, storage_url: str, rows: int, unprocessed: int):
+    processed = rows // 2
+    with env.session_scope() as sess:
+        graph_id = g.ensure_metadata_obj(sess).hash
+        now = utcnow()
+        for start in range(0, processed + unprocessed, BATCH_SIZE):
+            end = min(start + BATCH_SIZE, processed + unprocessed)
+            block_ids = [f"{i:012}" for i in range(start, end)]
+            sess.execute(
+                DataBlockMetadata.__table__.insert(),
+                [
+                    dict(
+                        id=db_id,
+                        realized_schema_key="core.Any",
+                        nominal_schema_key="core.Any",
+                        deleted=False,
+                    )
+                    for db_id in block_ids
+                ],
+            )
+            sess.execute(
+                StoredDataBlockMetadata.__table__.insert(),
+                [
+                    dict(
+                        id=f"sdb{db_id}",
+                        data_block_id=db_id,
+                        storage_url=storage_url,
+                        data_format=RecordsFormat,
+                    )
+                    for db_id in block_ids
+                ],
+            )
+            logs = []
+            for i in range(start, end, BLOCKS_PER_SNAP_LOG):
+                batch_ids = block_ids[i - start : i - start + BLOCKS_PER_SNAP_LOG]
+                source_log = SnapLog(
+                    graph_id=graph_id,
+                    node_key="source",
+                    snap_key="bench_source",
+                    runtime_url="python://bench",
+                )
+                sess.add(source_log)
+                sink_log = SnapLog(
+                    graph_id=graph_id,
+                    node_key="sink",
+                    snap_key="bench_sink",
+                    runtime_url="python://bench",
+                )
+                sess.add(sink_log)
+                sess.flush([source_log, sink_log])
+                for j, db_id in enumerate(batch_ids):
+                    logs.append(
+                        dict(
+                            snap_log_id=source_log.id,
+                            data_block_id=db_id,
+                            direction=Direction.OUTPUT,
+                            processed_at=now,
+                            invalidated=False,
+                        )
+                    )
+                    if i + j < processed:
+                        logs.append(
+                            dict(
+                                snap_log_id=sink_log.id,
+                                data_block_id=db_id,
+                                direction=Direction.INPUT,
+                                processed_at=now,
+                                invalidated=False,
+                            )
+                        )
+            sess.bulk_insert_mappings(DataBlockLog, logs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--unprocessed", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    env = Environment(metadata_storage=get_tmp_sqlite_db_url())
+    g = Graph(env)
+    source = g.create_node(key="source", snap=bench_source)
+    sink = g.create_node(key="sink", snap=bench_sink, input=source)
+
+    ctx = env.get_run_context(g)
+    start = time.perf_counter()
+    seed(env, g, ctx.local_python_storage.url, args.rows, args.unprocessed)
+    print(f"Seeded {args.rows:,} DataBlockLogs in {time.perf_counter() - start:.1f}s")
+
+    timings = []
+    for _ in range(args.repeat):
+        with env.session_scope() as sess:
+            start = time.perf_counter()
+            NodeInterfaceManager(ctx, sess, sink).get_bound_interface()
+            timings.append(time.perf_counter() - start)
+    timings.sort()
+    print(
+        f"get_bound_interface: min {timings[0] * 1000:.1f}ms, "
+        f"median {timings[len(timings) // 2] * 1000:.1f}ms "
+        f"({args.repeat} runs)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark bulk loading records into postgres: COPY (the default
+`PostgresDatabaseApi` insert path) vs INSERT with psycopg2 `execute_values`.
+
+Needs a local postgres server (uses `PostgresDatabaseApi.temp_local_database`).
+
+    python benchmarks/bench_postgres_bulk_insert.py --rows 1000000
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from snapflow.schema.base import create_quick_schema
+from snapflow.storage.db.postgres import PostgresDatabaseApi, bulk_insert
+from snapflow.utils.common import utcnow
+
+BenchSchema = create_quick_schema(
+    "BenchSchema",
+    [
+        ("id", "Integer"),
+        ("name", "Text"),
+        ("amount", "Float"),
+        ("created_at", "DateTime"),
+        ("attrs", "JSON"),
+    ],
+    module_name="core",
+)
+
+
+def make_records(n: int):
+    now = utcnow()
+    return [
+        {
+            "id": i,
+            "name": f'name "{i}", with, commas',
+            "amount": i * 1.5 if i % 10 else None,
+            "created_at": now,
+            "attrs": {"i": i, "tags": ["a", "b"]},
+        }
+        for i in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    records = make_records(args.rows)
+    chunks = [
+        records[i : i + args.chunk_size] for i in range(0, args.rows, args.chunk_size)
+    ]
+    with PostgresDatabaseApi.temp_local_database() as url:
+        api = PostgresDatabaseApi(url)
+        api.ensure_table("_bench_insert", BenchSchema)
+        start = time.perf_counter()
+        for chunk in chunks:
+            bulk_insert(api.get_engine(), "_bench_insert", chunk)
+        insert_secs = time.perf_counter() - start
+
+        start = time.perf_counter()
+        api.bulk_insert_records_iterator("_bench_copy", chunks, BenchSchema)
+        copy_secs = time.perf_counter() - start
+
+        assert api.count("_bench_insert") == api.count("_bench_copy") == args.rows
+
+    print(f"execute_values: {insert_secs:.2f}s ({args.rows / insert_secs:,.0f} rows/s)")
+    print(f"COPY:           {copy_secs:.2f}s ({args.rows / copy_secs:,.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
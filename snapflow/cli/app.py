@@ -234,6 +234,32 @@ def test(module: str):
     m.run_tests()
 
 
+@click.command("calibrate")
+@click.option(
+    "-n", "--records", default=10000, help="Records to copy per copier (10000)"
+)
+@click.option(
+    "-o",
+    "--output",
+    default="datacopy_calibration.json",
+    help="File to write cost coefficients to",
+)
+def calibrate(records: int, output: str):
+    """Measure data copier throughput and save cost coefficients"""
+    from snapflow.storage.data_copy.base import save_copier_cost_coefficients
+    from snapflow.storage.data_copy.calibration import calibrate_data_copiers
+
+    coefficients = calibrate_data_copiers(record_count=records)
+    save_copier_cost_coefficients(output, coefficients)
+    echo_table(
+        ["Copier", "Cost coefficient"],
+        [[k, f"{v:.2f}"] for k, v in sorted(coefficients.items())],
+    )
+    click.echo(
+        f"Saved to '{output}'. Set the DATACOPY_CALIBRATION_PATH setting to use it."
+    )
+
+
 @click.command("reset")
 @click.pass_obj
 def reset_metadata(env: Environment):
@@ -305,4 +331,5 @@ app.add_command(nodes)
 # app.add_command(search)
 app.add_command(reset_metadata)
 app.add_command(test)
+app.add_command(calibrate)
 app.add_command(init_project)
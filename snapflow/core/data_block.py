@@ -6,7 +6,11 @@ from typing import TYPE_CHECKING, Any, Generic, Iterator, Optional, Tuple, Type
 from loguru import logger
 from pandas import DataFrame
 from snapflow.core.environment import Environment
-from snapflow.core.metadata.orm import BaseModel, timestamp_increment_key
+from snapflow.core.metadata.orm import (
+    SNAPFLOW_METADATA_TABLE_PREFIX,
+    BaseModel,
+    timestamp_increment_key,
+)
 from snapflow.core.typing.inference import infer_schema_from_db_table
 from snapflow.schema import Schema, SchemaKey, SchemaLike, SchemaTranslation
 from snapflow.schema.casting import cast_to_realized_schema
@@ -36,7 +40,7 @@ from snapflow.storage.storage import PythonStorageClass
 from snapflow.utils.common import as_identifier, rand_str
 from snapflow.utils.registry import ClassBasedEnumSqlalchemyType
 from snapflow.utils.typing import T
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String, event, or_
+from sqlalchemy import Boolean, Column, ForeignKey, Index, Integer, String, event, or_
 from sqlalchemy.orm import RelationshipProperty, Session, relationship
 
 if TYPE_CHECKING:
@@ -187,6 +191,13 @@ DataBlock = ManagedDataBlock
 
 
 class StoredDataBlockMetadata(BaseModel):
+    __table_args__ = (
+        Index(
+            f"ix{SNAPFLOW_METADATA_TABLE_PREFIX}stored_data_block_metadata_data_block",
+            "data_block_id",
+            "storage_url",
+        ),
+    )
     id = Column(String(128), primary_key=True, default=get_datablock_id)
     # id = Column(Integer, primary_key=True, autoincrement=True)
     name = Column(String(128), nullable=True)
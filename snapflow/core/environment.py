@@ -41,6 +41,21 @@ DEFAULT_METADATA_STORAGE_URL = "sqlite://"  # in-memory sqlite
 DEFAULT_SETTINGS = {
     "FAIL_ON_DOWNCAST": False,
     "WARN_ON_DOWNCAST": True,
+    # Metadata written per emitted block is buffered and bulk inserted after this
+    # many rows or seconds (see MetadataWriteBuffer)
+    "METADATA_BUFFER_MAX_ROWS": 1000,
+    "METADATA_BUFFER_FLUSH_SECONDS": 5,
+    # Snap runs still unfinished this long after starting are taken to be abandoned
+    # and stop holding back input watermarks (see StreamBuilder.advance_watermark)
+    "SNAP_RUN_STALE_SECONDS": 24 * 60 * 60,
+    # Data copier cost coefficients written by `snapflow calibrate`
+    "DATACOPY_CALIBRATION_PATH": None,
+    # Natural format of file storages, eg "ParquetFileFormat" (default delimited files)
+    "FILE_STORAGE_FORMAT": None,
+    # Byte budget for local python storage, least recently used blocks are spilled
+    # to LOCAL_STORAGE_SPILL_DIR (default system temp dir) past it. None is unbounded
+    "LOCAL_STORAGE_MAX_BYTES": None,
+    "LOCAL_STORAGE_SPILL_DIR": None,
 }
 
 
@@ -93,6 +108,7 @@ class Environment:
         s = AttrDict(DEFAULT_SETTINGS)
         s.update(settings or {})
         self.settings = s
+        self.apply_global_settings()
         # if add_default_python_runtime:
         #     self.runtimes.append(
         #         Runtime(
@@ -108,10 +124,46 @@ class Environment:
         self._local_python_storage = new_local_python_storage()
         self.add_storage(self._local_python_storage)
 
+    def __getstate__(self) -> Dict:
+        # Sessions can't be shared across processes, reconnect from the metadata url
+        state = self.__dict__.copy()
+        state.pop("Session", None)
+        state["_metadata_sessions"] = []
+        return state
+
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self.Session = sessionmaker(bind=self.metadata_storage.get_api().get_engine())
+
     @property
     def metadata_storage(self) -> Storage:
         return self.config.metadata_storage
 
+    def apply_global_settings(self):
+        """
+        Copier costs, the file storage format and the local storage budget are
+        process-wide, so are (re)set from these settings, back to their defaults
+        where unset, rather than left as an earlier Environment configured them.
+        """
+        from snapflow.storage.data_copy.base import (
+            load_copier_cost_coefficients,
+            set_copier_cost_coefficients,
+        )
+        from snapflow.storage.storage import (
+            LOCAL_PYTHON_STORAGE,
+            set_file_storage_natural_format,
+        )
+
+        if self.settings.DATACOPY_CALIBRATION_PATH:
+            load_copier_cost_coefficients(self.settings.DATACOPY_CALIBRATION_PATH)
+        else:
+            set_copier_cost_coefficients({})
+        set_file_storage_natural_format(self.settings.FILE_STORAGE_FORMAT)
+        LOCAL_PYTHON_STORAGE.configure(
+            max_bytes=self.settings.LOCAL_STORAGE_MAX_BYTES,
+            spill_dir=self.settings.LOCAL_STORAGE_SPILL_DIR,
+        )
+
     def initialize_metadata_database(self):
         if not issubclass(
             self.metadata_storage.storage_engine.storage_class, DatabaseStorageClass
@@ -341,6 +393,9 @@ class Environment:
         node_like: Optional[NodeLike] = None,
         graph: Union[Graph, DeclaredGraph] = None,
         to_exhaustion: bool = True,
+        max_workers: int = 1,
+        pipelined: bool = False,
+        use_processes: bool = False,
         **execution_kwargs: Any,
     ) -> Optional[DataBlock]:
         node, graph = self._get_graph_and_node(node_like, graph)
@@ -348,14 +403,16 @@ class Environment:
             dependencies = graph.get_all_upstream_dependencies_in_execution_order(node)
         else:
             dependencies = graph.get_all_nodes_in_execution_order()
-        output = None
         sess = self._get_new_metadata_session()  # hanging session
         with self.run(graph, **execution_kwargs) as em:
-            for dep in dependencies:
-                output = em.execute(
-                    dep, to_exhaustion=to_exhaustion, output_session=sess
-                )
-        return output
+            return em.execute_nodes(
+                dependencies,
+                to_exhaustion=to_exhaustion,
+                output_session=sess,
+                max_workers=self._get_max_workers(max_workers),
+                pipelined=pipelined and self._supports_concurrency(),
+                use_processes=use_processes,
+            )
 
     def run_node(
         self,
@@ -376,6 +433,9 @@ class Environment:
         self,
         graph: Union[Graph, DeclaredGraph],
         to_exhaustion: bool = True,
+        max_workers: int = 1,
+        pipelined: bool = False,
+        use_processes: bool = False,
         **execution_kwargs: Any,
     ):
         from snapflow.core.graph import DeclaredGraph
@@ -384,8 +444,37 @@ class Environment:
             graph = graph.instantiate(self)
         nodes = graph.get_all_nodes_in_execution_order()
         with self.run(graph, **execution_kwargs) as em:
-            for node in nodes:
-                em.execute(node, to_exhaustion=to_exhaustion)
+            em.execute_nodes(
+                nodes,
+                to_exhaustion=to_exhaustion,
+                max_workers=self._get_max_workers(max_workers),
+                pipelined=pipelined and self._supports_concurrency(),
+                use_processes=use_processes,
+            )
+
+    def _get_max_workers(self, max_workers: int) -> int:
+        if max_workers > 1 and not self._supports_concurrency():
+            return 1
+        return max_workers
+
+    def _supports_concurrency(self) -> bool:
+        if self.metadata_storage.url.startswith("sqlite"):
+            # In-memory dbs are per connection, so each thread would get its own
+            # (empty) db, and concurrent writers to a file db fail with "database
+            # is locked"
+            logger.warning(
+                "Concurrent execution not supported with sqlite metadata storage, running serially"
+            )
+            return False
+        return True
+
+    def _is_in_memory_metadata_storage(self) -> bool:
+        url = self.metadata_storage.url
+        return url.startswith("sqlite") and (
+            url.rstrip("/") in ("sqlite:", "sqlite://")
+            or ":memory:" in url
+            or "mode=memory" in url
+        )
 
     def latest_output(self, node: NodeLike) -> Optional[DataBlock]:
         sess = self._get_new_metadata_session()  # hanging session
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+import multiprocessing
+import time
 import traceback
 from collections import abc, defaultdict
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
 from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
@@ -29,6 +39,7 @@ from snapflow.core.snap_interface import (
     StreamInput,
 )
 from snapflow.core.storage import copy_lowest_cost
+from snapflow.core.streams import BlockPipe, BlockPipes, ManagedDataBlockStream
 from snapflow.schema.base import Schema
 from snapflow.storage.data_formats import DataFrameIterator, RecordsIterator
 from snapflow.storage.data_formats.base import DataFormat, SampleableIterator
@@ -39,7 +50,13 @@ from snapflow.storage.data_records import (
     records_object_is_definitely_empty,
     wrap_records_object,
 )
-from snapflow.storage.storage import LocalPythonStorageEngine, PythonStorageApi, Storage
+from snapflow.storage.storage import (
+    LocalPythonStorageEngine,
+    PythonStorageClass,
+    Storage,
+    closing_local_records,
+    new_local_python_storage,
+)
 from snapflow.utils.common import cf, error_symbol, success_symbol, utcnow
 from snapflow.utils.data import SampleableIO
 from sqlalchemy.engine import ResultProxy
@@ -47,7 +64,7 @@ from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import Session
 
 if TYPE_CHECKING:
-    from snapflow.core.graph import Graph, GraphMetadata
+    from snapflow.core.graph import Graph
 
 
 class Language(Enum):
@@ -100,8 +117,8 @@ class RuntimeSpecification:
     package_requirements: List[str]  # "extensions" for postgres, etc
 
 
-# TODO: Idea is to have this be easily serializable to pass around to workers, along with RunContext
-#      (Or subset RunConfiguration?). We're not really close to that yet...
+# Serializable, along with RunContext, to pass around to workers. Inputs are bound
+# by the worker itself, so the bound interface (and its sessions) is never pickled.
 @dataclass
 class Executable:
     node_key: str
@@ -110,13 +127,117 @@ class Executable:
     bound_interface: BoundInterface = None
     params: Dict = field(default_factory=dict)
 
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        state["bound_interface"] = None
+        return state
+
+
+class MetadataWriteBuffer:
+    """
+    Write-behind buffer for the metadata a snap run writes for each emitted block:
+    DataBlockLogs and Aliases are collected and bulk inserted, and the pending
+    DataBlock and StoredDataBlock objects are left in the session to be flushed
+    together (one executemany per table) at the same time. Written once `max_rows`
+    rows are buffered or `flush_interval_seconds` have passed since the last write,
+    and always at the end of the run.
+
+    Crash consistency: buffered rows go into the snap run's own metadata
+    transaction, which is only committed at the end of the run (or after each emit
+    for pipelined runs, after this buffer is flushed). So a crash loses either all
+    of a run's uncommitted metadata or none of it, never a partial set, and a block
+    is never recorded as processed without its output also being recorded. Data
+    already written to storages (tables, files, storage aliases) may be orphaned by a
+    crash, as without buffering.
+    """
+
+    def __init__(
+        self,
+        sess: Session,
+        snap_log: SnapLog,
+        max_rows: int = 1000,
+        flush_interval_seconds: float = 5.0,
+    ):
+        self.sess = sess
+        self.snap_log = snap_log
+        self.max_rows = max_rows
+        self.flush_interval_seconds = flush_interval_seconds
+        self._data_block_logs: List[Dict[str, Any]] = []
+        self._aliases: Dict[str, Dict[str, Any]] = {}
+        self._last_flushed_at = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._data_block_logs) + len(self._aliases)
+
+    def add_data_block_log(self, data_block_id: str, direction: Direction):
+        self._data_block_logs.append(
+            dict(
+                data_block_id=data_block_id,
+                direction=direction,
+                processed_at=utcnow(),
+                invalidated=False,
+            )
+        )
+        self.maybe_flush()
+
+    def add_alias(self, alias: str, data_block_id: str, stored_data_block_id: str):
+        # Last write wins, same as updating the Alias in place
+        self._aliases[alias] = dict(
+            alias=alias,
+            data_block_id=data_block_id,
+            stored_data_block_id=stored_data_block_id,
+        )
+        self.maybe_flush()
+
+    def get_alias(self, stored_data_block_id: str) -> Optional[str]:
+        for alias, a in self._aliases.items():
+            if a["stored_data_block_id"] == stored_data_block_id:
+                return alias
+        return None
+
+    def maybe_flush(self):
+        if (
+            len(self) >= self.max_rows
+            or time.monotonic() - self._last_flushed_at >= self.flush_interval_seconds
+        ):
+            self.flush()
+
+    def flush(self):
+        # Snap log and pending blocks first, logs and aliases reference them
+        self.sess.add(self.snap_log)
+        self.sess.flush()
+        if self._data_block_logs:
+            for row in self._data_block_logs:
+                row["snap_log_id"] = self.snap_log.id
+            self.sess.bulk_insert_mappings(DataBlockLog, self._data_block_logs)
+        if self._aliases:
+            existing = set(
+                a
+                for a, in self.sess.query(Alias.alias).filter(
+                    Alias.alias.in_(list(self._aliases))
+                )
+            )
+            self.sess.bulk_update_mappings(
+                Alias, [a for k, a in self._aliases.items() if k in existing]
+            )
+            self.sess.bulk_insert_mappings(
+                Alias, [a for k, a in self._aliases.items() if k not in existing]
+            )
+        self._data_block_logs = []
+        self._aliases = {}
+        self._last_flushed_at = time.monotonic()
+
 
 @dataclass(frozen=True)
 class ExecutionSession:
     snap_log: SnapLog
     metadata_session: Session  # Make this a URL or other jsonable and then runtime can connect
+    write_buffer: Optional[MetadataWriteBuffer] = None
 
     def log(self, block: DataBlockMetadata, direction: Direction):
+        if self.write_buffer is not None:
+            self.write_buffer.add_data_block_log(block.id, direction)
+            return
         drl = DataBlockLog(  # type: ignore
             snap_log=self.snap_log,
             data_block=block,
@@ -125,6 +246,33 @@ class ExecutionSession:
         )
         self.metadata_session.add(drl)
 
+    def create_alias(self, node: Node, sdb: StoredDataBlockMetadata) -> Optional[Alias]:
+        if self.write_buffer is None:
+            self.metadata_session.flush([sdb.data_block, sdb])
+            alias = ensure_alias(self.metadata_session, node, sdb)
+            self.metadata_session.flush([alias])
+            return alias
+        alias_name = node.get_alias()
+        logger.debug(
+            f"Creating alias {alias_name} for node {node.key} on storage {sdb.storage_url}"
+        )
+        sdb.storage.get_api().create_alias(sdb.get_name(), alias_name)
+        self.write_buffer.add_alias(alias_name, sdb.data_block_id, sdb.id)
+        return None
+
+    def get_alias(self, sdb: StoredDataBlockMetadata) -> Optional[str]:
+        if self.write_buffer is not None:
+            alias_name = self.write_buffer.get_alias(sdb.id)
+            if alias_name is not None:
+                return alias_name
+        alias = sdb.get_alias(self.metadata_session)
+        return alias.alias if alias is not None else None
+
+    def flush(self):
+        if self.write_buffer is not None:
+            self.write_buffer.flush()
+        self.metadata_session.flush()
+
     def log_input(self, block: DataBlockMetadata):
         logger.debug(f"Input logged: {block}")
         self.log(block, Direction.INPUT)
@@ -173,6 +321,10 @@ def validate_data_blocks(sess: Session):
                     )
 
 
+def print_logger(s: str):
+    print(s, end="")
+
+
 @dataclass  # (frozen=True)
 class RunContext:
     env: Environment
@@ -187,8 +339,17 @@ class RunContext:
         int
     ] = None  # TODO: this is a "soft" limit, could imagine a "hard" one too
     execution_timelimit_seconds: Optional[int] = None
-    logger: Callable[[str], None] = lambda s: print(s, end="")
+    logger: Callable[[str], None] = print_logger
     raise_on_error: bool = False
+    block_pipes: Optional[BlockPipes] = None  # Only set for pipelined runs
+
+    def __getstate__(self) -> Dict:
+        # Trimmed for other processes: env reconnects to metadata storage from
+        # its url, and loggers and pipes are local to this process
+        state = self.__dict__.copy()
+        state["logger"] = print_logger
+        state["block_pipes"] = None
+        return state
 
     def clone(self, **kwargs):
         args = dict(
@@ -204,54 +365,79 @@ class RunContext:
             execution_timelimit_seconds=self.execution_timelimit_seconds,
             logger=self.logger,
             raise_on_error=self.raise_on_error,
+            block_pipes=self.block_pipes,
         )
         args.update(**kwargs)
         return RunContext(**args)  # type: ignore
 
     @contextmanager
     def start_snap_run(self, node: Node) -> Iterator[ExecutionSession]:
-        from snapflow.core.graph import GraphMetadata
-
         assert self.current_runtime is not None, "Runtime not set"
-        with self.env.session_scope() as sess:
-            node_state_obj = node.get_state(sess)
-            if node_state_obj is None:
-                node_state = {}
-            else:
-                node_state = node_state_obj.state
-            new_graph_meta = node.graph.get_metadata_obj()
-            graph_meta = sess.query(GraphMetadata).get(new_graph_meta.hash)
-            if graph_meta is None:
-                sess.add(new_graph_meta)
-                sess.flush([new_graph_meta])
-                graph_meta = new_graph_meta
-
-            pl = SnapLog(  # type: ignore
-                graph_id=graph_meta.hash,
-                node_key=node.key,
-                node_start_state={k: v for k, v in node_state.items()},
-                node_end_state=node_state,
-                snap_key=node.snap.key,
-                snap_params=node.params,
-                runtime_url=self.current_runtime.url,
-                started_at=utcnow(),
-            )
+        snap_log_id: Optional[int] = None
+        try:
+            with self.env.session_scope() as sess:
+                node_state_obj = node.get_state(sess)
+                if node_state_obj is None:
+                    node_state = {}
+                else:
+                    node_state = node_state_obj.state
+                graph_meta = node.graph.ensure_metadata_obj(sess)
+
+                pl = SnapLog(  # type: ignore
+                    graph_id=graph_meta.hash,
+                    node_key=node.key,
+                    node_start_state={k: v for k, v in node_state.items()},
+                    node_end_state=node_state,
+                    snap_key=node.snap.key,
+                    snap_params=node.params,
+                    runtime_url=self.current_runtime.url,
+                    started_at=utcnow(),
+                )
+                # Commit the SnapLog now so other sessions can see this run is in
+                # progress: the blocks it creates only commit with the run, and
+                # `StreamBuilder.advance_watermark` must not pass them meanwhile
+                sess.add(pl)
+                sess.commit()
+                snap_log_id = pl.id
+
+                write_buffer = MetadataWriteBuffer(
+                    sess,
+                    pl,
+                    max_rows=self.env.settings.METADATA_BUFFER_MAX_ROWS,
+                    flush_interval_seconds=self.env.settings.METADATA_BUFFER_FLUSH_SECONDS,
+                )
+                execution_session = ExecutionSession(pl, sess, write_buffer)
+                try:
+                    yield execution_session
+                    execution_session.flush()
+                    # Validate local memory objects: Did we leave any non-storeables hanging?
+                    validate_data_blocks(sess)
+                except Exception as e:
+                    logger.debug(f"Error running node:\n{traceback.format_exc()}")
+                    pl.set_error(e)
+                    if self.raise_on_error:
+                        raise e
+                finally:
+                    # Persist state on success OR error:
+                    pl.persist_state(sess)
+                    pl.completed_at = utcnow()
+                    sess.add(pl)
+                    execution_session.flush()
+        except Exception as e:
+            if snap_log_id is not None:
+                self.end_rolled_back_snap_log(snap_log_id, e)
+            raise e
 
-            try:
-                yield ExecutionSession(pl, sess)
-                # Validate local memory objects: Did we leave any non-storeables hanging?
-                validate_data_blocks(sess)
-            except Exception as e:
-                logger.debug(f"Error running node:\n{traceback.format_exc()}")
+    def end_rolled_back_snap_log(self, snap_log_id: int, e: Exception):
+        # The run's SnapLog was committed as it started, so the rollback didn't undo
+        # it: drop it as well, unless the run already committed blocks (pipelined)
+        with self.env.session_scope() as sess:
+            pl = sess.query(SnapLog).get(snap_log_id)
+            if pl.data_block_logs:
                 pl.set_error(e)
-                if self.raise_on_error:
-                    raise e
-            finally:
-                # Persist state on success OR error:
-                pl.persist_state(sess)
                 pl.completed_at = utcnow()
-                sess.add(pl)
-                sess.flush()
+            else:
+                sess.delete(pl)
 
     @property
     def all_storages(self) -> List[Storage]:
@@ -342,6 +528,7 @@ class SnapContext:  # TODO: (Generic[C, S]):
         update_state: Dict[str, Any] = None,
         replace_state: Dict[str, Any] = None,
     ):
+        sdb = None
         if records_obj is not None:
             sdb = self.handle_records_object(
                 records_obj, data_format=data_format, schema=schema
@@ -357,6 +544,14 @@ class SnapContext:  # TODO: (Generic[C, S]):
             self.emit_state(replace_state)
         # Commit input blocks to db as well, to save progress
         self.log_input_blocks()
+        if self.run_context.block_pipes is not None:
+            # Pipelined run: commit so downstream nodes can start on this block now
+            self.execution_session.flush()
+            self.execution_session.metadata_session.commit()
+            if sdb is not None:
+                self.run_context.block_pipes.publish(
+                    self.executable.node_key, sdb.data_block_id
+                )
 
     def handle_records_object(
         self,
@@ -398,12 +593,7 @@ class SnapContext:  # TODO: (Generic[C, S]):
         return sdb
 
     def create_alias(self, sdb: StoredDataBlockMetadata) -> Optional[Alias]:
-        self.execution_session.metadata_session.flush([sdb.data_block, sdb])
-        alias = ensure_alias(
-            self.execution_session.metadata_session, self.get_node(), sdb
-        )
-        self.execution_session.metadata_session.flush([alias])
-        return alias
+        return self.execution_session.create_alias(self.get_node(), sdb)
 
     def store_output_block(self, dro: MemoryDataRecords) -> StoredDataBlockMetadata:
         block, sdb = create_data_block_from_records(
@@ -450,6 +640,9 @@ class SnapContext:  # TODO: (Generic[C, S]):
         for input in self.executable.bound_interface.inputs:
             if input.bound_stream is not None:
                 for db in input.bound_stream.get_emitted_blocks():
+                    if db in self.input_blocks_processed[input.name]:
+                        # Already logged on a previous emit
+                        continue
                     self.input_blocks_processed[input.name].add(db)
                     self.execution_session.log_input(db)
 
@@ -488,6 +681,30 @@ class ExecutionManager:
         to_exhaustion: bool = False,
         output_session: Optional[Session] = None,
     ) -> Optional[DataBlock]:
+        output_block_id = self.run_node(node, to_exhaustion=to_exhaustion)
+        return self.get_output_block(node, output_block_id, output_session)
+
+    def get_output_block(
+        self,
+        node: Node,
+        output_block_id: Optional[str],
+        output_session: Optional[Session] = None,
+    ) -> Optional[DataBlock]:
+        # TODO: how to pass back with session?
+        #   maybe with env.produce() as output:
+        # Or just merge in new session in env.produce
+        if output_block_id is None or output_session is None:
+            return None
+        run_ctx = self.ctx.clone(current_runtime=self.select_runtime(node))
+        db: DataBlockMetadata = output_session.query(DataBlockMetadata).get(
+            output_block_id
+        )
+        return db.as_managed_data_block(run_ctx, output_session)
+
+    def run_node(self, node: Node, to_exhaustion: bool = False) -> Optional[str]:
+        """
+        Runs node, returning id of the last non-empty output block (if any)
+        """
         runtime = self.select_runtime(node)
         run_ctx = self.ctx.clone(current_runtime=runtime)
         worker = Worker(run_ctx)
@@ -529,18 +746,181 @@ class ExecutionManager:
             self.ctx.logger(INDENT + cf.error("Error " + error_symbol) + str(e) + "\n")  # type: ignore
             raise e
 
-        # TODO: how to pass back with session?
-        #   maybe with env.produce() as output:
-        # Or just merge in new session in env.produce
-        if last_non_none_output is None:
-            return None
         logger.debug(f"*DONE* RUNNING NODE {node.key} {node.snap.key}")
-        if output_session is not None:
-            db: DataBlockMetadata = output_session.query(DataBlockMetadata).get(
-                last_non_none_output
+        return last_non_none_output
+
+    def execute_nodes(
+        self,
+        nodes: List[Node],
+        to_exhaustion: bool = False,
+        output_session: Optional[Session] = None,
+        max_workers: int = 1,
+        pipelined: bool = False,
+        pipe_buffer_size: int = 8,
+        use_processes: bool = False,
+    ) -> Optional[DataBlock]:
+        """
+        Executes given nodes (in execution order), returning the output of the last
+        node. With `max_workers` > 1, nodes run concurrently as soon as all of
+        their upstream nodes (within `nodes`) have completed.
+
+        With `pipelined`, a node consuming a Stream input from other nodes in the run
+        doesn't wait for them to finish: it starts right away and is handed each
+        block as soon as it is emitted (and committed) upstream, with at most
+        `pipe_buffer_size` blocks buffered per input. Every node gets its own thread
+        so all stages of a pipeline can be live at once.
+
+        With `use_processes`, nodes run in a pool of `max_workers` processes instead
+        of threads. Workers only share data through the metadata and target storages,
+        so those can't be in-memory.
+        """
+        if use_processes and pipelined:
+            raise ValueError("Pipelined runs require thread workers")
+        if not nodes:
+            return None
+        if use_processes:
+            self.check_process_compatible()
+            return self._execute_nodes_concurrently(
+                nodes, to_exhaustion, output_session, max_workers, use_processes=True
+            )
+        if pipelined:
+            block_pipes = self.build_block_pipes(nodes, pipe_buffer_size)
+            if block_pipes.pipes:
+                em = ExecutionManager(self.ctx.clone(block_pipes=block_pipes))
+                return em._execute_nodes_concurrently(
+                    nodes, to_exhaustion, output_session, max(max_workers, len(nodes))
+                )
+        if max_workers <= 1:
+            output = None
+            for node in nodes:
+                output = self.execute(
+                    node, to_exhaustion=to_exhaustion, output_session=output_session
+                )
+            return output
+        return self._execute_nodes_concurrently(
+            nodes, to_exhaustion, output_session, max_workers
+        )
+
+    def _execute_nodes_concurrently(
+        self,
+        nodes: List[Node],
+        to_exhaustion: bool,
+        output_session: Optional[Session],
+        max_workers: int,
+        use_processes: bool = False,
+    ) -> Optional[DataBlock]:
+        # Create graph metadata up front so concurrent snap runs don't race to insert it
+        with self.env.session_scope() as sess:
+            self.ctx.graph.ensure_metadata_obj(sess)
+        last_node = nodes[-1]
+        upstream = self.ctx.graph.get_upstream_dependency_keys(nodes)
+        block_pipes = self.ctx.block_pipes
+        if block_pipes is not None:
+            # Don't wait on upstream nodes we are only fed by pipe
+            for (node_key, input_name), pipe in block_pipes.pipes.items():
+                upstream[node_key] -= pipe.upstream_node_keys
+        pending = {n.key: n for n in nodes}
+        completed: Set[str] = set()
+        running: Dict[Future, Node] = {}
+        output_block_id: Optional[str] = None
+        error: Optional[BaseException] = None
+        pool: Executor
+        if use_processes:
+            # Spawn (not fork) so workers don't inherit open connections
+            pool = ProcessPoolExecutor(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            pool = ThreadPoolExecutor(max_workers=max_workers)
+        with pool:
+            while pending or running:
+                if error is None:
+                    for key in list(pending):
+                        if upstream[key] <= completed:
+                            node = pending.pop(key)
+                            if use_processes:
+                                fut = pool.submit(
+                                    run_node_in_process,
+                                    self.ctx,
+                                    node.key,
+                                    to_exhaustion=to_exhaustion,
+                                )
+                            else:
+                                fut = pool.submit(
+                                    self._run_scheduled_node,
+                                    node,
+                                    to_exhaustion=to_exhaustion,
+                                )
+                            running[fut] = node
+                if not running:
+                    if error is None and pending:
+                        raise Exception(
+                            f"Unable to schedule nodes {list(pending)} (cycle?)"
+                        )
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for fut in done:
+                    node = running.pop(fut)
+                    exc = fut.exception()
+                    if exc is not None:
+                        # Stop scheduling new nodes, let running ones finish
+                        error = error or exc
+                        if block_pipes is not None:
+                            block_pipes.cancel_all()
+                        continue
+                    completed.add(node.key)
+                    if node is last_node:
+                        output_block_id = fut.result()
+        if error is not None:
+            raise error
+        # Output is bound to the session here, sessions are not shared across threads
+        return self.get_output_block(last_node, output_block_id, output_session)
+
+    def _run_scheduled_node(
+        self, node: Node, to_exhaustion: bool = False
+    ) -> Optional[str]:
+        if self.ctx.block_pipes is None:
+            return self.run_node(node, to_exhaustion=to_exhaustion)
+        try:
+            return self.run_node(node, to_exhaustion=to_exhaustion)
+        finally:
+            # Signal downstream we're done producing, and unblock upstream
+            # producers if we stopped consuming early
+            self.ctx.block_pipes.close(node.key)
+            self.ctx.block_pipes.cancel_inputs(node.key)
+
+    def check_process_compatible(self):
+        if self.env._is_in_memory_metadata_storage():
+            raise Exception("Process workers require a persistent metadata storage")
+        if issubclass(
+            self.ctx.target_storage.storage_engine.storage_class, PythonStorageClass
+        ):
+            raise Exception(
+                "Process workers require a database or file target storage, "
+                f"got {self.ctx.target_storage}"
             )
-            return db.as_managed_data_block(run_ctx, output_session)
-        return None
+
+    def build_block_pipes(self, nodes: List[Node], buffer_size: int = 8) -> BlockPipes:
+        node_keys = set(n.key for n in nodes)
+        pipes = {}
+        for node in nodes:
+            interface = node.get_interface().connect(node.declared_inputs)
+            for input in interface.inputs:
+                if (
+                    not input.declared_input.stream
+                    or input.declared_input.reference
+                    or input.declared_input.from_self
+                    or input.input_stream_builder is None
+                ):
+                    continue
+                upstream_keys = (
+                    set(input.input_stream_builder.source_node_keys()) & node_keys
+                ) - {node.key}
+                if upstream_keys:
+                    pipes[(node.key, input.name)] = BlockPipe(
+                        upstream_keys, buffer_size=buffer_size
+                    )
+        return BlockPipes(pipes)
 
     def _execute(self, node: Node, worker: Worker) -> ExecutionResult:
         snap = node.snap
@@ -576,6 +956,27 @@ class ExecutionManager:
         self.ctx.logger("\n")
 
 
+def run_node_in_process(
+    ctx: RunContext, node_key: str, to_exhaustion: bool = False
+) -> Optional[str]:
+    """
+    Process pool entrypoint. Runs with its own local memory storage, the other
+    processes' memory storages are not reachable from here.
+    """
+    local_python_storage = new_local_python_storage()
+    ctx = ctx.clone(
+        local_python_storage=local_python_storage,
+        storages=[local_python_storage]
+        + [
+            s
+            for s in ctx.storages
+            if not issubclass(s.storage_engine.storage_class, PythonStorageClass)
+        ],
+    )
+    em = ExecutionManager(ctx)
+    return em.run_node(ctx.graph.get_node(node_key), to_exhaustion=to_exhaustion)
+
+
 def ensure_alias(sess: Session, node: Node, sdb: StoredDataBlockMetadata) -> Alias:
     logger.debug(
         f"Creating alias {node.get_alias()} for node {node.key} on storage {sdb.storage_url}"
@@ -589,6 +990,11 @@ class Worker:
         self.ctx = ctx
 
     def execute(self, executable: Executable) -> ExecutionResult:
+        # Cursors / streams the run left unconsumed still hold db connections
+        with closing_local_records():
+            return self._execute(executable)
+
+    def _execute(self, executable: Executable) -> ExecutionResult:
         node = self.ctx.graph.get_node(executable.node_key)
         result = ExecutionResult.empty()
         with self.ctx.start_snap_run(node) as execution_session:
@@ -617,9 +1023,21 @@ class Worker:
                 executable, execution_session, output_obj, snap_ctx
             ):
                 result = res
+            self.advance_input_watermarks(executable, execution_session)
         logger.debug(f"EXECUTION RESULT {result}")
         return result
 
+    def advance_input_watermarks(
+        self, executable: Executable, execution_session: ExecutionSession
+    ):
+        # Input logs must be written first, the watermark only passes processed blocks
+        execution_session.flush()
+        for input in executable.bound_interface.non_reference_bound_inputs():
+            if isinstance(input.bound_stream, ManagedDataBlockStream):
+                input.bound_stream.stream_builder.advance_watermark(
+                    self.ctx, execution_session.metadata_session
+                )
+
     def process_execution_result(
         self,
         executable: Executable,
@@ -654,7 +1072,7 @@ class Worker:
     ) -> ExecutionResult:
         last_output_block: Optional[DataBlockMetadata] = None
         last_output_sdb: Optional[StoredDataBlockMetadata] = None
-        last_output_alias: Optional[Alias] = None
+        last_output_alias: Optional[str] = None
 
         # Flush
         # execution_session.metadata_session.flush()
@@ -662,9 +1080,7 @@ class Worker:
         if snap_ctx.outputs:
             last_output_sdb = snap_ctx.outputs[-1]
             last_output_block = last_output_sdb.data_block
-            last_output_alias = last_output_sdb.get_alias(
-                execution_session.metadata_session
-            )
+            last_output_alias = execution_session.get_alias(last_output_sdb)
 
         input_block_counts = {}
         total_input_count = 0
@@ -682,9 +1098,7 @@ class Worker:
             output_stored_block_id=last_output_sdb.id
             if last_output_sdb is not None
             else None,
-            output_alias=last_output_alias.alias
-            if last_output_alias is not None
-            else None,
+            output_alias=last_output_alias,
             output_block_count=len(snap_ctx.outputs),
             output_blocks_record_count=sum(
                 [
@@ -21,6 +21,7 @@ from snapflow.core.node import DeclaredNode, Node, NodeLike, node
 from snapflow.core.snap import SnapLike
 from snapflow.utils.common import md5_hash, remove_dupes
 from sqlalchemy import Column, String
+from sqlalchemy.orm import Session
 from sqlalchemy.sql.sqltypes import JSON
 
 if TYPE_CHECKING:
@@ -136,6 +137,15 @@ class Graph:
         adjacency = self.adjacency_list()
         return GraphMetadata(hash=hash_adjacency(adjacency), adjacency=adjacency)
 
+    def ensure_metadata_obj(self, sess: Session) -> GraphMetadata:
+        new_graph_meta = self.get_metadata_obj()
+        graph_meta = sess.query(GraphMetadata).get(new_graph_meta.hash)
+        if graph_meta is None:
+            sess.add(new_graph_meta)
+            sess.flush([new_graph_meta])
+            graph_meta = new_graph_meta
+        return graph_meta
+
     # TODO: duplicated code
     def node(
         self,
@@ -237,3 +247,17 @@ class Graph:
     def get_all_nodes_in_execution_order(self) -> List[Node]:
         g = self.as_nx_graph()
         return [self.get_node(name) for name in nx.topological_sort(g)]
+
+    def get_upstream_dependency_keys(
+        self, nodes: Iterable[Node]
+    ) -> Dict[str, Set[str]]:
+        """
+        Maps each given node to the keys of its direct upstream nodes, restricted
+        to the given set of nodes (self-ref cycles are ignored).
+        """
+        g = self.as_nx_graph()
+        node_keys = set(n.key for n in nodes)
+        return {
+            key: set(p for p in g.predecessors(key) if p in node_keys and p != key)
+            for key in node_keys
+        }
@@ -17,7 +17,7 @@ from snapflow.utils.common import as_identifier
 from sqlalchemy.orm import Session, relationship
 from sqlalchemy.orm.relationships import RelationshipProperty
 from sqlalchemy.sql.functions import func
-from sqlalchemy.sql.schema import Column, ForeignKey
+from sqlalchemy.sql.schema import Column, ForeignKey, Index
 from sqlalchemy.sql.sqltypes import JSON, Boolean, DateTime, Enum, Integer, String
 
 if TYPE_CHECKING:
@@ -268,6 +268,7 @@ class Node:
         """
         self._reset_state(sess)
         self._invalidate_output_datablocks(sess)
+        reset_input_watermarks(sess, self.key)
 
 
 class NodeState(BaseModel):
@@ -288,7 +289,61 @@ def get_state(sess: Session, node_key: str) -> Optional[Dict]:
     return None
 
 
+class NodeInputWatermark(BaseModel):
+    """
+    Consumption cursor for a node's (non-reference) stream input: every block
+    eligible for the input with an id at or below `data_block_id` has been processed
+    by the node, so finding unprocessed blocks only needs to look above it. Only
+    valid for the upstream it was set for (`upstream_key`, see
+    `StreamBuilder.upstream_key`): if the input is rewired it no longer applies.
+    """
+
+    node_key = Column(String(128), primary_key=True)
+    input_name = Column(String(128), primary_key=True)
+    upstream_key = Column(String(128), nullable=False)
+    data_block_id = Column(String(128), nullable=False)
+
+    def __repr__(self):
+        return self._repr(
+            node_key=self.node_key,
+            input_name=self.input_name,
+            upstream_key=self.upstream_key,
+            data_block_id=self.data_block_id,
+        )
+
+
+def get_input_watermark(
+    sess: Session, node_key: str, input_name: str, upstream_key: str
+) -> Optional[str]:
+    wm = sess.query(NodeInputWatermark).get((node_key, input_name))
+    if wm is None or wm.upstream_key != upstream_key:
+        return None
+    return wm.data_block_id
+
+
+def set_input_watermark(
+    sess: Session, node_key: str, input_name: str, upstream_key: str, data_block_id: str
+) -> NodeInputWatermark:
+    wm = sess.query(NodeInputWatermark).get((node_key, input_name))
+    if wm is None:
+        wm = NodeInputWatermark(node_key=node_key, input_name=input_name)
+        sess.add(wm)
+    wm.upstream_key = upstream_key
+    wm.data_block_id = data_block_id
+    return wm
+
+
+def reset_input_watermarks(sess: Session, node_key: str):
+    sess.query(NodeInputWatermark).filter(
+        NodeInputWatermark.node_key == node_key
+    ).delete(synchronize_session=False)
+
+
 class SnapLog(BaseModel):
+    __table_args__ = (
+        # Stream filters select a node's snap logs to join to their DataBlockLogs
+        Index(f"ix{SNAPFLOW_METADATA_TABLE_PREFIX}snap_log_node_key", "node_key", "id"),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     graph_id = Column(
         String(128),
@@ -364,6 +419,21 @@ class Direction(enum.Enum):
 
 
 class DataBlockLog(BaseModel):
+    __table_args__ = (
+        # Covers the stream filters: snap log join, direction / invalidated filters,
+        # and the selected data_block_id
+        Index(
+            f"ix{SNAPFLOW_METADATA_TABLE_PREFIX}data_block_log_snap_log",
+            "snap_log_id",
+            "direction",
+            "invalidated",
+            "data_block_id",
+        ),
+        Index(
+            f"ix{SNAPFLOW_METADATA_TABLE_PREFIX}data_block_log_data_block",
+            "data_block_id",
+        ),
+    )
     id = Column(Integer, primary_key=True, autoincrement=True)
     snap_log_id = Column(Integer, ForeignKey(SnapLog.id), nullable=False)
     data_block_id = Column(
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import inspect
 from dataclasses import asdict, dataclass, field
-from functools import partial
+from functools import partial, reduce
+from importlib import import_module
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, Union, cast
 
 from pandas import DataFrame
@@ -77,6 +78,39 @@ class Parameter:
     help: str = ""
 
 
+@dataclass(frozen=True)
+class SnapCallableRef:
+    """
+    Importable reference to a decorated snap's callable. The decorated module
+    attribute is the _Snap, not the function, so the function can't be pickled as is.
+    """
+
+    module_name: str
+    qualname: str
+
+    def resolve(self) -> SnapCallable:
+        obj = reduce(getattr, self.qualname.split("."), import_module(self.module_name))
+        if isinstance(obj, _Snap):
+            return obj.snap_callable
+        return obj
+
+
+def as_snap_callable_ref(snap: _Snap) -> Optional[SnapCallableRef]:
+    fn = snap.snap_callable
+    module_name = getattr(fn, "__module__", None)
+    qualname = getattr(fn, "__qualname__", None)
+    if not module_name or not qualname or "<locals>" in qualname:
+        return None
+    try:
+        ref = SnapCallableRef(module_name, qualname)
+        obj = reduce(getattr, qualname.split("."), import_module(module_name))
+    except (ImportError, AttributeError):
+        return None
+    if isinstance(obj, _Snap) and obj.snap_callable is fn:
+        return ref
+    return None
+
+
 @dataclass  # (frozen=True)
 class _Snap:
     # Underscored so the decorator API can use `Snap`. TODO: Is there a better way / name?
@@ -107,6 +141,18 @@ class _Snap:
     ) -> Optional[DataInterfaceType]:
         return self.snap_callable(*args, **kwargs)
 
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        ref = as_snap_callable_ref(self)
+        if ref is not None:
+            state["snap_callable"] = ref
+        return state
+
+    def __setstate__(self, state: Dict):
+        if isinstance(state["snap_callable"], SnapCallableRef):
+            state["snap_callable"] = state["snap_callable"].resolve()
+        self.__dict__.update(state)
+
     def get_interface(self) -> DeclaredSnapInterface:
         """"""
         found_signature_interface = self._get_snap_interface()
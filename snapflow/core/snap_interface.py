@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 import re
 from dataclasses import asdict, dataclass, field
+from functools import partial
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 from loguru import logger
@@ -29,6 +30,7 @@ if TYPE_CHECKING:
     from snapflow.storage.storage import Storage
     from snapflow.core.execution import RunContext
     from snapflow.core.streams import (
+        BlockPipe,
         StreamBuilder,
         InputStreams,
         DataBlockStream,
@@ -578,7 +580,8 @@ class NodeInterfaceManager:
 
             In other words, if ANY block stream is empty, bail out. If ALL DS streams are empty, bail
             """
-            if stream_builder.get_count(self.ctx, self.sess) == 0:
+            pipe = self.get_input_pipe(input)
+            if pipe is None and not stream_builder.has_any(self.ctx, self.sess):
                 logger.debug(
                     f"Couldnt find eligible DataBlocks for input `{input.name}` from {stream_builder}"
                 )
@@ -599,6 +602,7 @@ class NodeInterfaceManager:
                     self.sess,
                     declared_schema=declared_schema,
                     declared_schema_translation=input.declared_schema_translation,
+                    pipe=pipe,
                 )
             any_unprocessed = True
 
@@ -609,19 +613,32 @@ class NodeInterfaceManager:
 
         return input_streams
 
+    def get_input_pipe(self, input: NodeInput) -> Optional[BlockPipe]:
+        # Only pipelined runs have pipes, and only for (non-reference) Stream inputs
+        if self.ctx.block_pipes is None:
+            return None
+        pipe = self.ctx.block_pipes.get_input_pipe(self.node.key, input.name)
+        if pipe is None or pipe.is_exhausted():
+            return None
+        return pipe
+
     def _filter_stream(
         self,
         stream_builder: StreamBuilder,
         input: NodeInput,
         storages: List[Storage] = None,
     ) -> StreamBuilder:
-        logger.debug(
-            f"{stream_builder.get_count(self.ctx, self.sess)} available DataBlocks"
+        # Counts are full queries, only run them if debug logging is actually on
+        logger.opt(lazy=True).debug(
+            "{} available DataBlocks",
+            partial(stream_builder.get_count, self.ctx, self.sess),
         )
         if storages:
             stream_builder = stream_builder.filter_storages(storages)
-            logger.debug(
-                f"{stream_builder.get_count(self.ctx, self.sess)} available DataBlocks in storages {storages}"
+            logger.opt(lazy=True).debug(
+                "{} available DataBlocks in storages {}",
+                partial(stream_builder.get_count, self.ctx, self.sess),
+                lambda: storages,
             )
         if input.declared_input.reference:
             logger.debug("Reference input, taking latest")
@@ -629,9 +646,29 @@ class NodeInterfaceManager:
         else:
             logger.debug(f"Finding unprocessed input for: {stream_builder}")
             stream_builder = stream_builder.filter_unprocessed(
-                self.node, allow_cycle=input.declared_input.from_self
+                self.node,
+                allow_cycle=input.declared_input.from_self,
+                input_name=input.name,
             )
-            logger.debug(
-                f"{stream_builder.get_count(self.ctx, self.sess)} unprocessed DataBlocks"
+            logger.opt(lazy=True).debug(
+                "{} unprocessed DataBlocks",
+                partial(stream_builder.get_count, self.ctx, self.sess),
             )
         return stream_builder
+
+    def get_input_block_counts(self) -> Dict[str, int]:
+        """
+        Number of eligible blocks for each bound input. Runs a full count query per
+        input, so for explain / stats use only, binding itself doesn't need it.
+        """
+        counts = {}
+        for input in self.get_connected_interface().inputs:
+            if input.input_stream_builder is None:
+                continue
+            stream_builder = self._filter_stream(
+                input.input_stream_builder,
+                input,
+                self.ctx.all_storages if self.strict_storages else None,
+            )
+            counts[input.name] = stream_builder.get_count(self.ctx, self.sess)
+        return counts
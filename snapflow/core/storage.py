@@ -11,9 +11,11 @@ from snapflow.core.data_block import (
 from snapflow.core.environment import Environment
 from snapflow.storage.data_copy.base import (
     Conversion,
+    ConversionEdge,
     ConversionPath,
     StorageFormat,
     get_datacopy_lookup,
+    record_count_bucket,
 )
 from snapflow.storage.data_formats import DataFormat
 from snapflow.storage.storage import LocalPythonStorageEngine, Storage
@@ -39,7 +41,9 @@ def copy_lowest_cost(
     if eligible_storages is None:
         eligible_storages = env.storages
     target_storage_format = StorageFormat(target_storage.storage_engine, target_format)
-    cp = get_copy_path_for_sdb(sdb, target_storage_format, eligible_storages)
+    cp = get_copy_path_for_sdb(
+        sdb, target_storage_format, eligible_storages, target_storage
+    )
     if cp is None:
         raise CopyPathDoesNotExist(
             f"Copying {sdb} to format {target_format} on storage {target_storage}"
@@ -55,19 +59,32 @@ def copy_lowest_cost(
 
 
 def get_copy_path_for_sdb(
-    sdb: StoredDataBlockMetadata, target_format: StorageFormat, storages: List[Storage]
+    sdb: StoredDataBlockMetadata,
+    target_format: StorageFormat,
+    storages: List[Storage],
+    target_storage: Optional[Storage] = None,
 ) -> Optional[ConversionPath]:
     source_format = StorageFormat(sdb.storage.storage_engine, sdb.data_format)
-    if source_format == target_format:
-        # Already exists, do nothing
-        return ConversionPath()
     conversion = Conversion(source_format, target_format)
-    conversion_path = get_datacopy_lookup(
+    # Cost paths for this block's actual size (when known)
+    lookup = get_datacopy_lookup(
         available_storage_engines=set(s.storage_engine for s in storages),
-    ).get_lowest_cost_path(
-        conversion,
+        expected_record_count=record_count_bucket(sdb.data_block.record_count),
     )
-    return conversion_path
+    if source_format == target_format:
+        if target_storage is None or sdb.storage_url == target_storage.url:
+            # Already exists, do nothing
+            return ConversionPath()
+        # Same engine and format on another storage (eg another database), only a
+        # direct copy will do
+        copier = lookup.get_lowest_cost(conversion)
+        if copier is None:
+            return None
+        return ConversionPath(
+            conversions=[ConversionEdge(copier=copier, conversion=conversion)],
+            expected_record_count=lookup.expected_record_count,
+        )
+    return lookup.get_lowest_cost_path(conversion)
 
 
 def convert_sdb(
@@ -176,7 +193,7 @@ def ensure_data_block_on_storage(
     existing_sdbs = list(existing_sdbs)
     for sdb in existing_sdbs:
         conversion_path = get_copy_path_for_sdb(
-            sdb, target_storage_format, eligible_storages
+            sdb, target_storage_format, eligible_storages, storage
         )
         if conversion_path is not None:
             eligible_conversion_paths.append(
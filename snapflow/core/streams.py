@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import json
+import queue
+import threading
+from collections import deque
 from dataclasses import asdict, dataclass, field
+from datetime import timedelta
 from typing import (
     TYPE_CHECKING,
     Any,
+    Deque,
     Dict,
     Generator,
     Iterable,
@@ -11,6 +17,7 @@ from typing import (
     List,
     Optional,
     Set,
+    Tuple,
     Union,
 )
 
@@ -29,12 +36,14 @@ from snapflow.core.node import (
     Node,
     NodeLike,
     SnapLog,
+    get_input_watermark,
+    set_input_watermark,
 )
 from snapflow.core.snap_interface import get_schema_translation
 from snapflow.schema.base import Schema, SchemaLike, SchemaTranslation
 from snapflow.storage.storage import Storage
-from snapflow.utils.common import ensure_list
-from sqlalchemy import and_, not_
+from snapflow.utils.common import ensure_list, ensure_utc, md5_hash, utcnow
+from sqlalchemy import and_, func, not_
 from sqlalchemy.orm import Query
 from sqlalchemy.orm.session import Session
 
@@ -79,6 +88,8 @@ class StreamBuilderSerializable:
     storage_urls: List[str] = field(default_factory=list)
     operators: List[BoundOperator] = field(default_factory=list)
     unprocessed_by_node_key: Optional[str] = None
+    # Input of `unprocessed_by_node_key` this stream feeds, to use its watermark
+    unprocessed_by_input_name: Optional[str] = None
     data_block_id: Optional[str] = None
     allow_cycle: bool = False
 
@@ -165,13 +176,109 @@ class StreamBuilder:
         return self._filters.node_keys
 
     def filter_unprocessed(
-        self, unprocessed_by: Node, allow_cycle=False
+        self, unprocessed_by: Node, allow_cycle=False, input_name: Optional[str] = None
     ) -> StreamBuilder:
         return self.clone(
             unprocessed_by_node_key=unprocessed_by.key,
+            unprocessed_by_input_name=input_name,
             allow_cycle=allow_cycle,
         )
 
+    def upstream_key(self) -> str:
+        # The filters deciding which blocks are eligible, a watermark set for one
+        # upstream says nothing about another's blocks
+        return md5_hash(
+            json.dumps(
+                [
+                    sorted(self._filters.node_keys or []),
+                    sorted(self._filters.schema_keys or []),
+                    sorted(self._filters.storage_urls or []),
+                    self._filters.data_block_id,
+                    self._filters.allow_cycle,
+                ]
+            )
+        )
+
+    def get_watermark(self, sess: Session) -> Optional[str]:
+        if (
+            not self._filters.unprocessed_by_node_key
+            or not self._filters.unprocessed_by_input_name
+        ):
+            return None
+        return get_input_watermark(
+            sess,
+            self._filters.unprocessed_by_node_key,
+            self._filters.unprocessed_by_input_name,
+            self.upstream_key(),
+        )
+
+    def advance_watermark(self, ctx: RunContext, sess: Session) -> Optional[str]:
+        """
+        Move the consuming input's watermark up to the newest eligible block that has
+        no unprocessed eligible block before it. Called at the end of a node's run,
+        once its input logs are flushed, so it commits with them.
+
+        Blocks get their ids (prefixed with their creation second) when created but
+        only become visible when their run commits, so the watermark is also held
+        below the start of any still running snap on the stream's source nodes (runs
+        commit their SnapLog as they start, see `RunContext.start_snap_run`) and
+        below the current second: a block from a run in progress or about to start
+        could otherwise commit below the watermark and never be seen. This relies
+        on block ids coming from one clock (eg one machine), counters within a
+        second are only ordered per process. Runs unfinished for longer than the
+        SNAP_RUN_STALE_SECONDS setting are taken to be abandoned (eg their process
+        died) and no longer hold the watermark back.
+        """
+        if (
+            not self._filters.unprocessed_by_node_key
+            or not self._filters.unprocessed_by_input_name
+        ):
+            return None
+        # Taken before looking for running snaps, any run not found below starts later
+        now = utcnow()
+        watermark = self.get_watermark(sess)
+        first_unprocessed = (
+            self.get_query(ctx, sess)
+            .order_by(None)
+            .with_entities(func.min(DataBlockMetadata.id))
+            .scalar()
+        )
+        eligible = (
+            self.clone(unprocessed_by_node_key=None, unprocessed_by_input_name=None)
+            .get_query(ctx, sess)
+            .order_by(None)
+        )
+        if watermark is not None:
+            eligible = eligible.filter(DataBlockMetadata.id > watermark)
+        if first_unprocessed is not None:
+            eligible = eligible.filter(DataBlockMetadata.id < first_unprocessed)
+        running = sess.query(func.min(SnapLog.started_at)).filter(
+            SnapLog.completed_at.is_(None), SnapLog.started_at.isnot(None)
+        )
+        stale_seconds = ctx.env.settings.SNAP_RUN_STALE_SECONDS
+        if stale_seconds is not None:
+            running = running.filter(
+                SnapLog.started_at > now - timedelta(seconds=stale_seconds)
+            )
+        if self._filters.node_keys:
+            running = running.filter(SnapLog.node_key.in_(self._filters.node_keys))
+        oldest_running_start = running.scalar()
+        if oldest_running_start is not None:
+            now = min(now, ensure_utc(oldest_running_start))
+        # Block ids are prefixed with their creation time (see `timestamp_increment_key`)
+        eligible = eligible.filter(DataBlockMetadata.id < now.strftime("%y%m%d%H%M%S"))
+        new_watermark = eligible.with_entities(func.max(DataBlockMetadata.id)).scalar()
+        if new_watermark is None:
+            return watermark
+        set_input_watermark(
+            sess,
+            self._filters.unprocessed_by_node_key,
+            self._filters.unprocessed_by_input_name,
+            self.upstream_key(),
+            new_watermark,
+        )
+        return new_watermark
+
     def _filter_unprocessed(
         self,
         ctx: RunContext,
@@ -195,9 +302,18 @@ class StreamBuilder:
             .join(SnapLog)
             .filter(filter_clause)
             .filter(DataBlockLog.invalidated == False)  # noqa
-            .distinct()
         )
-        return query.filter(not_(DataBlockMetadata.id.in_(already_processed_drs)))
+        watermark = self.get_watermark(sess)
+        if watermark is not None:
+            # Everything eligible at or below the watermark is processed, so only
+            # scan blocks (and processed logs) above it
+            query = query.filter(DataBlockMetadata.id > watermark)
+            already_processed_drs = already_processed_drs.filter(
+                DataBlockLog.data_block_id > watermark
+            )
+        return query.filter(
+            not_(DataBlockMetadata.id.in_(already_processed_drs.distinct()))
+        )
 
     def get_inputs(self, g: Graph) -> List[Node]:
         return [g.get_node(c) for c in self._filters.node_keys]
@@ -279,9 +395,13 @@ class StreamBuilder:
         block: DataBlockMetadata,
         node: Node,
     ) -> bool:
-        blocks = self.filter_unprocessed(node)
-        q = blocks.get_query(ctx, sess)
-        return q.filter(DataBlockMetadata.id == block.id).count() > 0
+        blocks = self.filter_unprocessed(node).filter_data_block(block)
+        return blocks.has_any(ctx, sess)
+
+    def has_any(self, ctx: RunContext, sess: Session) -> bool:
+        # EXISTS probe, stops at the first matching block (unlike a full count)
+        q = self.get_query(ctx, sess).order_by(None)
+        return sess.query(q.exists()).scalar()
 
     def get_count(self, ctx: RunContext, sess: Session) -> int:
         return self.get_query(ctx, sess).count()
@@ -295,6 +415,7 @@ class StreamBuilder:
         sess: Session,
         declared_schema: Optional[Schema] = None,
         declared_schema_translation: Optional[Dict[str, str]] = None,
+        pipe: Optional[BlockPipe] = None,
     ) -> ManagedDataBlockStream:
         return ManagedDataBlockStream(
             ctx,
@@ -302,6 +423,7 @@ class StreamBuilder:
             self,
             declared_schema=declared_schema,
             declared_schema_translation=declared_schema_translation,
+            pipe=pipe,
         )
 
 
@@ -324,7 +446,87 @@ def block_as_stream(
     )
 
 
+class BlockPipe:
+    """
+    Bounded hand-off of (committed) DataBlock ids from one or more upstream nodes
+    to a downstream Stream input, for pipelined runs. Upstream `put`s block until
+    there is room in the buffer, downstream iterates until every upstream node has
+    closed the pipe. Cancelling (downstream done, or run failed) unblocks both ends.
+    """
+
+    def __init__(self, upstream_node_keys: Iterable[str], buffer_size: int = 8):
+        self.upstream_node_keys = frozenset(upstream_node_keys)
+        self._open_upstream_node_keys = set(upstream_node_keys)
+        self._queue: queue.Queue = queue.Queue(maxsize=buffer_size)
+        self._cancelled = threading.Event()
+
+    def is_exhausted(self) -> bool:
+        return self._cancelled.is_set() or not self._open_upstream_node_keys
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def _put(self, item: Tuple[str, Optional[str]]):
+        while not self._cancelled.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def put(self, node_key: str, data_block_id: str):
+        self._put((node_key, data_block_id))
+
+    def close(self, node_key: str):
+        self._put((node_key, None))
+
+    def __iter__(self) -> Iterator[str]:
+        while not self.is_exhausted():
+            try:
+                node_key, data_block_id = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if data_block_id is None:
+                self._open_upstream_node_keys.discard(node_key)
+            else:
+                yield data_block_id
+
+
+@dataclass(frozen=True)
+class BlockPipes:
+    # Keyed on (downstream node key, input name)
+    pipes: Dict[Tuple[str, str], BlockPipe] = field(default_factory=dict)
+
+    def get_input_pipe(self, node_key: str, input_name: str) -> Optional[BlockPipe]:
+        return self.pipes.get((node_key, input_name))
+
+    def publish(self, node_key: str, data_block_id: str):
+        for pipe in self.pipes.values():
+            if node_key in pipe.upstream_node_keys:
+                pipe.put(node_key, data_block_id)
+
+    def close(self, node_key: str):
+        for pipe in self.pipes.values():
+            if node_key in pipe.upstream_node_keys:
+                pipe.close(node_key)
+
+    def cancel_inputs(self, node_key: str):
+        for (downstream_key, _), pipe in self.pipes.items():
+            if downstream_key == node_key:
+                pipe.cancel()
+
+    def cancel_all(self):
+        for pipe in self.pipes.values():
+            pipe.cancel()
+
+
 class ManagedDataBlockStream:
+    """
+    Lazy stream of a StreamBuilder's blocks. Block metadata is read in pages of
+    `page_size` (keyset paging on block id, up to the newest block at creation
+    time), and managed blocks are only built as the stream is consumed.
+    """
+
     def __init__(
         self,
         ctx: RunContext,
@@ -332,42 +534,120 @@ class ManagedDataBlockStream:
         stream_builder: StreamBuilder,
         declared_schema: Optional[Schema] = None,
         declared_schema_translation: Optional[Dict[str, str]] = None,
+        pipe: Optional[BlockPipe] = None,
+        page_size: int = 1000,
     ):
         self.ctx = ctx
         self.sess = sess
         self.declared_schema = declared_schema
         self.declared_schema_translation = declared_schema_translation
-        self._blocks: List[DataBlock] = list(self._build_stream(stream_builder))
-        self._stream: Iterator[DataBlock] = self.log_emitted(self._blocks)
+        self.pipe = pipe
+        self.stream_builder = stream_builder
+        self.page_size = page_size
         self._emitted_blocks: List[DataBlockMetadata] = []
         self._emitted_managed_blocks: List[DataBlock] = []
+        # Blocks pulled from the source ahead of consumption (by `all_blocks`)
+        self._lookahead: Deque[DataBlock] = deque()
+        self._schema_translations: Dict[str, Optional[SchemaTranslation]] = {}
+        self._max_block_id = self._get_max_block_id(stream_builder)
+        self._source = self._build_stream(stream_builder)
+        self._stream: Iterator[DataBlock] = self.log_emitted(self._next_blocks())
+
+    def _get_max_block_id(self, stream_builder: StreamBuilder) -> Optional[str]:
+        # Cap on the stream, so blocks created while it is consumed (eg a self
+        # referencing snap's own output) aren't picked up by later pages
+        return (
+            stream_builder.get_query(self.ctx, self.sess)
+            .order_by(None)
+            .with_entities(func.max(DataBlockMetadata.id))
+            .scalar()
+        )
+
+    def _paged_query(
+        self, stream_builder: StreamBuilder
+    ) -> Iterator[DataBlockMetadata]:
+        if self._max_block_id is None:
+            return
+        last_id: Optional[str] = None
+        while True:
+            q = stream_builder.get_query(self.ctx, self.sess).filter(
+                DataBlockMetadata.id <= self._max_block_id
+            )
+            if last_id is not None:
+                q = q.filter(DataBlockMetadata.id > last_id)
+            page = q.limit(self.page_size).all()
+            if not page:
+                return
+            for db in page:
+                yield db
+            last_id = page[-1].id
 
     def _build_stream(self, stream_builder: StreamBuilder) -> Iterator[DataBlock]:
-        query = stream_builder.get_query(self.ctx, self.sess)
-        stream = (b for b in query)
+        stream = self._paged_query(stream_builder)
+        if self.pipe is not None:
+            stream = self._with_piped_blocks(stream_builder, stream)
         stream = self.as_managed_block(stream)
         for op in stream_builder.get_operators():
             stream = op.op_callable(stream, **op.kwargs)
         return stream
 
+    def _next_blocks(self) -> Iterator[DataBlock]:
+        while True:
+            if self._lookahead:
+                yield self._lookahead.popleft()
+                continue
+            try:
+                yield next(self._source)
+            except StopIteration:
+                return
+
+    def _with_piped_blocks(
+        self, stream_builder: StreamBuilder, stream: Iterator[DataBlockMetadata]
+    ) -> Iterator[DataBlockMetadata]:
+        assert self.pipe is not None
+        seen: Set[str] = set()
+        for db in stream:
+            seen.add(db.id)
+            yield db
+        for data_block_id in self.pipe:
+            if data_block_id in seen:
+                continue
+            seen.add(data_block_id)
+            # Block must still pass all of this stream's filters
+            db = (
+                stream_builder.filter_data_block(data_block_id)
+                .get_query(self.ctx, self.sess)
+                .first()
+            )
+            if db is not None:
+                yield db
+
     def __iter__(self) -> Iterator[DataBlock]:
         return self._stream
 
     def __next__(self) -> DataBlock:
         return next(self._stream)
 
+    def get_schema_translation(
+        self, db: DataBlockMetadata
+    ) -> Optional[SchemaTranslation]:
+        # Same for every block with a given nominal schema, so resolve once each
+        if db.nominal_schema_key not in self._schema_translations:
+            self._schema_translations[db.nominal_schema_key] = get_schema_translation(
+                self.ctx.env,
+                self.sess,
+                source_schema=db.nominal_schema(self.ctx.env, self.sess),
+                target_schema=self.declared_schema,
+                declared_schema_translation=self.declared_schema_translation,
+            )
+        return self._schema_translations[db.nominal_schema_key]
+
     def as_managed_block(
         self, stream: Iterator[DataBlockMetadata]
     ) -> Iterator[DataBlock]:
         for db in stream:
             if db.nominal_schema_key:
-                schema_translation = get_schema_translation(
-                    self.ctx.env,
-                    self.sess,
-                    source_schema=db.nominal_schema(self.ctx.env, self.sess),
-                    target_schema=self.declared_schema,
-                    declared_schema_translation=self.declared_schema_translation,
-                )
+                schema_translation = self.get_schema_translation(db)
             else:
                 schema_translation = None
             mdb = db.as_managed_data_block(
@@ -377,10 +657,26 @@ class ManagedDataBlockStream:
 
     @property
     def all_blocks(self) -> List[DataBlock]:
-        return self._blocks
+        # Reads in the rest of the stream. For piped streams, only the blocks
+        # received so far
+        if self.pipe is None:
+            self._lookahead.extend(self._source)
+        return self._emitted_managed_blocks + list(self._lookahead)
 
     def count(self) -> int:
-        return len(self._blocks)
+        if self.pipe is None and not self.stream_builder.get_operators():
+            # Count without reading blocks in (operators can drop or add blocks, so
+            # not with those). Blocks come in id order: the emitted blocks plus the
+            # ones after the last emitted.
+            if self._max_block_id is None:
+                return 0
+            q = self.stream_builder.get_query(self.ctx, self.sess).filter(
+                DataBlockMetadata.id <= self._max_block_id
+            )
+            if self._emitted_blocks:
+                q = q.filter(DataBlockMetadata.id > self._emitted_blocks[-1].id)
+            return len(self._emitted_blocks) + q.count()
+        return len(self.all_blocks)
 
     def log_emitted(self, stream: Iterator[DataBlock]) -> Iterator[DataBlock]:
         for mdb in stream:
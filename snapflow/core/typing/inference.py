@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+import re
 import traceback
+import warnings
 from collections.abc import Iterable
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 from dateutil.parser import ParserError
 from loguru import logger
@@ -19,14 +22,22 @@ from snapflow.schema.base import (
     create_quick_field,
     create_quick_schema,
 )
-from snapflow.schema.casting import cast_python_object_to_field_type
+from snapflow.schema.casting import (
+    CastToSchemaLevel,
+    SchemaTypeError,
+    get_records_cast_plan,
+)
+from snapflow.schema.field_types import FieldType
 from snapflow.schema.inference import (
+    fields_from_arrow_schema,
     fields_from_sqlalchemy_table,
     infer_field_types_from_records,
+    infer_fields_from_dataframe,
     infer_fields_from_records,
     pandas_series_to_field_type,
 )
 from snapflow.storage.data_formats import Records
+from snapflow.utils.arrow import pa
 from snapflow.utils.common import (
     ensure_bool,
     ensure_date,
@@ -39,6 +50,14 @@ from snapflow.utils.common import (
 from snapflow.utils.data import is_nullish, read_json, records_as_dict_of_lists
 from sqlalchemy import Table
 
+try:
+    from pandas._libs.tslibs.parsing import guess_datetime_format
+except ImportError:
+    # pandas < 1.3
+    from pandas._libs.tslibs.parsing import (
+        _guess_datetime_format as guess_datetime_format,
+    )
+
 if TYPE_CHECKING:
     from snapflow.storage.db.api import DatabaseApi
 
@@ -69,6 +88,16 @@ def generate_auto_schema(fields, **kwargs) -> Schema:
     return Schema(**args)
 
 
+def infer_schema_from_dataframe(df: DataFrame, **kwargs) -> Schema:
+    fields = infer_fields_from_dataframe(df)
+    return generate_auto_schema(fields, **kwargs)
+
+
+def infer_schema_from_arrow_schema(arrow_schema: pa.Schema, **kwargs) -> Schema:
+    fields = fields_from_arrow_schema(arrow_schema)
+    return generate_auto_schema(fields, **kwargs)
+
+
 def create_sa_table(dbapi: DatabaseApi, table_name: str) -> Table:
     sa_table = Table(
         table_name,
@@ -99,46 +128,133 @@ def dict_to_rough_schema(name: str, d: Dict, convert_to_snake_case=True, **kwarg
 
 def conform_records_to_schema(d: Records, schema: Schema) -> Records:
     # TODO: support cast levels
-    conformed = []
-    for r in d:
-        new_record = {}
-        for k, v in r.items():
-            if k in schema.field_names():
-                v = cast_python_object_to_field_type(v, schema.get_field(k).field_type)
-            new_record[k] = v
-        conformed.append(new_record)
-    return conformed
-
-
-def conform_dataframe_to_schema(df: DataFrame, schema: Schema) -> DataFrame:
-    # TODO: support cast levels
+    records = d if isinstance(d, list) else list(d)
+    columns = frozenset().union(*records)
+    plan = get_records_cast_plan(columns, schema)
+    return plan.apply(records)
+
+
+# Datetime formats guessed per value "shape" (digits masked), eg "0000-00-00 00:00"
+_datetime_formats: Dict[str, Optional[str]] = {}
+
+
+def guess_datetime_format_cached(value: str) -> Optional[str]:
+    shape = re.sub(r"\d", "0", value)
+    if shape not in _datetime_formats:
+        _datetime_formats[shape] = guess_datetime_format(value)
+    return _datetime_formats[shape]
+
+
+def coerce_series_to_field_type(s: Series, field_type: FieldType) -> Optional[Series]:
+    """
+    Vectorized conversion of a series to the field type's pandas type, values that
+    don't convert come back null. None if there is no vectorized conversion.
+    """
+    pd_type = field_type.pandas_type
+    if pd_type == "Int64":
+        num = pd.to_numeric(s, errors="coerce")
+        if num.dtype.kind == "f":
+            # Non-integral numbers don't convert either, nor ones too big for a
+            # float to hold exactly (left to the python cast, which parses exactly)
+            num = num.where((num % 1 == 0) & (num.abs() < 2 ** 53))
+        return num.astype("Int64")
+    if pd_type == "float64":
+        return pd.to_numeric(s, errors="coerce").astype("float64")
+    if "datetime" in pd_type:
+        first = s.first_valid_index()
+        fmt = None
+        if first is not None and isinstance(s[first], str):
+            fmt = guess_datetime_format_cached(s[first])
+        dts = pd.to_datetime(s, errors="coerce", format=fmt)
+        if fmt is not None:
+            # Format guessed from the first value only, parse the rest without one
+            failed = s.notna() & dts.isna()
+            if failed.any():
+                try:
+                    dts[failed] = pd.to_datetime(s[failed], errors="coerce")
+                except (TypeError, ValueError, OverflowError):
+                    pass
+        return dts
+    return None
+
+
+def conform_series_to_field_type(
+    s: Series,
+    field_type: FieldType,
+    cast_level: CastToSchemaLevel = CastToSchemaLevel.HARD,
+) -> Series:
+    """
+    Values that don't convert in bulk are cast one by one in python, any still failing
+    are then nulled (SOFT), raise a SchemaTypeError (HARD), or are kept uncast (NONE).
+    """
+    pd_type = field_type.pandas_type
+    if "datetime" not in pd_type:
+        try:
+            return s.astype(pd_type)
+        except (TypeError, ValueError, ParserError):
+            pass
+    try:
+        converted = coerce_series_to_field_type(s, field_type)
+    except (TypeError, ValueError, OverflowError):
+        # Eg mixed timezones
+        converted = None
+    if converted is None:
+        converted = Series([None] * len(s), index=s.index, dtype=object)
+    failed = np.flatnonzero((s.notna() & converted.isna()).to_numpy())
+    if not len(failed):
+        return converted
+    logger.debug(f"Casting {len(failed)} values of {s.name} to {field_type} in python")
+    cast_positions = []
+    cast_values = []
+    uncastable = []
+    for i in failed:
+        try:
+            cast_values.append(field_type.cast(s.iat[i]))
+            cast_positions.append(i)
+        except Exception:
+            uncastable.append(i)
+    if cast_positions:
+        try:
+            converted.iloc[cast_positions] = cast_values
+        except (TypeError, ValueError):
+            converted = converted.astype(object)
+            converted.iloc[cast_positions] = cast_values
+            try:
+                converted = converted.astype(pd_type)
+            except (TypeError, ValueError, OverflowError, ParserError):
+                pass
+    if not uncastable:
+        return converted
+    sample = list(s.iloc[uncastable[:5]])
+    msg = (
+        f"{len(uncastable)} values of {s.name} can't be cast to {field_type}, "
+        f"eg {sample}"
+    )
+    if cast_level == CastToSchemaLevel.HARD:
+        raise SchemaTypeError(msg)
+    if cast_level == CastToSchemaLevel.NONE:
+        converted = converted.astype(object)
+        converted.iloc[uncastable] = s.iloc[uncastable]
+        warnings.warn(f"{msg} (left uncast)")
+    else:
+        warnings.warn(f"{msg} (nulled)")
+    return converted
+
+
+def conform_dataframe_to_schema(
+    df: DataFrame,
+    schema: Schema,
+    cast_level: CastToSchemaLevel = CastToSchemaLevel.HARD,
+) -> DataFrame:
     logger.debug(f"conforming {df.head(5)} to schema {schema}")
     for field in schema.fields:
         pd_type = field.field_type.pandas_type
-        try:
-            if field.name in df:
-                if df[field.name].dtype.name == pd_type:
-                    continue
-                # TODO: `astype` is not aggressive enough (won't cast values), so doesn't work
-                # Likely need combo of "hard" conversion using `to_*` methods and `infer_objects`
-                # and explicit individual python casts if that fails
-                if "datetime" in pd_type:
-                    logger.debug(f"Casting {field.name} to datetime")
-                    df[field.name] = pd.to_datetime(df[field.name])
-                else:
-                    try:
-                        df[field.name] = df[field.name].astype(pd_type)
-                        logger.debug(f"Casting {field.name} to {pd_type}")
-                    except (TypeError, ValueError, ParserError):
-                        logger.debug(
-                            f"Manually casting {field.name} to py objects {field.field_type}"
-                        )
-                        df[field.name] = [
-                            cast_python_object_to_field_type(v, field.field_type)
-                            for v in df[field.name]
-                        ]
-            else:
-                df[field.name] = Series(dtype=pd_type)
-        except Exception as e:
-            raise e
+        if field.name not in df:
+            df[field.name] = Series(dtype=pd_type)
+            continue
+        if df[field.name].dtype.name == pd_type:
+            continue
+        df[field.name] = conform_series_to_field_type(
+            df[field.name], field.field_type, cast_level
+        )
     return df
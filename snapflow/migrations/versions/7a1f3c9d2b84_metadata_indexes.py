@@ -0,0 +1,57 @@
+"""Metadata indexes
+
+Revision ID: 7a1f3c9d2b84
+Revises: 23dd1cc88eb2
+Create Date: 2026-10-16 21:05:12.118034
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7a1f3c9d2b84"
+down_revision = "23dd1cc88eb2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_snapflow_snap_log_node_key",
+        "_snapflow_snap_log",
+        ["node_key", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_snapflow_data_block_log_snap_log",
+        "_snapflow_data_block_log",
+        ["snap_log_id", "direction", "invalidated", "data_block_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_snapflow_data_block_log_data_block",
+        "_snapflow_data_block_log",
+        ["data_block_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_snapflow_stored_data_block_metadata_data_block",
+        "_snapflow_stored_data_block_metadata",
+        ["data_block_id", "storage_url"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_snapflow_stored_data_block_metadata_data_block",
+        table_name="_snapflow_stored_data_block_metadata",
+    )
+    op.drop_index(
+        "ix_snapflow_data_block_log_data_block",
+        table_name="_snapflow_data_block_log",
+    )
+    op.drop_index(
+        "ix_snapflow_data_block_log_snap_log", table_name="_snapflow_data_block_log"
+    )
+    op.drop_index("ix_snapflow_snap_log_node_key", table_name="_snapflow_snap_log")
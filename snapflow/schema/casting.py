@@ -1,22 +1,36 @@
 from __future__ import annotations
 
+import math
 import traceback
 import warnings
 from dataclasses import asdict
 from enum import Enum
 from functools import total_ordering
-from typing import TYPE_CHECKING, Any, Iterable
+from itertools import repeat
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+)
 
 import pandas as pd
 from loguru import logger
 from snapflow.schema.base import Field, Schema, create_quick_field, create_quick_schema
-from snapflow.schema.field_types import FieldType
+from snapflow.schema.field_types import LONG_TEXT, FieldType
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.elements import Cast
 
 if TYPE_CHECKING:
     from snapflow import Environment
 
+NoneType = type(None)
+
 
 @total_ordering
 class CastToSchemaLevel(Enum):
@@ -52,6 +66,144 @@ def cast_python_object_to_field_type(
     raise NotImplementedError
 
 
+# Field types whose `cast` returns a value of exactly `python_type` unchanged
+# (Text is not: it checks length. Float and Decimal are not: NaN casts to None)
+IDENTITY_CAST_FIELD_TYPES = frozenset(
+    ["Boolean", "Integer", "Date", "DateTime", "Time", "LongText", "JSON"]
+)
+MAX_CACHED_CAST_PLANS = 256
+
+
+def python_caster(field_type: FieldType) -> Callable[[Any], Any]:
+    """
+    Same result as `cast_python_object_to_field_type` for one field type, but values
+    already of the field type's python type are passed through without the cast.
+    """
+
+    def cast(obj: Any) -> Any:
+        return cast_python_object_to_field_type(obj, field_type)
+
+    if field_type.name == "Float":
+
+        def cast_float(obj: Any) -> Any:
+            if type(obj) is float:
+                return obj if obj == obj else None  # NaN
+            return cast(obj)
+
+        return cast_float
+    if field_type.name == "Text":
+
+        def cast_text(obj: Any) -> Any:
+            if type(obj) is str and len(obj) < LONG_TEXT:
+                return obj
+            return cast(obj)
+
+        return cast_text
+    if field_type.name not in IDENTITY_CAST_FIELD_TYPES:
+        return cast
+    python_type = field_type.python_type
+
+    def cast_or_pass(obj: Any) -> Any:
+        if obj is None or type(obj) is python_type:
+            return obj
+        return cast(obj)
+
+    return cast_or_pass
+
+
+def python_column_checker(field_type: FieldType) -> Callable[[List[Dict], str], bool]:
+    """
+    Whether a records column would pass through `python_caster` unchanged, checked
+    with a few C-level passes over the column instead of a python call per value.
+    """
+
+    def column(records: List[Dict], name: str) -> Iterator:
+        return map(dict.get, records, repeat(name))
+
+    if field_type.name == "Float":
+
+        def check_float(records: List[Dict], name: str) -> bool:
+            types = set(map(type, column(records, name)))
+            if types == {float}:
+                return not any(map(math.isnan, column(records, name)))
+            return types <= {float, NoneType} and all(
+                v == v for v in column(records, name) if v is not None
+            )
+
+        return check_float
+    if field_type.name == "Text":
+
+        def check_text(records: List[Dict], name: str) -> bool:
+            types = set(map(type, column(records, name)))
+            if types == {str}:
+                return max(map(len, column(records, name))) < LONG_TEXT
+            return types <= {str, NoneType} and all(
+                len(v) < LONG_TEXT for v in column(records, name) if v is not None
+            )
+
+        return check_text
+    if field_type.name not in IDENTITY_CAST_FIELD_TYPES:
+        return lambda records, name: False
+    passthrough_types = {field_type.python_type, NoneType}
+    return lambda records, name: set(map(type, column(records, name))) <= (
+        passthrough_types
+    )
+
+
+class RecordsCastPlan:
+    """
+    Casters for the schema fields present in a set of record columns, built once and
+    applied a column at a time. Columns not in the schema are left as-is, as are
+    columns whose values all already have the field's type. Records are only
+    copied when some column needs casting.
+    """
+
+    def __init__(self, columns: Iterable[str], schema: Schema):
+        columns = set(columns)
+        self.casters: List[
+            Tuple[str, Callable[[Any], Any], Callable[[List[Dict], str], bool]]
+        ] = [
+            (f.name, python_caster(f.field_type), python_column_checker(f.field_type))
+            for f in schema.fields
+            if f.name in columns
+        ]
+
+    def apply(self, records: Iterable[Dict]) -> List[Dict]:
+        records = list(records)
+        to_cast = [
+            (name, cast)
+            for name, cast, is_conformed in self.casters
+            if not is_conformed(records, name)
+        ]
+        if not to_cast:
+            return records
+        conformed = [dict(r) for r in records]
+        for name, cast in to_cast:
+            for r in conformed:
+                if name in r:
+                    r[name] = cast(r[name])
+        return conformed
+
+
+_cast_plans: Dict[Tuple, RecordsCastPlan] = {}
+
+
+def get_records_cast_plan(columns: FrozenSet[str], schema: Schema) -> RecordsCastPlan:
+    # Schemas aren't hashable (list fields), so key on their fields' definitions
+    key = (
+        columns,
+        schema.key,
+        tuple((f.name, f.field_type) for f in schema.fields),
+    )
+    plan = _cast_plans.get(key)
+    if plan is None:
+        if len(_cast_plans) >= MAX_CACHED_CAST_PLANS:
+            _cast_plans.clear()
+        plan = RecordsCastPlan(columns, schema)
+        _cast_plans[key] = plan
+    return plan
+
+
 def is_strict_field_match(f1: Field, f2: Field) -> bool:
     """
     Fields match strictly if names match and field types are exact match (including all parameters)
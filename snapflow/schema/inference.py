@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import decimal
 import traceback
 from datetime import date, datetime, time, timedelta
-from typing import Any, Dict, Iterable, List, Optional, Set, Type
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type
 
 import pandas as pd
 from attr import field
 from loguru import logger
+from pandas import DataFrame
 from pandas.core.series import Series
 from snapflow.schema.base import Field, Schema
 from snapflow.schema.field_types import (
@@ -29,7 +31,8 @@ from snapflow.schema.field_types import (
     ensure_field_type,
 )
 from snapflow.storage.data_formats.records import Records
-from snapflow.utils.data import is_nullish, records_as_dict_of_lists
+from snapflow.utils.arrow import pa
+from snapflow.utils.data import NULL_STRINGS, is_nullish, records_as_dict_of_lists
 from snapflow.utils.registry import ClassBasedEnum, global_registry
 from sqlalchemy.sql.schema import Column, Table
 
@@ -98,14 +101,136 @@ def _detect_field_type_complete(obj: Any) -> Optional[FieldType]:
 detect_field_type = _detect_field_type_fast
 
 
-def select_field_type(objects: Iterable[Any]) -> FieldType:
+# Python types whose values always detect as the same field type (exact type match)
+FIELD_TYPES_BY_PYTHON_TYPE: Dict[type, FieldType] = {
+    bool: Boolean(),
+    int: Integer(),
+    float: Float(),
+    decimal.Decimal: Decimal(),
+    date: Date(),
+    time: Time(),
+    datetime: DateTime(),
+    pd.Timestamp: DateTime(),
+    dict: JSON(),
+    list: JSON(),
+}
+# Strings matching these detect as the given field type. ISO dates and datetimes
+# also have to be valid (checked with `pd.to_datetime`), like `isoparse` requires
+BOOLISH_RE = r"True|true|False|false"
+INTEGER_RE = r"\s*[+-]?[0-9]+\s*"
+FLOAT_RE = r"\s*[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?\s*"
+ISO_DATE_RE = r"[0-9]{4}-[0-9]{2}-[0-9]{2}"
+ISO_DATETIME_RE = (
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}[T ][0-9]{2}:[0-9]{2}(?::[0-9]{2}(?:\.[0-9]{1,6})?)?"
+    r"(?:Z|[+-][0-9]{2}(?::?[0-9]{2})?)?"
+)
+
+
+def has_custom_field_types() -> bool:
+    return bool(set(global_registry.all(FieldTypeBase)) - set(all_types))
+
+
+def fullmatch(strings: Series, pattern: str) -> Series:
+    return strings.str.match(f"(?:{pattern})\\Z")
+
+
+def classify_strings(strings: Series) -> Tuple[Set[FieldType], Series]:
+    """
+    Field types of the strings that can be told apart by regex, and the rest
+    """
+    types: Set[FieldType] = set()
+    remaining = strings
+    for pattern, ft in [
+        (BOOLISH_RE, Boolean()),
+        (INTEGER_RE, Integer()),
+        (FLOAT_RE, Float()),
+    ]:
+        is_match = fullmatch(remaining, pattern)
+        if is_match.any():
+            types.add(ft)
+            remaining = remaining[~is_match]
+    lengths = remaining.str.len()
+    for pattern, fmt, min_len, max_len, ft in [
+        (ISO_DATE_RE, "%Y-%m-%d", 8, 10, Date()),
+        (ISO_DATETIME_RE, None, 14, 26, DateTime()),
+    ]:
+        is_candidate = lengths.between(min_len, max_len) & fullmatch(remaining, pattern)
+        if not is_candidate.any():
+            continue
+        parsed = pd.to_datetime(
+            remaining[is_candidate], format=fmt, errors="coerce", utc=fmt is None
+        )
+        is_valid = parsed.notna().reindex(remaining.index, fill_value=False)
+        if is_valid.any():
+            types.add(ft)
+            remaining = remaining[~is_valid]
+            lengths = lengths[~is_valid]
+    return types, remaining
+
+
+def infer_column_field_type(values: List[Any]) -> FieldType:
+    """
+    Same result as detecting every value's type with `detect_field_type` and taking the
+    highest cardinality, but decided a whole column at a time where possible: values
+    are grouped by python type, strings pre-classified by regex, and only what's left
+    (eg free text, non-ISO dates) is detected value by value, once per distinct value.
+    """
+    if has_custom_field_types():
+        # Pre-classification only knows the built-in types
+        return select_field_type_per_value(values, _detect_field_type_complete)
+    s = Series(values, dtype=object)
+    s = s[~s.isna()]
+    types: Set[FieldType] = set()
+    is_str = s.map(type) == str  # Exact, str subclasses are detected value by value
+    strings = s[is_str]
+    strings = strings[~strings.isin(NULL_STRINGS)]
+    others = s[~is_str]
+    other_types = others.map(type)
+    undetected = []
+    for typ in other_types.unique():
+        ft = FIELD_TYPES_BY_PYTHON_TYPE.get(typ)
+        if ft is None:
+            undetected.extend(others[other_types == typ])
+        else:
+            types.add(ft)
+    if len(strings):
+        string_types, strings = classify_strings(strings)
+        types |= string_types
+        undetected.extend(strings.unique())
+    text_rank = Text().cardinality_rank
+    for o in undetected:
+        if (
+            types
+            and max(t.cardinality_rank for t in types) >= text_rank
+            and isinstance(o, str)
+            and len(o) < LONG_TEXT
+        ):
+            # Short strings can't detect as anything higher than Text
+            continue
+        typ = detect_field_type(o)
+        if typ is not None:
+            types.add(typ)
+    return _highest_cardinality_type(types)
+
+
+def select_field_type_per_value(
+    objects: Iterable[Any], detect: Callable[[Any], Optional[FieldType]]
+) -> FieldType:
     types = set()
     for o in objects:
         # Choose the minimum compatible type
-        typ = detect_field_type(o)
+        typ = detect(o)
         if typ is None:
             continue
         types.add(typ)
+    return _highest_cardinality_type(types)
+
+
+def select_field_type(objects: Iterable[Any]) -> FieldType:
+    return infer_column_field_type(list(objects))
+
+
+def _highest_cardinality_type(types: Set[FieldType]) -> FieldType:
     if not types:
         # We detected no types, column is all null-like, or there is no data
         logger.warning("No field types detected")
@@ -133,6 +258,27 @@ def infer_fields_from_records(records: Records, **kwargs) -> List[Field]:
     return fields
 
 
+def get_dataframe_sample(df: DataFrame, sample_size: int = 100) -> DataFrame:
+    # Same head and tail rows as `get_sample`, without converting the rest
+    if len(df) < sample_size:
+        return df
+    half = sample_size // 2
+    return pd.concat([df.iloc[:half], df.iloc[-half:]])
+
+
+def infer_fields_from_dataframe(df: DataFrame, sample_size: int = 100) -> List[Field]:
+    sample = get_dataframe_sample(df, sample_size=sample_size)
+    fields = []
+    for c in sample.columns:
+        try:
+            ft = pandas_series_to_field_type(sample[c])
+        except (NotImplementedError, ValueError):
+            # dtypes with no field type (timedelta, complex), detect like records do
+            ft = select_field_type(sample[c].dropna())
+        fields.append(Field(name=c, field_type=ft))
+    return fields
+
+
 def pandas_series_to_field_type(series: Series) -> FieldType:
     """
     Cribbed from pandas.io.sql
@@ -190,3 +336,71 @@ def fields_from_sqlalchemy_table(sa_table: Table) -> List[Field]:
     for column in sa_table.columns:
         fields.append(field_from_sqlalchemy_column(column))
     return fields
+
+
+def arrow_type_to_field_type(arrow_type: pa.DataType) -> FieldType:
+    if pa.types.is_boolean(arrow_type):
+        return Boolean()
+    if pa.types.is_integer(arrow_type):
+        return Integer()
+    if pa.types.is_floating(arrow_type):
+        return Float()
+    if pa.types.is_decimal(arrow_type):
+        return Decimal()
+    if pa.types.is_timestamp(arrow_type):
+        return DateTime()
+    if pa.types.is_date(arrow_type):
+        return Date()
+    if pa.types.is_time(arrow_type):
+        return Time()
+    if pa.types.is_large_string(arrow_type):
+        return LongText()
+    if pa.types.is_string(arrow_type):
+        return Text()
+    if pa.types.is_dictionary(arrow_type):
+        return arrow_type_to_field_type(arrow_type.value_type)
+    if (
+        pa.types.is_struct(arrow_type)
+        or pa.types.is_list(arrow_type)
+        or pa.types.is_large_list(arrow_type)
+        or pa.types.is_map(arrow_type)
+    ):
+        return JSON()
+    return DEFAULT_FIELD_TYPE
+
+
+def field_type_to_arrow_type(field_type: FieldType) -> Optional[pa.DataType]:
+    # None for types with no single arrow type (JSON), left to arrow to infer
+    if isinstance(field_type, Boolean):
+        return pa.bool_()
+    if isinstance(field_type, Integer):
+        return pa.int64()
+    if isinstance(field_type, (Float, Decimal)):
+        return pa.float64()
+    if isinstance(field_type, DateTime):
+        return pa.timestamp("ns")
+    if isinstance(field_type, Date):
+        return pa.date32()
+    if isinstance(field_type, Time):
+        return pa.time64("us")
+    if isinstance(field_type, LongText):
+        return pa.large_string()
+    if isinstance(field_type, Text):
+        return pa.string()
+    return None
+
+
+def arrow_types_from_schema(schema: Schema) -> Dict[str, pa.DataType]:
+    arrow_types = {}
+    for f in schema.fields:
+        arrow_type = field_type_to_arrow_type(f.field_type)
+        if arrow_type is not None:
+            arrow_types[f.name] = arrow_type
+    return arrow_types
+
+
+def fields_from_arrow_schema(arrow_schema: pa.Schema) -> List[Field]:
+    return [
+        Field(name=f.name, field_type=arrow_type_to_field_type(f.type))
+        for f in arrow_schema
+    ]
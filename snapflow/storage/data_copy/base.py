@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import enum
+import json
+import math
 import random
+import threading
 from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import (
@@ -42,12 +45,14 @@ from sqlalchemy.orm.session import Session
 
 CostFunction = Callable[[int], int]
 BUFFER_SIZE = 100
+# Record count assumed for blocks whose size is unknown
+DEFAULT_EXPECTED_RECORD_COUNT = 10000
 
 
 @dataclass(frozen=True)
 class DataCopyCost:
-    # TODO: we're not really using the cost parameter n
-    # Maybe easier to just assume data n >> buffer n and nothing else matters?
+    # Costs are functions of the block's record count n, so buffered / streaming
+    # copies win for large blocks and in-memory copies win for small ones
     wire_cost: CostFunction
     memory_cost: CostFunction
     time_cost: CostFunction = (
@@ -80,7 +85,7 @@ DiskToMemoryCost = DataCopyCost(wire_cost=lambda n: n, memory_cost=lambda n: n)
 NetworkToMemoryCost = DataCopyCost(
     wire_cost=(
         lambda n: n * 5
-    ),  # What is this factor in practice? What's a good default (think S3 vs local SSD?)
+    ),  # Default guess, real factor per copier comes from `snapflow calibrate`
     memory_cost=lambda n: n,
 )
 NetworkToBufferCost = DataCopyCost(
@@ -112,7 +117,7 @@ class ConversionEdge:
 @dataclass(frozen=True)
 class ConversionPath:
     conversions: List[ConversionEdge] = field(default_factory=list)
-    expected_record_count: int = 10000
+    expected_record_count: int = DEFAULT_EXPECTED_RECORD_COUNT
 
     def add(self, edge: ConversionEdge):
         self.conversions.append(edge)
@@ -121,10 +126,9 @@ class ConversionPath:
         return len(self.conversions)
 
     @property
-    def total_cost(self) -> int:
+    def total_cost(self) -> float:
         return sum(
-            c.copier.cost.total_cost(self.expected_record_count)
-            for c in self.conversions
+            c.copier.total_cost(self.expected_record_count) for c in self.conversions
         )
 
 
@@ -167,6 +171,14 @@ class DataCopier:
 
     __call__ = copy
 
+    @property
+    def key(self) -> str:
+        return f"{self.copier_function.__module__}.{self.copier_function.__qualname__}"
+
+    def total_cost(self, n: int) -> float:
+        # Modeled cost, scaled by this copier's calibrated coefficient (if any)
+        return copier_cost_coefficients.get(self.key, 1.0) * self.cost.total_cost(n)
+
     def can_handle_from(self, from_storage_format: StorageFormat) -> bool:
         if self.from_storage_classes:
             if (
@@ -204,6 +216,8 @@ class DataCopier:
 
 
 all_data_copiers = []
+# Per-copier multipliers on modeled cost, measured by `calibrate_data_copiers`
+copier_cost_coefficients: Dict[str, float] = {}
 
 
 def datacopy(
@@ -229,6 +243,7 @@ def datacopy(
         )
         if not unregistered:
             all_data_copiers.append(dc)
+            clear_datacopy_lookup_cache()
         return dc
 
     return f
@@ -240,7 +255,7 @@ class CopyLookup:
         copiers: Iterable[DataCopier],
         available_storage_engines: Set[Type[StorageEngine]] = None,
         available_data_formats: Iterable[DataFormat] = None,
-        expected_record_count: int = 10000,
+        expected_record_count: int = DEFAULT_EXPECTED_RECORD_COUNT,
     ):
         self._lookup: Dict[Conversion, List[DataCopier]] = defaultdict(list)
         self._copiers: Iterable[DataCopier] = copiers
@@ -249,6 +264,7 @@ class CopyLookup:
         self.available_storage_formats = self._get_all_available_formats()
         self.expected_record_count = expected_record_count  # TODO: hmmmmm
         self._graph = self._build_copy_graph(expected_record_count)
+        self._path_cache: Dict[Conversion, Optional[ConversionPath]] = {}
 
     def _get_all_available_formats(self) -> List[StorageFormat]:
         fmts = []
@@ -270,7 +286,7 @@ class CopyLookup:
                                 from_fmt,
                                 to_fmt,
                                 copier=c,
-                                cost=c.cost.total_cost(expected_record_count),
+                                cost=c.total_cost(expected_record_count),
                             )
                             self._lookup[Conversion(from_fmt, to_fmt)].append(c)
         return g
@@ -279,6 +295,14 @@ class CopyLookup:
         return self._lookup.get(conversion, [])
 
     def get_lowest_cost_path(self, conversion: Conversion) -> Optional[ConversionPath]:
+        # Graph is fixed once built, so paths (and the lack of one) can be memoized
+        if conversion not in self._path_cache:
+            self._path_cache[conversion] = self._find_lowest_cost_path(conversion)
+        return self._path_cache[conversion]
+
+    def _find_lowest_cost_path(
+        self, conversion: Conversion
+    ) -> Optional[ConversionPath]:
         try:
             path = nx.shortest_path(
                 self._graph,
@@ -302,7 +326,7 @@ class CopyLookup:
 
     def get_lowest_cost(self, conversion: Conversion) -> Optional[DataCopier]:
         converters = [
-            (c.cost.total_cost(self.expected_record_count), random.random(), c)
+            (c.total_cost(self.expected_record_count), random.random(), c)
             for c in self.get_capable_copiers(conversion)
         ]
         if not converters:
@@ -316,17 +340,70 @@ class CopyLookup:
                 print("\t", d, attrs["converter"])
 
 
+# Process-wide cache of built lookups, keyed by everything the copy graph depends on
+_datacopy_lookup_cache: Dict[Tuple, CopyLookup] = {}
+_datacopy_lookup_cache_lock = threading.Lock()
+
+
+def clear_datacopy_lookup_cache():
+    with _datacopy_lookup_cache_lock:
+        _datacopy_lookup_cache.clear()
+
+
+def set_copier_cost_coefficients(coefficients: Dict[str, float]):
+    if coefficients == copier_cost_coefficients:
+        # Unchanged, keep cached lookups
+        return
+    copier_cost_coefficients.clear()
+    copier_cost_coefficients.update(coefficients)
+    clear_datacopy_lookup_cache()
+
+
+def load_copier_cost_coefficients(path: str):
+    with open(path) as f:
+        set_copier_cost_coefficients(json.load(f))
+
+
+def save_copier_cost_coefficients(path: str, coefficients: Dict[str, float]):
+    with open(path, "w") as f:
+        json.dump(coefficients, f, indent=2, sort_keys=True)
+
+
+def record_count_bucket(record_count: Optional[int]) -> int:
+    # Round up to a power of ten, so blocks of similar size share a cached lookup
+    if record_count is None:
+        return DEFAULT_EXPECTED_RECORD_COUNT
+    return 10 ** math.ceil(math.log10(max(record_count, 1)))
+
+
 def get_datacopy_lookup(
     copiers: Iterable[DataCopier] = None,
     available_storage_engines: Set[Type[StorageEngine]] = None,
     available_data_formats: Iterable[DataFormat] = None,
-    expected_record_count: int = 10000,
+    expected_record_count: int = DEFAULT_EXPECTED_RECORD_COUNT,
 ) -> CopyLookup:
-    return CopyLookup(
-        copiers=copiers or all_data_copiers,
-        available_storage_engines=available_storage_engines
-        or set(global_registry.all(StorageEngine)),
-        available_data_formats=available_data_formats
-        or list(global_registry.all(DataFormatBase)),
-        expected_record_count=expected_record_count,
+    copiers = list(copiers or all_data_copiers)
+    available_storage_engines = available_storage_engines or set(
+        global_registry.all(StorageEngine)
+    )
+    available_data_formats = list(
+        available_data_formats or global_registry.all(DataFormatBase)
     )
+    # Copiers aren't hashable, key on identity (cached lookups keep them alive)
+    key = (
+        tuple(id(c) for c in copiers),
+        frozenset(available_storage_engines),
+        tuple(available_data_formats),
+        expected_record_count,
+    )
+    with _datacopy_lookup_cache_lock:
+        lookup = _datacopy_lookup_cache.get(key)
+        if lookup is None:
+            lookup = CopyLookup(
+                copiers=copiers,
+                available_storage_engines=available_storage_engines,
+                available_data_formats=available_data_formats,
+                expected_record_count=expected_record_count,
+            )
+            _datacopy_lookup_cache[key] = lookup
+    return lookup
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import tempfile
+import time
+from statistics import median
+from typing import Dict, List, Optional, Type
+
+from loguru import logger
+from snapflow.schema.base import Schema, create_quick_schema
+from snapflow.storage.data_copy.base import (
+    Conversion,
+    CopyLookup,
+    DataCopier,
+    StorageFormat,
+    all_data_copiers,
+    get_datacopy_lookup,
+)
+from snapflow.storage.data_formats import RecordsFormat
+from snapflow.storage.data_records import as_records
+from snapflow.storage.db.utils import get_tmp_sqlite_db_url
+from snapflow.storage.storage import (
+    LocalFileSystemStorageEngine,
+    LocalPythonStorageEngine,
+    PythonStorageApi,
+    SqliteStorageEngine,
+    Storage,
+    StorageEngine,
+    new_local_python_storage,
+)
+from snapflow.utils.common import rand_str
+
+CalibrationSchema = create_quick_schema(
+    "CalibrationSchema",
+    [("id", "Integer"), ("name", "Text"), ("amount", "Float")],
+    module_name="core",
+)
+
+
+def make_calibration_records(n: int) -> List[Dict]:
+    return [{"id": i, "name": f"name {i}", "amount": i * 1.5} for i in range(n)]
+
+
+def get_local_calibration_storages() -> Dict[Type[StorageEngine], Storage]:
+    return {
+        LocalPythonStorageEngine: new_local_python_storage(),
+        LocalFileSystemStorageEngine: Storage.from_url(f"file://{tempfile.mkdtemp()}"),
+        SqliteStorageEngine: Storage.from_url(get_tmp_sqlite_db_url()),
+    }
+
+
+def new_calibration_name() -> str:
+    return f"_calibration_{rand_str(10).lower()}"
+
+
+def time_copier(
+    copier: DataCopier,
+    conversion: Conversion,
+    lookup: CopyLookup,
+    storages: Dict[Type[StorageEngine], Storage],
+    records: List[Dict],
+    schema: Schema,
+) -> Optional[float]:
+    """
+    Time one copy with `copier` of `records`, after first copying the records into
+    the conversion's source format (untimed). Returns None if no setup path exists.
+    """
+    source = StorageFormat(LocalPythonStorageEngine, RecordsFormat)
+    mem_api = storages[LocalPythonStorageEngine].get_api()
+    assert isinstance(mem_api, PythonStorageApi)
+    name = new_calibration_name()
+    mem_api.put(name, as_records(list(records), data_format=RecordsFormat))
+    from_storage = storages[LocalPythonStorageEngine]
+    if source != conversion.from_storage_format:
+        setup_path = lookup.get_lowest_cost_path(
+            Conversion(source, conversion.from_storage_format)
+        )
+        if setup_path is None:
+            return None
+        for edge in setup_path.conversions:
+            to_storage = storages[edge.conversion.to_storage_format.storage_engine]
+            to_name = new_calibration_name()
+            edge.copier.copy(
+                name,
+                to_name,
+                edge.conversion,
+                from_storage.get_api(),
+                to_storage.get_api(),
+                schema,
+            )
+            name = to_name
+            from_storage = to_storage
+    to_storage = storages[conversion.to_storage_format.storage_engine]
+    start = time.perf_counter()
+    copier.copy(
+        name,
+        new_calibration_name(),
+        conversion,
+        from_storage.get_api(),
+        to_storage.get_api(),
+        schema,
+    )
+    return time.perf_counter() - start
+
+
+def calibrate_data_copiers(
+    record_count: int = 10000, copiers: Optional[List[DataCopier]] = None
+) -> Dict[str, float]:
+    """
+    Measure each copier's throughput on this machine (using local memory, file and
+    sqlite storages) and return cost coefficients keyed by copier key. A coefficient
+    is the copier's measured time relative to its modeled cost, normalized so the
+    median copier is 1.0: `DataCopier.total_cost` multiplies its modeled cost by it.
+    Copiers that can't be exercised with local storages are left out (and so keep
+    a coefficient of 1.0).
+    """
+    if copiers is None:
+        copiers = all_data_copiers
+    storages = get_local_calibration_storages()
+    lookup = get_datacopy_lookup(
+        available_storage_engines=set(storages), expected_record_count=record_count
+    )
+    records = make_calibration_records(record_count)
+    time_per_cost: Dict[str, float] = {}
+    for copier in copiers:
+        modeled_cost = copier.cost.total_cost(record_count)
+        if modeled_cost <= 0:
+            continue
+        conversions = [
+            Conversion(from_fmt, to_fmt)
+            for from_fmt in lookup.available_storage_formats
+            for to_fmt in lookup.available_storage_formats
+            if copier.can_handle(Conversion(from_fmt, to_fmt))
+        ]
+        if not conversions:
+            continue
+        try:
+            elapsed = time_copier(
+                copier, conversions[0], lookup, storages, records, CalibrationSchema
+            )
+        except Exception as e:
+            logger.warning(f"Could not calibrate copier {copier.key}: {e}")
+            continue
+        if elapsed is None:
+            continue
+        logger.debug(f"Calibrated {copier.key}: {elapsed:.4f}s for {conversions[0]}")
+        time_per_cost[copier.key] = elapsed / modeled_cost
+    if not time_per_cost:
+        return {}
+    baseline = median(time_per_cost.values())
+    if baseline <= 0:
+        return {}
+    return {k: v / baseline for k, v in time_per_cost.items()}
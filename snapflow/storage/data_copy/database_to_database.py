@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from snapflow.schema.base import Schema
+from snapflow.storage.data_copy.base import Conversion, NetworkToBufferCost, datacopy
+from snapflow.storage.data_formats import DatabaseTableFormat
+from snapflow.storage.db.api import DatabaseStorageApi
+from snapflow.storage.storage import DatabaseStorageClass, StorageApi
+
+
+@datacopy(
+    from_storage_classes=[DatabaseStorageClass],
+    from_data_formats=[DatabaseTableFormat],
+    to_storage_classes=[DatabaseStorageClass],
+    to_data_formats=[DatabaseTableFormat],
+    cost=NetworkToBufferCost,
+)
+def copy_db_to_db(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, DatabaseStorageApi)
+    assert isinstance(to_storage_api, DatabaseStorageApi)
+    queryable_name = to_storage_api.get_queryable_name(from_name, from_storage_api)
+    if queryable_name is not None:
+        # Same server, data never leaves the database
+        to_storage_api.create_table_from_sql(to_name, f"select * from {queryable_name}")
+        return
+    select_sql = f"select * from {from_name}"
+    with from_storage_api.stream_records(select_sql) as records_iterator:
+        to_storage_api.bulk_insert_records_iterator(to_name, records_iterator, schema)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from snapflow.schema.base import Schema
+from snapflow.storage.data_copy.base import Conversion, NetworkToBufferCost, datacopy
+from snapflow.storage.data_formats import DatabaseTableFormat
+from snapflow.storage.data_formats.delimited_file import DelimitedFileFormat
+from snapflow.storage.db.api import DatabaseStorageApi
+from snapflow.storage.file_system import FileSystemStorageApi
+from snapflow.storage.storage import (
+    DatabaseStorageClass,
+    FileSystemStorageClass,
+    StorageApi,
+)
+
+
+@datacopy(
+    from_storage_classes=[DatabaseStorageClass],
+    from_data_formats=[DatabaseTableFormat],
+    to_storage_classes=[FileSystemStorageClass],
+    to_data_formats=[DelimitedFileFormat],
+    cost=NetworkToBufferCost,
+)
+def copy_db_to_delim_file(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, DatabaseStorageApi)
+    assert isinstance(to_storage_api, FileSystemStorageApi)
+    with to_storage_api.open(to_name, "w") as f:
+        from_storage_api.export_delimited_file(from_name, f)
@@ -13,16 +13,21 @@ from snapflow.storage.data_formats import (
     DatabaseTableRefFormat,
     RecordsFormat,
 )
+from snapflow.storage.data_formats.data_frame import (
+    DataFrameFormat,
+    DataFrameIteratorFormat,
+)
 from snapflow.storage.data_formats.records import RecordsIteratorFormat
 from snapflow.storage.data_records import as_records
 from snapflow.storage.db.api import DatabaseStorageApi
-from snapflow.storage.db.utils import result_proxy_to_records
+from snapflow.storage.db.utils import result_proxy_to_columns, result_proxy_to_records
 from snapflow.storage.storage import (
     DatabaseStorageClass,
     PythonStorageApi,
     PythonStorageClass,
     StorageApi,
 )
+from snapflow.utils.pandas import columns_to_dataframe, rows_to_dataframe
 
 
 @datacopy(
@@ -68,19 +73,21 @@ def copy_db_to_records_iterator(
     assert isinstance(from_storage_api, DatabaseStorageApi)
     assert isinstance(to_storage_api, PythonStorageApi)
     select_sql = f"select * from {from_name}"
-    conn = (
-        from_storage_api.get_engine().connect()
-    )  # Gonna leave this connection hanging... # TODO: add "closeable" to the MDR and handle?
-    r = conn.execute(select_sql)
+    # Closed when the iterator is exhausted, or by `mdr.close()` if it never is
+    conn = from_storage_api.get_engine().connect()
+    r = from_storage_api.execute_streaming(conn, select_sql)
+    chunk_size = from_storage_api.fetch_chunk_size
 
     def f():
-        while True:
-            # TODO: how to parameterize this chunk size? (it's approximate anyways for some dbs?)
-            rows = r.fetchmany(1000)
-            if not rows:
-                return
-            records = result_proxy_to_records(r, rows=rows)
-            yield records
+        try:
+            while True:
+                rows = r.fetchmany(chunk_size)
+                if not rows:
+                    return
+                records = result_proxy_to_records(r, rows=rows)
+                yield records
+        finally:
+            conn.close()
 
     mdr = as_records(f(), data_format=RecordsIteratorFormat, schema=schema)
     mdr = mdr.conform_to_schema()
@@ -106,16 +113,83 @@ def copy_db_to_cursor(
     assert isinstance(from_storage_api, DatabaseStorageApi)
     assert isinstance(to_storage_api, PythonStorageApi)
     select_sql = f"select * from {from_name}"
-    conn = (
-        from_storage_api.get_engine().connect()
-    )  # Gonna leave this connection hanging... # TODO: add "closeable" to the MDR and handle?
-    r = conn.execute(select_sql)
+    # Closed by `mdr.close()`, when the block is removed or the run finishes
+    conn = from_storage_api.get_engine().connect()
+    r = from_storage_api.execute_streaming(conn, select_sql)
     mdr = as_records(r, data_format=DatabaseCursorFormat, schema=schema)
     mdr = mdr.conform_to_schema()
     mdr.closeable = conn.close
     to_storage_api.put(to_name, mdr)
 
 
+@datacopy(
+    from_storage_classes=[DatabaseStorageClass],
+    from_data_formats=[DatabaseTableFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[DataFrameFormat],
+    cost=NetworkToMemoryCost,
+)
+def copy_db_to_df(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    # Column-wise, typed from the schema: skips building a dict per row
+    assert isinstance(from_storage_api, DatabaseStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    select_sql = f"select * from {from_name}"
+    with from_storage_api.connection() as conn:
+        r = from_storage_api.execute_streaming(conn, select_sql)
+        columns = result_proxy_to_columns(r, from_storage_api.fetch_chunk_size)
+    df = columns_to_dataframe(columns, schema)
+    mdr = as_records(df, data_format=DataFrameFormat, schema=schema)
+    mdr = mdr.conform_to_schema()
+    to_storage_api.put(to_name, mdr)
+
+
+@datacopy(
+    from_storage_classes=[DatabaseStorageClass],
+    from_data_formats=[DatabaseTableFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[DataFrameIteratorFormat],
+    cost=NetworkToBufferCost,
+)
+def copy_db_to_df_iterator(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, DatabaseStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    select_sql = f"select * from {from_name}"
+    # Closed when the iterator is exhausted, or by `mdr.close()` if it never is
+    conn = from_storage_api.get_engine().connect()
+    r = from_storage_api.execute_streaming(conn, select_sql)
+    chunk_size = from_storage_api.fetch_chunk_size
+
+    def f():
+        try:
+            column_names = list(r.keys())
+            while True:
+                rows = r.fetchmany(chunk_size)
+                if not rows:
+                    return
+                yield rows_to_dataframe(rows, column_names, schema)
+        finally:
+            conn.close()
+
+    mdr = as_records(f(), data_format=DataFrameIteratorFormat, schema=schema)
+    mdr = mdr.conform_to_schema()
+    mdr.closeable = conn.close
+    to_storage_api.put(to_name, mdr)
+
+
 # @datacopy(
 #     from_storage_classes=[DatabaseStorageClass],
 #     from_data_formats=[DatabaseTableFormat],
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from snapflow.schema.base import Schema
+from snapflow.storage.data_copy.base import Conversion, NetworkToBufferCost, datacopy
+from snapflow.storage.data_formats import DatabaseTableFormat
+from snapflow.storage.data_formats.delimited_file import DelimitedFileFormat
+from snapflow.storage.db.api import DatabaseStorageApi
+from snapflow.storage.file_system import FileSystemStorageApi
+from snapflow.storage.storage import (
+    DatabaseStorageClass,
+    FileSystemStorageClass,
+    StorageApi,
+)
+
+
+@datacopy(
+    from_storage_classes=[FileSystemStorageClass],
+    from_data_formats=[DelimitedFileFormat],
+    to_storage_classes=[DatabaseStorageClass],
+    to_data_formats=[DatabaseTableFormat],
+    cost=NetworkToBufferCost,
+)
+def copy_delim_file_to_db(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, FileSystemStorageApi)
+    assert isinstance(to_storage_api, DatabaseStorageApi)
+    with from_storage_api.open(from_name) as f:
+        to_storage_api.bulk_insert_delimited_file(to_name, f, schema)
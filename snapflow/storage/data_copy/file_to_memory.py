@@ -16,7 +16,12 @@ from snapflow.storage.data_formats import (
     DatabaseTableFormat,
     DatabaseTableRef,
     DatabaseTableRefFormat,
+    DataFrameFormat,
+    DataFrameIteratorFormat,
+    JsonLinesFileFormat,
+    ParquetFileFormat,
     RecordsFormat,
+    RecordsIteratorFormat,
 )
 from snapflow.storage.data_formats.delimited_file import DelimitedFileFormat
 from snapflow.storage.data_formats.delimited_file_object import (
@@ -34,7 +39,13 @@ from snapflow.storage.storage import (
     PythonStorageClass,
     StorageApi,
 )
-from snapflow.utils.data import read_csv
+from snapflow.utils.arrow import iterate_parquet_row_groups, read_parquet
+from snapflow.utils.data import iterate_json_lines_chunks, read_json_lines
+from snapflow.utils.pandas import (
+    dataframe_to_records,
+    read_csv_chunks,
+    records_to_dataframe,
+)
 
 
 @datacopy(
@@ -55,10 +66,76 @@ def copy_delim_file_to_records(
     assert isinstance(from_storage_api, FileSystemStorageApi)
     assert isinstance(to_storage_api, PythonStorageApi)
     with from_storage_api.open(from_name) as f:
-        records = list(read_csv(f.readlines()))
-        mdr = as_records(records, data_format=RecordsFormat, schema=schema)
-        mdr = mdr.conform_to_schema()
-        to_storage_api.put(to_name, mdr)
+        records = [r for df in read_csv_chunks(f) for r in dataframe_to_records(df)]
+    mdr = as_records(records, data_format=RecordsFormat, schema=schema)
+    mdr = mdr.conform_to_schema()
+    to_storage_api.put(to_name, mdr)
+
+
+@datacopy(
+    from_storage_classes=[FileSystemStorageClass],
+    from_data_formats=[DelimitedFileFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[RecordsIteratorFormat],
+    cost=DiskToBufferCost,
+)
+def copy_delim_file_to_records_iterator(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, FileSystemStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    # Closed when the iterator is exhausted, or by `mdr.close()` if it never is
+    f = open(from_storage_api.get_path(from_name))
+
+    def records_iterator():
+        try:
+            for df in read_csv_chunks(f):
+                yield dataframe_to_records(df)
+        finally:
+            f.close()
+
+    mdr = as_records(
+        records_iterator(), data_format=RecordsIteratorFormat, schema=schema
+    )
+    mdr = mdr.conform_to_schema()
+    mdr.closeable = f.close
+    to_storage_api.put(to_name, mdr)
+
+
+@datacopy(
+    from_storage_classes=[FileSystemStorageClass],
+    from_data_formats=[DelimitedFileFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[DataFrameIteratorFormat],
+    cost=DiskToBufferCost,
+)
+def copy_delim_file_to_df_iterator(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, FileSystemStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    f = open(from_storage_api.get_path(from_name))
+
+    def dfs():
+        try:
+            yield from read_csv_chunks(f)
+        finally:
+            f.close()
+
+    mdr = as_records(dfs(), data_format=DataFrameIteratorFormat, schema=schema)
+    mdr = mdr.conform_to_schema()
+    mdr.closeable = f.close
+    to_storage_api.put(to_name, mdr)
 
 
 @datacopy(
@@ -82,3 +159,196 @@ def copy_delim_file_to_file_object(
         mdr = as_records(f, data_format=DelimitedFileObjectFormat, schema=schema)
         mdr = mdr.conform_to_schema()
         to_storage_api.put(to_name, mdr)
+
+
+@datacopy(
+    from_storage_classes=[FileSystemStorageClass],
+    from_data_formats=[ParquetFileFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[DataFrameFormat],
+    cost=DiskToMemoryCost,
+)
+def copy_parquet_file_to_df(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, FileSystemStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    # Only the schema's columns are read off disk
+    table = read_parquet(
+        from_storage_api.get_path(from_name), columns=schema.field_names() or None
+    )
+    mdr = as_records(table.to_pandas(), data_format=DataFrameFormat, schema=schema)
+    mdr = mdr.conform_to_schema()
+    to_storage_api.put(to_name, mdr)
+
+
+@datacopy(
+    from_storage_classes=[FileSystemStorageClass],
+    from_data_formats=[ParquetFileFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[DataFrameIteratorFormat],
+    cost=DiskToBufferCost,
+)
+def copy_parquet_file_to_df_iterator(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, FileSystemStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    row_groups = iterate_parquet_row_groups(
+        from_storage_api.get_path(from_name), columns=schema.field_names() or None
+    )
+    dfs = (table.to_pandas() for table in row_groups)
+    mdr = as_records(dfs, data_format=DataFrameIteratorFormat, schema=schema)
+    mdr = mdr.conform_to_schema()
+    to_storage_api.put(to_name, mdr)
+
+
+@datacopy(
+    from_storage_classes=[FileSystemStorageClass],
+    from_data_formats=[ParquetFileFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[RecordsFormat],
+    cost=DiskToMemoryCost,
+)
+def copy_parquet_file_to_records(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, FileSystemStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    table = read_parquet(
+        from_storage_api.get_path(from_name), columns=schema.field_names() or None
+    )
+    mdr = as_records(table.to_pylist(), data_format=RecordsFormat, schema=schema)
+    mdr = mdr.conform_to_schema()
+    to_storage_api.put(to_name, mdr)
+
+
+@datacopy(
+    from_storage_classes=[FileSystemStorageClass],
+    from_data_formats=[ParquetFileFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[RecordsIteratorFormat],
+    cost=DiskToBufferCost,
+)
+def copy_parquet_file_to_records_iterator(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, FileSystemStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    row_groups = iterate_parquet_row_groups(
+        from_storage_api.get_path(from_name), columns=schema.field_names() or None
+    )
+    records_iterator = (table.to_pylist() for table in row_groups)
+    mdr = as_records(records_iterator, data_format=RecordsIteratorFormat, schema=schema)
+    mdr = mdr.conform_to_schema()
+    to_storage_api.put(to_name, mdr)
+
+
+@datacopy(
+    from_storage_classes=[FileSystemStorageClass],
+    from_data_formats=[JsonLinesFileFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[RecordsFormat],
+    cost=DiskToMemoryCost,
+)
+def copy_json_lines_file_to_records(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, FileSystemStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    with from_storage_api.open(from_name, "rb") as f:
+        records = list(read_json_lines(f))
+    mdr = as_records(records, data_format=RecordsFormat, schema=schema)
+    mdr = mdr.conform_to_schema()
+    to_storage_api.put(to_name, mdr)
+
+
+@datacopy(
+    from_storage_classes=[FileSystemStorageClass],
+    from_data_formats=[JsonLinesFileFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[RecordsIteratorFormat],
+    cost=DiskToBufferCost,
+)
+def copy_json_lines_file_to_records_iterator(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, FileSystemStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    # Closed when the iterator is exhausted, or by `mdr.close()` if it never is
+    f = open(from_storage_api.get_path(from_name), "rb")
+
+    def records_iterator():
+        try:
+            yield from iterate_json_lines_chunks(f)
+        finally:
+            f.close()
+
+    mdr = as_records(
+        records_iterator(), data_format=RecordsIteratorFormat, schema=schema
+    )
+    mdr = mdr.conform_to_schema()
+    mdr.closeable = f.close
+    to_storage_api.put(to_name, mdr)
+
+
+@datacopy(
+    from_storage_classes=[FileSystemStorageClass],
+    from_data_formats=[JsonLinesFileFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[DataFrameIteratorFormat],
+    cost=DiskToBufferCost,
+)
+def copy_json_lines_file_to_df_iterator(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, FileSystemStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    f = open(from_storage_api.get_path(from_name), "rb")
+
+    def dfs():
+        try:
+            for records in iterate_json_lines_chunks(f):
+                yield records_to_dataframe(records, schema)
+        finally:
+            f.close()
+
+    mdr = as_records(dfs(), data_format=DataFrameIteratorFormat, schema=schema)
+    mdr = mdr.conform_to_schema()
+    mdr.closeable = f.close
+    to_storage_api.put(to_name, mdr)
@@ -63,5 +63,4 @@ def copy_records_iterator_to_db(
     assert isinstance(from_storage_api, PythonStorageApi)
     assert isinstance(to_storage_api, DatabaseStorageApi)
     mdr = from_storage_api.get(from_name)
-    for records in mdr.records_object:
-        to_storage_api.bulk_insert_records(to_name, records, schema)
+    to_storage_api.bulk_insert_records_iterator(to_name, mdr.records_object, schema)
@@ -1,13 +1,18 @@
-from collections.abc import Iterator
 from io import IOBase
 from typing import Sequence
 
+from snapflow.core.typing.inference import conform_dataframe_to_schema
 from snapflow.schema.base import Schema
+from snapflow.schema.inference import arrow_types_from_schema
 from snapflow.storage.data_copy.base import Conversion, DiskToMemoryCost, datacopy
 from snapflow.storage.data_formats import (
     DatabaseTableFormat,
     DatabaseTableRefFormat,
     DataFormat,
+    DataFrameFormat,
+    DataFrameIteratorFormat,
+    JsonLinesFileFormat,
+    ParquetFileFormat,
     RecordsFormat,
     RecordsIteratorFormat,
 )
@@ -25,7 +30,15 @@ from snapflow.storage.storage import (
     PythonStorageClass,
     StorageApi,
 )
-from snapflow.utils.data import SampleableIO, write_csv
+from snapflow.utils.arrow import write_parquet
+from snapflow.utils.data import (
+    DEFAULT_JSON_LINES_CHUNK_SIZE,
+    SampleableIO,
+    SampleableIterator,
+    write_csv,
+    write_json_lines,
+)
+from snapflow.utils.pandas import records_to_dataframe
 
 
 @datacopy(
@@ -47,7 +60,7 @@ def copy_records_to_delim_file(
     assert isinstance(to_storage_api, FileSystemStorageApi)
     mdr = from_storage_api.get(from_name)
     records_iterator = mdr.records_object
-    if not isinstance(mdr.records_object, Iterator):
+    if not isinstance(mdr.records_object, SampleableIterator):
         records_iterator = [records_iterator]
     with to_storage_api.open(to_name, "w") as f:
         append = False
@@ -80,3 +93,121 @@ def copy_file_object_to_delim_file(
     with to_storage_api.open(to_name, "w") as to_file:
         for file_obj in file_obj_iterator:
             to_file.write(file_obj)
+
+
+@datacopy(
+    from_storage_classes=[PythonStorageClass],
+    from_data_formats=[DataFrameFormat, DataFrameIteratorFormat],
+    to_storage_classes=[FileSystemStorageClass],
+    to_data_formats=[ParquetFileFormat],
+    cost=DiskToMemoryCost,
+)
+def copy_df_to_parquet_file(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, PythonStorageApi)
+    assert isinstance(to_storage_api, FileSystemStorageApi)
+    mdr = from_storage_api.get(from_name)
+    dfs = mdr.records_object
+    if not isinstance(mdr.records_object, SampleableIterator):
+        dfs = [dfs]
+    # One row group per DataFrame, so iterator reads get the same chunks back
+    write_parquet(
+        to_storage_api.get_path(to_name),
+        (conform_dataframe_to_schema(df, schema) for df in dfs),
+        arrow_types_from_schema(schema),
+    )
+
+
+@datacopy(
+    from_storage_classes=[PythonStorageClass],
+    from_data_formats=[RecordsFormat, RecordsIteratorFormat],
+    to_storage_classes=[FileSystemStorageClass],
+    to_data_formats=[ParquetFileFormat],
+    cost=DiskToMemoryCost,
+)
+def copy_records_to_parquet_file(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, PythonStorageApi)
+    assert isinstance(to_storage_api, FileSystemStorageApi)
+    mdr = from_storage_api.get(from_name)
+    records_iterator = mdr.records_object
+    if not isinstance(mdr.records_object, SampleableIterator):
+        records_iterator = [records_iterator]
+    dfs = (
+        records_to_dataframe(records, schema) for records in records_iterator if records
+    )
+    write_parquet(
+        to_storage_api.get_path(to_name), dfs, arrow_types_from_schema(schema)
+    )
+
+
+@datacopy(
+    from_storage_classes=[PythonStorageClass],
+    from_data_formats=[RecordsFormat, RecordsIteratorFormat],
+    to_storage_classes=[FileSystemStorageClass],
+    to_data_formats=[JsonLinesFileFormat],
+    cost=DiskToMemoryCost,
+)
+def copy_records_to_json_lines_file(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, PythonStorageApi)
+    assert isinstance(to_storage_api, FileSystemStorageApi)
+    mdr = from_storage_api.get(from_name)
+    records_iterator = mdr.records_object
+    if not isinstance(mdr.records_object, SampleableIterator):
+        records = records_iterator
+        records_iterator = (
+            records[i : i + DEFAULT_JSON_LINES_CHUNK_SIZE]
+            for i in range(0, len(records), DEFAULT_JSON_LINES_CHUNK_SIZE)
+        )
+    with to_storage_api.open(to_name, "w") as f:
+        for records in records_iterator:
+            write_json_lines(records, f)
+
+
+@datacopy(
+    from_storage_classes=[PythonStorageClass],
+    from_data_formats=[DataFrameFormat, DataFrameIteratorFormat],
+    to_storage_classes=[FileSystemStorageClass],
+    to_data_formats=[JsonLinesFileFormat],
+    cost=DiskToMemoryCost,
+)
+def copy_df_to_json_lines_file(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, PythonStorageApi)
+    assert isinstance(to_storage_api, FileSystemStorageApi)
+    mdr = from_storage_api.get(from_name)
+    dfs = mdr.records_object
+    if not isinstance(mdr.records_object, SampleableIterator):
+        dfs = [dfs]
+    with to_storage_api.open(to_name, "w") as f:
+        for df in dfs:
+            if df.empty:
+                continue
+            # Serialized column-wise by pandas, not row by row
+            lines = df.to_json(orient="records", lines=True, date_format="iso")
+            f.write(lines if lines.endswith("\n") else lines + "\n")
@@ -11,6 +11,8 @@ from snapflow.storage.data_copy.base import (
     datacopy,
 )
 from snapflow.storage.data_formats import (
+    ArrowRecordBatchIteratorFormat,
+    ArrowTableFormat,
     DatabaseTableFormat,
     DatabaseTableRefFormat,
     DataFormat,
@@ -36,6 +38,7 @@ from snapflow.storage.storage import (
     PythonStorageClass,
     StorageApi,
 )
+from snapflow.utils.arrow import pa
 from snapflow.utils.data import (
     SampleableIterator,
     iterate_chunks,
@@ -269,3 +272,109 @@ def copy_file_object_iterator_to_records_iterator(
     to_mdr = as_records(itr, data_format=RecordsIteratorFormat, schema=schema)
     to_mdr = to_mdr.conform_to_schema()
     to_storage_api.put(to_name, to_mdr)
+
+
+# Arrow <-> pandas conversions share column buffers where the types allow it
+# (numeric columns without nulls), so they are costed as buffer copies
+
+
+@datacopy(
+    from_storage_classes=[PythonStorageClass],
+    from_data_formats=[ArrowTableFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[DataFrameFormat],
+    cost=BufferToBufferCost,
+)
+def copy_arrow_table_to_df(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, PythonStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    mdr = from_storage_api.get(from_name)
+    # split_blocks skips consolidating columns into 2D blocks (another copy)
+    df = mdr.records_object.to_pandas(split_blocks=True)
+    to_mdr = as_records(df, data_format=DataFrameFormat, schema=schema)
+    to_mdr = to_mdr.conform_to_schema()
+    to_storage_api.put(to_name, to_mdr)
+
+
+@datacopy(
+    from_storage_classes=[PythonStorageClass],
+    from_data_formats=[DataFrameFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[ArrowTableFormat],
+    cost=BufferToBufferCost,
+)
+def copy_df_to_arrow_table(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, PythonStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    mdr = from_storage_api.get(from_name)
+    table = pa.Table.from_pandas(mdr.records_object, preserve_index=False)
+    to_mdr = as_records(table, data_format=ArrowTableFormat, schema=schema)
+    to_mdr = to_mdr.conform_to_schema()
+    to_storage_api.put(to_name, to_mdr)
+
+
+@datacopy(
+    from_storage_classes=[PythonStorageClass],
+    from_data_formats=[ArrowRecordBatchIteratorFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[DataFrameIteratorFormat],
+    cost=BufferToBufferCost,
+)
+def copy_arrow_batch_iterator_to_df_iterator(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, PythonStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    mdr = from_storage_api.get(from_name)
+    dfs = (batch.to_pandas(split_blocks=True) for batch in mdr.records_object)
+    to_mdr = as_records(dfs, data_format=DataFrameIteratorFormat, schema=schema)
+    to_mdr = to_mdr.conform_to_schema()
+    to_storage_api.put(to_name, to_mdr)
+
+
+@datacopy(
+    from_storage_classes=[PythonStorageClass],
+    from_data_formats=[DataFrameIteratorFormat],
+    to_storage_classes=[PythonStorageClass],
+    to_data_formats=[ArrowRecordBatchIteratorFormat],
+    cost=BufferToBufferCost,
+)
+def copy_df_iterator_to_arrow_batch_iterator(
+    from_name: str,
+    to_name: str,
+    conversion: Conversion,
+    from_storage_api: StorageApi,
+    to_storage_api: StorageApi,
+    schema: Schema,
+):
+    assert isinstance(from_storage_api, PythonStorageApi)
+    assert isinstance(to_storage_api, PythonStorageApi)
+    mdr = from_storage_api.get(from_name)
+    batches = (
+        pa.RecordBatch.from_pandas(df, preserve_index=False)
+        for df in mdr.records_object
+    )
+    to_mdr = as_records(
+        batches, data_format=ArrowRecordBatchIteratorFormat, schema=schema
+    )
+    to_mdr = to_mdr.conform_to_schema()
+    to_storage_api.put(to_name, to_mdr)
@@ -3,6 +3,11 @@ from __future__ import annotations
 from typing import Any, Dict, Iterable, List, Optional, Union
 
 import pandas as pd
+from snapflow.storage.data_formats.arrow_table import (
+    ArrowRecordBatchIterator,
+    ArrowRecordBatchIteratorFormat,
+    ArrowTableFormat,
+)
 from snapflow.storage.data_formats.base import (
     DataFormat,
     DataFormatBase,
@@ -27,6 +32,7 @@ from snapflow.storage.data_formats.delimited_file_object import (
     DelimitedFileObjectIteratorFormat,
 )
 from snapflow.storage.data_formats.json_lines_file import JsonLinesFileFormat
+from snapflow.storage.data_formats.parquet_file import ParquetFileFormat
 from snapflow.storage.data_formats.records import (
     Records,
     RecordsFormat,
@@ -49,9 +55,12 @@ core_data_formats_precedence: List[DataFormat] = [
     DataFrameIteratorFormat,
     DelimitedFileObjectFormat,
     DelimitedFileObjectIteratorFormat,
+    ArrowTableFormat,
+    ArrowRecordBatchIteratorFormat,
     ### Non-python formats (can't be concrete python objects)
     DelimitedFileFormat,
     JsonLinesFileFormat,
+    ParquetFileFormat,
     DatabaseTableFormat,
 ]
 for fmt in core_data_formats_precedence:
@@ -59,7 +68,10 @@ for fmt in core_data_formats_precedence:
 
 
 def register_format(format: DataFormat):
+    from snapflow.storage.data_copy.base import clear_datacopy_lookup_cache
+
     global_registry.register(format)
+    clear_datacopy_lookup_cache()
 
 
 def get_data_format_of_object(obj: Any) -> Optional[DataFormat]:
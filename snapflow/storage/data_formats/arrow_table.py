@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from snapflow.storage.data_formats.base import (
+    MemoryDataFormatBase,
+    make_corresponding_iterator_format,
+)
+from snapflow.utils.arrow import ARROW_SUPPORTED, ensure_arrow_supported, pa
+
+if TYPE_CHECKING:
+    from snapflow.schema import Schema, SchemaTranslation
+
+
+class ArrowTableFormat(MemoryDataFormatBase):
+    @classmethod
+    def type(cls):
+        ensure_arrow_supported()
+        return pa.Table
+
+    @classmethod
+    def empty(cls) -> Any:
+        ensure_arrow_supported()
+        return pa.table({})
+
+    @classmethod
+    def get_record_count(cls, obj: Any) -> Optional[int]:
+        if obj is None:
+            return None
+        return obj.num_rows
+
+    @classmethod
+    def get_records_sample(cls, obj: Any, n: int = 200) -> Optional[List[Dict]]:
+        return obj.slice(0, n).to_pylist()
+
+    @classmethod
+    def maybe_instance(cls, obj: Any) -> bool:
+        if not ARROW_SUPPORTED:
+            return False
+        return isinstance(obj, cls.type())
+
+    @classmethod
+    def definitely_instance(cls, obj: Any) -> bool:
+        # Arrow objects are unambiguous
+        return cls.maybe_instance(obj)
+
+    @classmethod
+    def copy_records(cls, obj: Any) -> Any:
+        # Immutable, so safe to share
+        return obj
+
+    @classmethod
+    def infer_schema_from_records(cls, records: Any) -> Schema:
+        # Arrow data is already typed, no need to sample values
+        from snapflow.core.typing.inference import infer_schema_from_arrow_schema
+
+        return infer_schema_from_arrow_schema(records.schema)
+
+    @classmethod
+    def apply_schema_translation(cls, translation: SchemaTranslation, obj: Any) -> Any:
+        m = translation.as_dict()
+        names = [m.get(n, n) for n in obj.schema.names]
+        # Renaming only swaps the schema, column buffers are shared
+        return obj.__class__.from_arrays(obj.columns, names=names)
+
+
+class ArrowRecordBatchFormat(ArrowTableFormat):
+    @classmethod
+    def type(cls):
+        ensure_arrow_supported()
+        return pa.RecordBatch
+
+    @classmethod
+    def empty(cls) -> Any:
+        ensure_arrow_supported()
+        return pa.RecordBatch.from_arrays([], names=[])
+
+
+ArrowRecordBatchIteratorFormat = make_corresponding_iterator_format(
+    ArrowRecordBatchFormat
+)
+ArrowRecordBatchIterator = Iterator[Any]
@@ -155,6 +155,15 @@ class IteratorFormatBase(MemoryDataFormatBase):
             return cls.object_format.get_records_sample(o, n)
         return None
 
+    @classmethod
+    def infer_schema_from_records(cls, records: Any) -> Schema:
+        # Inferred from the first chunk, in its own format
+        if isinstance(records, SampleableIterator):
+            first = records.get_first()
+            if first is not None:
+                return cls.object_format.infer_schema_from_records(first)
+        raise ValueError("Empty records object")
+
     @classmethod
     def maybe_instance(cls, obj: Any) -> bool:
         if not isinstance(obj, abc.Iterator):
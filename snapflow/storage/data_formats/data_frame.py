@@ -28,7 +28,20 @@ class DataFrameFormat(MemoryDataFormatBase[DataFrame]):
 
     @classmethod
     def get_records_sample(cls, obj: Any, n: int = 200) -> Optional[List[Dict]]:
-        return obj.to_dict(orient="records")[:n]
+        return obj.iloc[:n].to_dict(orient="records")
+
+    @classmethod
+    def infer_schema_from_records(cls, records: DataFrame) -> Schema:
+        from snapflow.core.typing.inference import (
+            infer_schema_from_dataframe,
+            infer_schema_from_records,
+        )
+
+        if len(records) == 0:
+            # No rows, no fields (like an empty records list)
+            return infer_schema_from_records([])
+        # From column dtypes, only object columns look at (sampled) values
+        return infer_schema_from_dataframe(records)
 
     @classmethod
     def definitely_instance(cls, obj: Any) -> bool:
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+from snapflow.storage.data_formats.base import FileDataFormatBase
+
+
+class ParquetFileFormat(FileDataFormatBase):
+    pass
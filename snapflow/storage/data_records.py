@@ -26,8 +26,8 @@ class MemoryDataRecords:
     _raw_records_object: Any
     _data_format: Optional[DataFormat] = None
     _record_count: Optional[int] = None
-    # _closeable_resource: Optional[Any] = none  # TODO: when / how to use?
     nominal_schema: Optional[SchemaLike] = None
+    # Releases what backs the records object (eg the db connection of a cursor)
     closeable: Optional[Callable] = None
 
     @property
@@ -61,6 +61,7 @@ class MemoryDataRecords:
             _data_format=self._data_format,
             _record_count=self._record_count,
             nominal_schema=self.nominal_schema,
+            closeable=self.closeable,
         )
 
     @property
@@ -80,8 +81,15 @@ class MemoryDataRecords:
             _data_format=self._data_format,
             _record_count=self._record_count,
             nominal_schema=schema,
+            closeable=self.closeable,
         )
 
+    def close(self):
+        # Safe to call more than once
+        if self.closeable is not None:
+            closeable, self.closeable = self.closeable, None
+            closeable()
+
 
 def as_records(
     records_object: Any,
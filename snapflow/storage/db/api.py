@@ -3,18 +3,37 @@ from __future__ import annotations
 import json
 import os
 from contextlib import contextmanager
-from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple, Type
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 
 import sqlalchemy
 from loguru import logger
-from snapflow.core.typing.inference import infer_schema_from_db_table
+from snapflow.core.typing.inference import (
+    conform_records_to_schema,
+    infer_schema_from_db_table,
+)
 from snapflow.schema.base import Schema
 from snapflow.storage.data_formats.records import Records
 from snapflow.storage.db.schema import SchemaMapper
-from snapflow.storage.db.utils import conform_columns_for_insert
+from snapflow.storage.db.utils import conform_columns_for_insert, db_result_batcher
 from snapflow.storage.storage import Storage, StorageApi
 from snapflow.utils.common import SnapflowJSONEncoder, rand_str
-from snapflow.utils.data import conform_records_for_insert
+from snapflow.utils.data import (
+    conform_records_for_insert,
+    iterate_chunks,
+    read_csv,
+    write_csv,
+)
 from sqlalchemy import MetaData
 from sqlalchemy.engine import Connection, Engine, ResultProxy
 from sqlalchemy.exc import OperationalError, ProgrammingError
@@ -25,6 +44,10 @@ if TYPE_CHECKING:
 
 
 _sa_engines: Dict[str, Engine] = {}
+# Rows per insert when streaming a file into a table
+DEFAULT_INSERT_CHUNK_SIZE = 10000
+# Rows per fetch when streaming a query result
+DEFAULT_FETCH_CHUNK_SIZE = 1000
 
 
 def dispose_all(keyword: Optional[str] = None):
@@ -40,8 +63,10 @@ class DatabaseApi:
         self,
         url: str,
         json_serializer: Callable = None,
+        fetch_chunk_size: int = DEFAULT_FETCH_CHUNK_SIZE,
     ):
         self.url = url
+        self.fetch_chunk_size = fetch_chunk_size
         self.json_serializer = (
             json_serializer
             if json_serializer is not None
@@ -87,6 +112,21 @@ class DatabaseApi:
         with self.connection() as conn:
             yield conn.execute(sql)
 
+    @contextmanager
+    def stream_records(
+        self, sql: str, chunk_size: Optional[int] = None
+    ) -> Iterator[Iterator[Records]]:
+        with self.connection() as conn:
+            r = self.execute_streaming(conn, sql)
+            yield db_result_batcher(r, chunk_size or self.fetch_chunk_size)
+
+    def execute_streaming(self, conn: Connection, sql: str) -> ResultProxy:
+        # Server-side cursor where the driver supports one, so rows are only
+        # fetched from the server as they are consumed
+        logger.debug("Executing SQL:")
+        logger.debug(sql)
+        return conn.execution_options(stream_results=True).execute(sql)
+
     def ensure_table(self, name: str, schema: Schema) -> str:
         if self.exists(name):
             return name
@@ -125,6 +165,15 @@ class DatabaseApi:
     def copy(self, name: str, to_name: str):
         self.execute_sql(f"create table {to_name} as select * from {name}")
 
+    def get_queryable_name(self, name: str, from_api: DatabaseApi) -> Optional[str]:
+        """
+        Name to query table `name` of `from_api`'s database by from this database's
+        connection, or None if it isn't reachable from here.
+        """
+        if from_api.url == self.url:
+            return name
+        return None
+
     def rename_table(self, table_name: str, new_name: str):
         self.execute_sql(f"alter table {table_name} rename to {new_name}")
 
@@ -173,6 +222,37 @@ class DatabaseApi:
             return
         self._bulk_insert(name, records)
 
+    def bulk_insert_records_iterator(
+        self, name: str, records_iterator: Iterable[Records], schema: Schema
+    ):
+        self.ensure_table(name, schema=schema)
+        for records in records_iterator:
+            self.bulk_insert_records(name, records, schema)
+
+    def bulk_insert_delimited_file(
+        self,
+        name: str,
+        file_obj: IO,
+        schema: Schema,
+        chunk_size: int = DEFAULT_INSERT_CHUNK_SIZE,
+    ):
+        # Streams the file, so memory is bounded by `chunk_size` rows
+        records_iterator = (
+            conform_records_to_schema(records, schema)
+            for records in iterate_chunks(read_csv(file_obj), chunk_size)
+        )
+        self.bulk_insert_records_iterator(name, records_iterator, schema)
+
+    def export_delimited_file(
+        self, name: str, file_obj: IO, chunk_size: Optional[int] = None
+    ):
+        # Streams the table, so memory is bounded by `chunk_size` rows
+        with self.stream_records(f"select * from {name}", chunk_size) as chunks:
+            append = False
+            for records in chunks:
+                write_csv(records, file_obj, append=append)
+                append = append or bool(records)
+
     def _bulk_insert(self, table_name: str, records: Records):
         columns = conform_columns_for_insert(records)
         records = conform_records_for_insert(records, columns)
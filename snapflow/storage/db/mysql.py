@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from contextlib import contextmanager
-from typing import Dict, Iterator, List
+from typing import Dict, Iterator, List, Optional
 
 from snapflow.storage.db.api import (
     DatabaseApi,
@@ -13,6 +13,7 @@ from snapflow.storage.db.api import (
 from snapflow.storage.db.utils import conform_columns_for_insert
 from snapflow.utils.common import rand_str
 from snapflow.utils.data import conform_records_for_insert
+from sqlalchemy.engine.url import make_url
 
 MYSQL_SUPPORTED = False
 try:
@@ -27,6 +28,20 @@ class MysqlDatabaseApi(DatabaseApi):
     def dialect_is_supported(self) -> bool:
         return MYSQL_SUPPORTED
 
+    def get_queryable_name(self, name: str, from_api: DatabaseApi) -> Optional[str]:
+        # Databases on the same server can be queried across with `db`.`table`
+        url, from_url = make_url(self.url), make_url(from_api.url)
+        if (url.drivername, url.host, url.port, url.username) != (
+            from_url.drivername,
+            from_url.host,
+            from_url.port,
+            from_url.username,
+        ):
+            return None
+        if not from_url.database:
+            return name
+        return f"`{from_url.database}`.`{name}`"
+
     def _bulk_insert(self, table_name: str, records: List[Dict]):
         columns = conform_columns_for_insert(records)
         records = conform_records_for_insert(records, columns)
@@ -27,6 +27,21 @@ def db_result_batcher(result_proxy: ResultProxy, batch_size: int = 1000) -> Gene
             return
 
 
+def result_proxy_to_columns(
+    result_proxy: ResultProxy, batch_size: int = 1000
+) -> Dict[str, List]:
+    # Fetched in batches and transposed as we go, so rows don't all sit in memory
+    names = list(result_proxy.keys())
+    columns: List[List] = [[] for _ in names]
+    while True:
+        rows = result_proxy.fetchmany(batch_size)
+        if not rows:
+            break
+        for column, values in zip(columns, zip(*rows)):
+            column.extend(values)
+    return dict(zip(names, columns))
+
+
 def conform_columns_for_insert(
     records: Records,
     columns: List[str] = None,
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+from pandas import DataFrame
+from snapflow.schema.base import SchemaLike
+from snapflow.storage.data_formats import ArrowTableFormat, DataFormat, DataFrameFormat
+from snapflow.storage.data_records import MemoryDataRecords, as_records
+from snapflow.utils.arrow import ARROW_SUPPORTED, pa
+from snapflow.utils.common import rand_str
+
+RECORDS_SIZE_SAMPLE = 100
+
+
+def estimate_nbytes(mdr: MemoryDataRecords) -> int:
+    """
+    Rough in-memory size of a records object. Non-storable objects (iterators,
+    cursors) are 0: they can't be spilled, so they don't count against the budget.
+    """
+    if not mdr.data_format.is_storable():
+        return 0
+    obj = mdr.records_object
+    if isinstance(obj, DataFrame):
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if ArrowTableFormat.maybe_instance(obj):
+        return obj.nbytes
+    if isinstance(obj, list):
+        sample = obj[:RECORDS_SIZE_SAMPLE]
+        if not sample:
+            return sys.getsizeof(obj)
+        sample_bytes = sum(
+            sys.getsizeof(r)
+            + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in r.items())
+            for r in sample
+            if isinstance(r, dict)
+        )
+        return sys.getsizeof(obj) + sample_bytes * len(obj) // len(sample)
+    return sys.getsizeof(obj)
+
+
+@dataclass(frozen=True)
+class SpilledRecords:
+    path: str
+    data_format: DataFormat
+    record_count: Optional[int]
+    nominal_schema: Optional[SchemaLike]
+    is_arrow: bool
+
+
+def to_arrow_table(obj: Any, data_format: DataFormat) -> Optional[pa.Table]:
+    # Only objects arrow round-trips exactly: records and object columns (dicts,
+    # mixed types) would get types inferred from whatever values arrow sees first
+    if not ARROW_SUPPORTED:
+        return None
+    if data_format is ArrowTableFormat:
+        return obj
+    if data_format is DataFrameFormat and not any(
+        dtype == object for dtype in obj.dtypes
+    ):
+        return pa.Table.from_pandas(obj)
+    return None
+
+
+def from_arrow_table(table: pa.Table, data_format: DataFormat) -> Any:
+    if data_format is DataFrameFormat:
+        return table.to_pandas()
+    # Arrow tables stay memory-mapped
+    return table
+
+
+class LocalPythonStore:
+    """
+    Records objects of local python storages, keyed by path. With a `max_bytes`
+    budget, least recently used storable objects are spilled to `spill_dir` once
+    the budget is exceeded (as Arrow IPC files for arrow tables and DataFrames
+    without object columns, otherwise pickled)
+    and transparently loaded back on `get`.
+    """
+
+    def __init__(
+        self, max_bytes: Optional[int] = None, spill_dir: Optional[str] = None
+    ):
+        self.max_bytes = max_bytes
+        self.spill_dir = spill_dir
+        self._records: OrderedDict[str, MemoryDataRecords] = OrderedDict()
+        self._nbytes: Dict[str, int] = {}
+        self._spilled: Dict[str, SpilledRecords] = {}
+        self._lock = threading.RLock()
+
+    def configure(
+        self, max_bytes: Optional[int] = None, spill_dir: Optional[str] = None
+    ):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self.spill_dir = spill_dir
+            self._evict()
+
+    @property
+    def nbytes(self) -> int:
+        return sum(self._nbytes.values())
+
+    def is_spilled(self, pth: str) -> bool:
+        return pth in self._spilled
+
+    def get(self, pth: str) -> Optional[MemoryDataRecords]:
+        with self._lock:
+            mdr = self._records.get(pth)
+            if mdr is not None:
+                self._records.move_to_end(pth)
+                return mdr
+            spilled = self._spilled.pop(pth, None)
+            if spilled is None:
+                return None
+            mdr = self._load(spilled)
+            self._put(pth, mdr)
+            return mdr
+
+    def __setitem__(self, pth: str, mdr: MemoryDataRecords):
+        with self._lock:
+            self._discard_spilled(pth)
+            self._put(pth, mdr)
+
+    def __contains__(self, pth: str) -> bool:
+        return pth in self._records or pth in self._spilled
+
+    def pop(self, pth: str) -> Optional[MemoryDataRecords]:
+        # Returns None for spilled objects (nothing in memory to hand back)
+        with self._lock:
+            if pth in self._spilled:
+                self._discard_spilled(pth)
+                return None
+            self._nbytes.pop(pth, None)
+            return self._records.pop(pth)
+
+    def items(self) -> List[Tuple[str, MemoryDataRecords]]:
+        # In-memory objects only, spilled ones hold no open resources
+        with self._lock:
+            return list(self._records.items())
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+            self._nbytes.clear()
+            for pth in list(self._spilled):
+                self._discard_spilled(pth)
+
+    def _put(self, pth: str, mdr: MemoryDataRecords):
+        self._records[pth] = mdr
+        self._records.move_to_end(pth)
+        self._nbytes[pth] = estimate_nbytes(mdr) if self.max_bytes is not None else 0
+        self._evict(keep=pth)
+
+    def _evict(self, keep: Optional[str] = None):
+        if self.max_bytes is None:
+            return
+        total = self.nbytes
+        for pth in list(self._records):
+            if total <= self.max_bytes:
+                return
+            nbytes = self._nbytes.get(pth, 0)
+            if pth == keep or nbytes == 0:
+                continue
+            self._spill(pth)
+            total -= nbytes
+
+    def _spill(self, pth: str):
+        mdr = self._records.pop(pth)
+        self._nbytes.pop(pth, None)
+        spill_dir = self.spill_dir or tempfile.gettempdir()
+        path = os.path.join(spill_dir, f"_snapflow_spill_{rand_str(12)}")
+        table = None
+        try:
+            table = to_arrow_table(mdr.records_object, mdr.data_format)
+        except Exception as e:
+            # Eg mixed-type columns arrow can't represent
+            logger.debug(f"Can't spill {pth} as arrow, pickling: {e}")
+        if table is not None:
+            with pa.OSFile(path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        else:
+            with open(path, "wb") as f:
+                pickle.dump(mdr.records_object, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._spilled[pth] = SpilledRecords(
+            path=path,
+            data_format=mdr.data_format,
+            record_count=mdr._record_count,
+            nominal_schema=mdr.nominal_schema,
+            is_arrow=table is not None,
+        )
+        logger.debug(f"Spilled {pth} to {path}")
+
+    def _load(self, spilled: SpilledRecords) -> MemoryDataRecords:
+        if spilled.is_arrow:
+            # Memory-mapped: arrow buffers are paged in from disk as they're read
+            source = pa.memory_map(spilled.path, "r")
+            table = pa.ipc.open_file(source).read_all()
+            obj = from_arrow_table(table, spilled.data_format)
+        else:
+            with open(spilled.path, "rb") as f:
+                obj = pickle.load(f)
+        self._remove_file(spilled.path)
+        return as_records(
+            obj,
+            data_format=spilled.data_format,
+            record_count=spilled.record_count,
+            schema=spilled.nominal_schema,
+        )
+
+    def _discard_spilled(self, pth: str):
+        spilled = self._spilled.pop(pth, None)
+        if spilled is not None:
+            self._remove_file(spilled.path)
+
+    def _remove_file(self, path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            # Still mapped on platforms that don't allow unlinking open files
+            pass
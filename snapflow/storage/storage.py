@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import enum
 import os
+import threading
+from contextlib import contextmanager
 from copy import deepcopy
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Type, Union
 from urllib.parse import urlparse
 
 from loguru import logger
@@ -23,6 +25,7 @@ from snapflow.storage.data_formats import (
 )
 from snapflow.storage.data_formats.base import FileDataFormatBase, MemoryDataFormatBase
 from snapflow.storage.data_records import MemoryDataRecords
+from snapflow.storage.memory_store import LocalPythonStore
 from snapflow.utils.common import cf, rand_str
 from snapflow.utils.registry import ClassBasedEnum, global_registry
 
@@ -70,6 +73,20 @@ class FileSystemStorageClass(StorageClass):
         return FileSystemStorageApi
 
 
+def set_file_storage_natural_format(fmt: Optional[Union[DataFormat, str]]):
+    if fmt is None:
+        # Default
+        fmt = DelimitedFileFormat
+    if isinstance(fmt, str):
+        fmt_cls = global_registry.get(fmt)
+        if fmt_cls is None:
+            raise KeyError(f"Unknown data format {fmt}")
+        fmt = fmt_cls
+    if not issubclass(fmt, FileDataFormatBase):
+        raise TypeError(f"{fmt} is not a file format")
+    FileSystemStorageClass.natural_format = fmt
+
+
 class StorageEngine(ClassBasedEnum):
     storage_class: Type[StorageClass]
     schemes: List[str] = []
@@ -202,7 +219,26 @@ class StorageApi:
         raise NotImplementedError
 
 
-LOCAL_PYTHON_STORAGE: Dict[str, MemoryDataRecords] = {}  # TODO: global state...
+LOCAL_PYTHON_STORAGE = LocalPythonStore()  # TODO: global state...
+_thread_local = threading.local()
+
+
+@contextmanager
+def closing_local_records() -> Iterator[None]:
+    """
+    Close the closeable records (cursors, streams) put in local python storage by
+    this thread within the block, eg during a node run. Local python storage is
+    shared by concurrent runs, so records other runs are still reading stay open.
+    """
+    previous = getattr(_thread_local, "closeables", None)
+    closeables: List[MemoryDataRecords] = []
+    _thread_local.closeables = closeables
+    try:
+        yield
+    finally:
+        _thread_local.closeables = previous
+        for mdr in closeables:
+            mdr.close()
 
 
 def new_local_python_storage() -> Storage:
@@ -226,11 +262,22 @@ class PythonStorageApi(StorageApi):
 
     def remove(self, name: str):
         pth = self.get_path(name)
-        del LOCAL_PYTHON_STORAGE[pth]
+        mdr = LOCAL_PYTHON_STORAGE.pop(pth)
+        if mdr is not None:
+            mdr.close()
+
+    def close_all(self):
+        # Release resources (connections, cursors) held by any records in this storage
+        for pth, mdr in LOCAL_PYTHON_STORAGE.items():
+            if pth.startswith(self.storage.url):
+                mdr.close()
 
     def put(self, name: str, mdr: MemoryDataRecords):
         pth = self.get_path(name)
         LOCAL_PYTHON_STORAGE[pth] = mdr
+        closeables = getattr(_thread_local, "closeables", None)
+        if closeables is not None and mdr.closeable is not None:
+            closeables.append(mdr)
 
     def exists(self, name: str) -> bool:
         pth = self.get_path(name)
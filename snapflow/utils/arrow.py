@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from pandas import DataFrame
+
+ARROW_SUPPORTED = False
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    ARROW_SUPPORTED = True
+except ImportError:
+    pa = None
+    pq = None
+
+
+def ensure_arrow_supported():
+    if not ARROW_SUPPORTED:
+        raise ImportError("pyarrow not installed")
+
+
+def get_parquet_columns(
+    pf: pq.ParquetFile, columns: Optional[List[str]] = None
+) -> Optional[List[str]]:
+    # Only read the requested columns the file actually has (None reads all)
+    if columns is None:
+        return None
+    available = set(pf.schema_arrow.names)
+    return [c for c in columns if c in available]
+
+
+def read_parquet(path: str, columns: Optional[List[str]] = None) -> pa.Table:
+    ensure_arrow_supported()
+    pf = pq.ParquetFile(path)
+    return pf.read(columns=get_parquet_columns(pf, columns))
+
+
+def iterate_parquet_row_groups(
+    path: str, columns: Optional[List[str]] = None
+) -> Iterator[pa.Table]:
+    ensure_arrow_supported()
+    pf = pq.ParquetFile(path)
+    columns = get_parquet_columns(pf, columns)
+    for i in range(pf.num_row_groups):
+        yield pf.read_row_group(i, columns=columns)
+
+
+def arrow_schema_for_frame(
+    df: DataFrame, arrow_types: Optional[Dict[str, pa.DataType]] = None
+) -> pa.Schema:
+    # Known column types win over inferred ones: an all-null or all-int first
+    # frame would otherwise fix the wrong type for every later frame
+    arrow_types = arrow_types or {}
+    inferred = pa.Schema.from_pandas(df, preserve_index=False)
+    return pa.schema(
+        [pa.field(f.name, arrow_types.get(f.name, f.type)) for f in inferred],
+        metadata=inferred.metadata,
+    )
+
+
+def write_parquet(
+    path: str,
+    dfs: Iterable[DataFrame],
+    arrow_types: Optional[Dict[str, pa.DataType]] = None,
+):
+    """
+    Write each DataFrame as its own row group, under one arrow schema: columns
+    in `arrow_types` get that type, others the type arrow infers for them from
+    the first frame. With no frames the file is still written (with just the
+    `arrow_types` columns and no rows), so it can be read back.
+    """
+    ensure_arrow_supported()
+    writer: Optional[pq.ParquetWriter] = None
+    try:
+        for df in dfs:
+            if writer is None:
+                writer = pq.ParquetWriter(path, arrow_schema_for_frame(df, arrow_types))
+            table = pa.Table.from_pandas(df, schema=writer.schema, preserve_index=False)
+            writer.write_table(table)
+        if writer is None:
+            writer = pq.ParquetWriter(
+                path, pa.schema(list((arrow_types or {}).items()))
+            )
+    finally:
+        if writer is not None:
+            writer.close()
@@ -33,7 +33,14 @@ from snapflow.utils.typing import K, T, V
 
 
 class AttrDict(Dict[K, V]):
-    __getattr__ = dict.__getitem__
+    def __getattr__(self, name: str) -> V:
+        # AttributeError, not KeyError, so getattr defaults and pickle's
+        # `__getstate__` / `__reduce__` probes (python < 3.11) work
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
     __setattr__ = dict.__setitem__
 
 
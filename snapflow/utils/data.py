@@ -31,6 +31,17 @@ from sqlalchemy.engine.result import ResultProxy
 if TYPE_CHECKING:
     from snapflow.storage.data_formats import Records
 
+# Fastest available decoder, all accept str or bytes
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from ujson import loads as json_loads
+    except ImportError:
+        json_loads = json.loads
+
+DEFAULT_JSON_LINES_CHUNK_SIZE = 10000
+
 
 def records_as_dict_of_lists(dl: List[Dict]) -> Dict[str, List]:
     series: Dict[str, List] = {}
@@ -43,9 +54,12 @@ def records_as_dict_of_lists(dl: List[Dict]) -> Dict[str, List]:
     return series
 
 
-def is_nullish(
-    o: Any, null_strings=set(["None", "null", "na", "", "NULL", "NA", "N/A"])
-) -> bool:
+NULL_STRINGS = frozenset(["None", "null", "na", "", "NULL", "NA", "N/A"])
+
+DEFAULT_CSV_CHUNK_SIZE = 10000
+
+
+def is_nullish(o: Any, null_strings=NULL_STRINGS) -> bool:
     # TOOD: is "na" too aggressive?
     if o is None:
         return True
@@ -202,6 +216,24 @@ def read_json(j: str) -> Union[Dict, List]:
     return json.loads(j)  # TODO: de-serializer
 
 
+def read_json_lines(lines: Iterable[AnyStr]) -> Iterator[Dict]:
+    for ln in lines:
+        if ln.strip():
+            yield json_loads(ln)
+
+
+def iterate_json_lines_chunks(
+    lines: Iterable[AnyStr], chunk_size: int = DEFAULT_JSON_LINES_CHUNK_SIZE
+) -> Iterator[List[Dict]]:
+    for chunk in iterate_chunks(read_json_lines(lines), chunk_size):
+        if chunk:
+            yield chunk
+
+
+def write_json_lines(records: Iterable[Dict], file_like: IO):
+    file_like.writelines(json.dumps(r, cls=SnapflowJSONEncoder) + "\n" for r in records)
+
+
 def conform_records_for_insert(
     records: Records,
     columns: List[str],
@@ -1,13 +1,22 @@
 from __future__ import annotations
 
-from typing import List, Optional
+import csv
+from typing import IO, Dict, Iterator, List, Optional, Sequence
 
 import pandas as pd
 from pandas import DataFrame, Index, Series
 from pandas._testing import assert_almost_equal
+from pandas.errors import EmptyDataError
 from snapflow.schema.base import Schema
+from snapflow.schema.field_types import FieldType
 from snapflow.storage.data_formats import Records
-from snapflow.utils.data import is_nullish, records_as_dict_of_lists
+from snapflow.utils.data import (
+    DEFAULT_CSV_CHUNK_SIZE,
+    NULL_STRINGS,
+    SnapflowCsvDialect,
+    is_nullish,
+    records_as_dict_of_lists,
+)
 
 
 def sortable_columns(dtypes: Series) -> List[str]:
@@ -56,6 +65,40 @@ def records_to_dataframe(records: Records, schema: Schema) -> DataFrame:
     return conform_dataframe_to_schema(df, schema)
 
 
+def typed_series(values: Sequence, field_type: FieldType) -> Series:
+    pd_type = field_type.pandas_type
+    try:
+        if "datetime" in pd_type:
+            return Series(pd.to_datetime(values))
+        return Series(values, dtype=pd_type)
+    except (TypeError, ValueError):
+        # Not a real pandas dtype (eg "date") or values don't fit it
+        return Series(values, dtype=object)
+
+
+def columns_to_dataframe(
+    columns: Dict[str, Sequence], schema: Optional[Schema] = None
+) -> DataFrame:
+    """
+    Build a DataFrame straight from column values, typed from `schema` where
+    fields are known (no per-row dicts, no object columns to convert afterwards).
+    """
+    data = {}
+    for name, values in columns.items():
+        if schema is not None and name in schema.field_names():
+            data[name] = typed_series(values, schema.get_field(name).field_type)
+        else:
+            data[name] = Series(values)
+    return DataFrame(data, columns=list(columns))
+
+
+def rows_to_dataframe(
+    rows: Sequence[Sequence], column_names: List[str], schema: Optional[Schema] = None
+) -> DataFrame:
+    columns = zip(*rows) if rows else ([] for _ in column_names)
+    return columns_to_dataframe(dict(zip(column_names, columns)), schema)
+
+
 def dataframe_to_records(df: DataFrame, schema: Schema = None) -> Records:
     # TODO
     for c in df:
@@ -63,3 +106,49 @@ def dataframe_to_records(df: DataFrame, schema: Schema = None) -> Records:
         dfc.loc[pd.isna(dfc)] = None
         df[c] = dfc
     return df.to_dict(orient="records")
+
+
+def read_csv_chunks(
+    file_obj: IO,
+    chunk_size: int = DEFAULT_CSV_CHUNK_SIZE,
+    dialect=SnapflowCsvDialect,
+) -> Iterator[DataFrame]:
+    """
+    Parse delimited data with the pandas C engine, `chunk_size` rows at a time.
+    Like `snapflow.utils.data.read_csv`, values stay strings (typing is left to
+    schema conformance) and snapflow's null strings become nulls, whole columns at once.
+    Also like it, ragged rows are padded with nulls or truncated to the header,
+    and a repeated header keeps its last column.
+    """
+    # Header parsed here (not by pandas, which renames duplicates "a.1" etc)
+    try:
+        headers = next(csv.reader(file_obj, dialect=dialect))
+    except StopIteration:
+        return
+    try:
+        reader = pd.read_csv(
+            file_obj,
+            chunksize=chunk_size,
+            header=None,
+            names=range(len(headers)),
+            # Extra values dropped (not an error), never moved into an index
+            usecols=range(len(headers)),
+            index_col=False,
+            dtype=str,
+            keep_default_na=False,
+            na_values=list(NULL_STRINGS),
+            sep=dialect.delimiter,
+            quotechar=dialect.quotechar,
+            escapechar=dialect.escapechar,
+            doublequote=dialect.doublequote,
+            skipinitialspace=dialect.skipinitialspace,
+            engine="c",
+        )
+    except EmptyDataError:
+        return
+    keep = ~Index(headers).duplicated(keep="last")
+    for df in reader:
+        df.columns = headers
+        if not keep.all():
+            df = df.loc[:, keep].copy()
+        yield df
@@ -1,8 +1,14 @@
+import json
 import os
 
 from click.testing import CliRunner
 from snapflow.cli import app
 from snapflow.project.project import SNAPFLOW_PROJECT_FILE_NAME
+from snapflow.storage.data_copy import calibration
+from snapflow.storage.data_copy.memory_to_memory import (
+    copy_df_to_records,
+    copy_records_to_df,
+)
 from snapflow.storage.db.utils import get_tmp_sqlite_db_url
 
 
@@ -24,3 +30,24 @@ def test_app():
         assert result.exit_code == 0
         pth = os.path.join(os.getcwd(), SNAPFLOW_PROJECT_FILE_NAME)
         assert os.path.exists(pth)
+
+
+def test_calibrate(monkeypatch):
+    # Calibrate a couple of copiers only, timing every copier takes too long here
+    calibrate_data_copiers = calibration.calibrate_data_copiers
+    monkeypatch.setattr(
+        calibration,
+        "calibrate_data_copiers",
+        lambda record_count: calibrate_data_copiers(
+            record_count, copiers=[copy_records_to_df, copy_df_to_records]
+        ),
+    )
+    db_url = get_tmp_sqlite_db_url()
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(app, ["-m", db_url, "calibrate", "-n", "100"])
+        assert result.exit_code == 0
+        pth = os.path.join(os.getcwd(), "datacopy_calibration.json")
+        with open(pth) as f:
+            coefficients = json.load(f)
+        assert set(coefficients) == {copy_records_to_df.key, copy_df_to_records.key}
@@ -8,13 +8,18 @@ from typing import Optional, Type
 import pytest
 from snapflow.core.data_block import DataBlockMetadata, create_data_block_from_records
 from snapflow.storage.data_copy.base import (
+    BufferToBufferCost,
     Conversion,
     DataCopier,
+    MemoryToMemoryCost,
     NetworkToMemoryCost,
     NoOpCost,
     StorageFormat,
+    clear_datacopy_lookup_cache,
     datacopy,
     get_datacopy_lookup,
+    record_count_bucket,
+    set_copier_cost_coefficients,
 )
 from snapflow.storage.data_copy.database_to_memory import copy_db_to_records
 from snapflow.storage.data_copy.memory_to_database import copy_records_to_db
@@ -130,7 +135,7 @@ def test_data_copy_lookup():
                 StorageFormat(PostgresStorageEngine, DatabaseTableFormat),
                 StorageFormat(LocalPythonStorageEngine, DataFrameIteratorFormat),
             ),
-            2,  # DTF -> RIF -> DIF
+            1,
         ),
         (
             (
@@ -151,7 +156,35 @@ def test_data_copy_lookup():
                 StorageFormat(LocalFileSystemStorageEngine, DelimitedFileFormat),
                 StorageFormat(SqliteStorageEngine, DatabaseTableFormat),
             ),
-            3,  # file -> file obj -> records iter -> db table
+            1,  # Streamed straight into the table
+        ),
+        (
+            (
+                StorageFormat(LocalFileSystemStorageEngine, DelimitedFileFormat),
+                StorageFormat(LocalPythonStorageEngine, DataFrameIteratorFormat),
+            ),
+            1,
+        ),
+        (
+            (
+                StorageFormat(SqliteStorageEngine, DatabaseTableFormat),
+                StorageFormat(PostgresStorageEngine, DatabaseTableFormat),
+            ),
+            1,  # Streamed db to db, no round trip through memory
+        ),
+        (
+            (
+                StorageFormat(SqliteStorageEngine, DatabaseTableFormat),
+                StorageFormat(LocalFileSystemStorageEngine, DelimitedFileFormat),
+            ),
+            1,
+        ),
+        (
+            (
+                StorageFormat(LocalFileSystemStorageEngine, JsonLinesFileFormat),
+                StorageFormat(PostgresStorageEngine, DatabaseTableFormat),
+            ),
+            2,  # Streamed through a records iterator
         ),
     ],
 )
@@ -164,3 +197,57 @@ def test_conversion_costs(conversion: Conversion, length: Optional[int]):
         # for c in cp.conversions:
         #     print(f"{c.copier.copier_function} {c.conversion}")
         assert len(cp.conversions) == length
+
+
+def test_data_copy_lookup_cached():
+    clear_datacopy_lookup_cache()
+    lkup = get_datacopy_lookup()
+    assert get_datacopy_lookup() is lkup
+    assert get_datacopy_lookup(expected_record_count=10) is not lkup
+    assert (
+        get_datacopy_lookup(available_storage_engines={LocalPythonStorageEngine})
+        is not lkup
+    )
+    conversion = Conversion(
+        StorageFormat(LocalPythonStorageEngine, RecordsFormat),
+        StorageFormat(SqliteStorageEngine, DatabaseTableFormat),
+    )
+    assert lkup.get_lowest_cost_path(conversion) is lkup.get_lowest_cost_path(
+        conversion
+    )
+    clear_datacopy_lookup_cache()
+    assert get_datacopy_lookup() is not lkup
+
+
+def test_size_aware_copy_costs():
+    @datacopy(cost=MemoryToMemoryCost, unregistered=True)
+    def mem_copy(*args):
+        pass
+
+    @datacopy(cost=BufferToBufferCost, unregistered=True)
+    def buffer_copy(*args):
+        pass
+
+    conversion = Conversion(
+        StorageFormat(LocalPythonStorageEngine, RecordsIteratorFormat),
+        StorageFormat(LocalPythonStorageEngine, RecordsFormat),
+    )
+    copiers = [mem_copy, buffer_copy]
+    tiny = get_datacopy_lookup(copiers=copiers, expected_record_count=10)
+    large = get_datacopy_lookup(copiers=copiers, expected_record_count=10 ** 6)
+    assert tiny.get_lowest_cost(conversion) is mem_copy
+    assert large.get_lowest_cost(conversion) is buffer_copy
+    try:
+        set_copier_cost_coefficients({buffer_copy.key: 10 ** 5})
+        large = get_datacopy_lookup(copiers=copiers, expected_record_count=10 ** 6)
+        assert large.get_lowest_cost(conversion) is mem_copy
+    finally:
+        set_copier_cost_coefficients({})
+
+
+def test_record_count_bucket():
+    assert record_count_bucket(None) == 10000
+    assert record_count_bucket(0) == 1
+    assert record_count_bucket(7) == 10
+    assert record_count_bucket(100) == 100
+    assert record_count_bucket(101) == 1000
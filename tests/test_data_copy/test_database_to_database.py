@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from snapflow.core.data_block import (
+    DataBlockMetadata,
+    StoredDataBlockMetadata,
+    get_datablock_id,
+)
+from snapflow.core.storage import ensure_data_block_on_storage
+from snapflow.storage.data_copy.base import Conversion, StorageFormat
+from snapflow.storage.data_copy.database_to_database import copy_db_to_db
+from snapflow.storage.data_formats import DatabaseTableFormat
+from snapflow.storage.db.api import DatabaseStorageApi
+from snapflow.storage.db.utils import get_tmp_sqlite_db_url
+from snapflow.storage.storage import SqliteStorageEngine, Storage
+from tests.utils import TestSchema4, make_test_env
+
+records = [{"f1": "hi", "f2": 1}, {"f1": "bye", "f2": 2}]
+conversion = Conversion(
+    StorageFormat(SqliteStorageEngine, DatabaseTableFormat),
+    StorageFormat(SqliteStorageEngine, DatabaseTableFormat),
+)
+
+
+def test_db_to_db_same_database():
+    db_api: DatabaseStorageApi = Storage.from_url(get_tmp_sqlite_db_url()).get_api()
+    assert db_api.get_queryable_name("_test", db_api) == "_test"
+    db_api.bulk_insert_records("_test", records, TestSchema4)
+    copy_db_to_db.copy(
+        "_test", "_test_copy", conversion, db_api, db_api, schema=TestSchema4
+    )
+    with db_api.execute_sql_result("select * from _test_copy order by f2") as res:
+        assert [dict(r) for r in res] == records
+
+
+def test_db_to_db_streamed():
+    from_api: DatabaseStorageApi = Storage.from_url(get_tmp_sqlite_db_url()).get_api()
+    to_api: DatabaseStorageApi = Storage.from_url(get_tmp_sqlite_db_url()).get_api()
+    assert to_api.get_queryable_name("_test", from_api) is None
+    from_api.bulk_insert_records("_test", records, TestSchema4)
+    copy_db_to_db.copy("_test", "_test", conversion, from_api, to_api, TestSchema4)
+    with to_api.execute_sql_result("select * from _test order by f2") as res:
+        assert [dict(r) for r in res] == records
+
+
+def test_db_to_db_other_storage_same_format():
+    env = make_test_env()
+    from_storage = env.add_storage(get_tmp_sqlite_db_url())
+    to_storage = env.add_storage(get_tmp_sqlite_db_url())
+    block = DataBlockMetadata(
+        id=get_datablock_id(),
+        inferred_schema_key="_test.TestSchema4",
+        nominal_schema_key="_test.TestSchema4",
+        realized_schema_key="_test.TestSchema4",
+        record_count=len(records),
+    )
+    sdb = StoredDataBlockMetadata(
+        id=get_datablock_id(),
+        data_block_id=block.id,
+        data_block=block,
+        storage_url=from_storage.url,
+        data_format=DatabaseTableFormat,
+    )
+    with env.session_scope() as sess:
+        sess.add(block)
+        sess.add(sdb)
+        from_api: DatabaseStorageApi = from_storage.get_api()
+        from_api.bulk_insert_records(sdb.get_name(), records, TestSchema4)
+        to_sdb = ensure_data_block_on_storage(env, sess, block, to_storage)
+        assert to_sdb.storage_url == to_storage.url
+        assert to_sdb.data_format == DatabaseTableFormat
+        to_api: DatabaseStorageApi = to_storage.get_api()
+        with to_api.execute_sql_result(
+            f"select * from {to_sdb.get_name()} order by f2"
+        ) as res:
+            assert [dict(r) for r in res] == records
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import tempfile
+
+from snapflow.schema.base import create_quick_schema
+from snapflow.storage.data_copy.base import Conversion, StorageFormat
+from snapflow.storage.data_copy.database_to_file import copy_db_to_delim_file
+from snapflow.storage.data_formats import DatabaseTableFormat, DelimitedFileFormat
+from snapflow.storage.db.api import DatabaseStorageApi
+from snapflow.storage.db.postgres import PostgresDatabaseApi
+from snapflow.storage.file_system import FileSystemStorageApi
+from snapflow.storage.storage import Storage
+from snapflow.utils.data import is_boolish, read_csv
+from tests.utils import TestSchema4
+
+ExportSchema = create_quick_schema(
+    "ExportSchema",
+    [("t", "Text"), ("b", "Boolean"), ("i", "Integer")],
+    module_name="_test",
+)
+
+
+def test_db_to_file():
+    db_storage = Storage.from_url("sqlite://")
+    db_api: DatabaseStorageApi = db_storage.get_api()
+    fs_storage = Storage.from_url(f"file://{tempfile.gettempdir()}")
+    fs_api: FileSystemStorageApi = fs_storage.get_api()
+    name = "_test_db_to_file"
+    records = [{"f1": "hi", "f2": 1}, {"f1": None, "f2": 2}]
+    db_api.bulk_insert_records(name, records, TestSchema4)
+    conversion = Conversion(
+        StorageFormat(db_storage.storage_engine, DatabaseTableFormat),
+        StorageFormat(fs_storage.storage_engine, DelimitedFileFormat),
+    )
+    copy_db_to_delim_file.copy(
+        name, name, conversion, db_api, fs_api, schema=TestSchema4
+    )
+    with fs_api.open(name) as f:
+        assert f.read() == "f1,f2\nhi,1\n,2\n"
+
+
+def test_postgres_db_to_file_reads_back():
+    if not PostgresDatabaseApi("postgresql://localhost").dialect_is_supported():
+        return
+    fs_storage = Storage.from_url(f"file://{tempfile.mkdtemp()}")
+    fs_api: FileSystemStorageApi = fs_storage.get_api()
+    name = "_test_postgres_db_to_file"
+    records = [
+        {"t": "a\\b", "b": True, "i": 1},
+        {"t": 'say "hi", \\"bye\\"', "b": False, "i": 2},
+        {"t": "x\ny", "b": None, "i": 3},
+    ]
+    with PostgresDatabaseApi.temp_local_database() as db_url:
+        db_storage = Storage.from_url(db_url)
+        db_api: DatabaseStorageApi = db_storage.get_api()
+        db_api.bulk_insert_records(name, records, ExportSchema)
+        conversion = Conversion(
+            StorageFormat(db_storage.storage_engine, DatabaseTableFormat),
+            StorageFormat(fs_storage.storage_engine, DelimitedFileFormat),
+        )
+        copy_db_to_delim_file.copy(
+            name, name, conversion, db_api, fs_api, schema=ExportSchema
+        )
+    with fs_api.open(name) as f:
+        read = list(read_csv(f))
+    assert read == [
+        {"t": "a\\b", "b": "true", "i": "1"},
+        {"t": 'say "hi", \\"bye\\"', "b": "false", "i": "2"},
+        {"t": "x\ny", "b": None, "i": "3"},
+    ]
+    assert all(is_boolish(r["b"]) for r in read[:2])
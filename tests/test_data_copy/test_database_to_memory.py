@@ -18,6 +18,8 @@ from snapflow.storage.data_copy.base import (
 )
 from snapflow.storage.data_copy.database_to_memory import (
     copy_db_to_cursor,
+    copy_db_to_df,
+    copy_db_to_df_iterator,
     copy_db_to_records,
     copy_db_to_records_iterator,
 )
@@ -97,3 +99,33 @@ def test_db_to_mem(url):
             assert list(mem_api.get(name).records_object) == [(1, 2)]
         finally:
             mem_api.get(name).closeable()
+
+
+def test_db_to_df():
+    api: DatabaseStorageApi = Storage.from_url("sqlite://").get_api()
+    mem_api: PythonStorageApi = new_local_python_storage().get_api()
+    name = "_test_db_to_df"
+    api.bulk_insert_records(
+        name, [{"f1": "hi", "f2": 1}, {"f1": None, "f2": None}], TestSchema4
+    )
+    conversion = Conversion(
+        StorageFormat(api.storage.storage_engine, DatabaseTableFormat),
+        StorageFormat(LocalPythonStorageEngine, DataFrameFormat),
+    )
+    copy_db_to_df.copy(name, name, conversion, api, mem_api, schema=TestSchema4)
+    df = mem_api.get(name).records_object
+    assert df["f2"].dtype.name == "Int64"
+    assert df["f1"].dtype.name == "string"
+    assert df["f1"][0] == "hi"
+    assert df["f2"].isna().tolist() == [False, True]
+    # DataFrame iterator
+    conversion = Conversion(
+        StorageFormat(api.storage.storage_engine, DatabaseTableFormat),
+        StorageFormat(LocalPythonStorageEngine, DataFrameIteratorFormat),
+    )
+    copy_db_to_df_iterator.copy(
+        name, name, conversion, api, mem_api, schema=TestSchema4
+    )
+    dfs = list(mem_api.get(name).records_object)
+    assert len(dfs) == 1
+    assert dfs[0]["f2"].dtype.name == "Int64"
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import tempfile
+from typing import Type
+
+import pytest
+from snapflow.schema.base import create_quick_schema
+from snapflow.storage.data_copy.base import Conversion, StorageFormat
+from snapflow.storage.data_copy.file_to_database import copy_delim_file_to_db
+from snapflow.storage.data_formats import DatabaseTableFormat, DelimitedFileFormat
+from snapflow.storage.db.api import DatabaseApi, DatabaseStorageApi
+from snapflow.storage.file_system import FileSystemStorageApi
+from snapflow.storage.storage import Storage
+from tests.utils import TestSchema4
+
+NumbersSchema = create_quick_schema(
+    "NumbersSchema", [("a", "Integer"), ("b", "Float")], module_name="_test"
+)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "sqlite://",
+        "postgresql://localhost",
+        "mysql://",
+    ],
+)
+def test_file_to_db(url):
+    s: Storage = Storage.from_url(url)
+    api_cls: Type[DatabaseApi] = s.storage_engine.get_api_cls()
+    if not s.get_api().dialect_is_supported():
+        return
+    fs_storage = Storage.from_url(f"file://{tempfile.gettempdir()}")
+    fs_api: FileSystemStorageApi = fs_storage.get_api()
+    name = "_test_file_to_db"
+    fs_api.write_lines_to_file(
+        name, ["f1,f2", "hi,1", "bye,2", ",3", "NA,4", "null,5", "a\\b,6"]
+    )
+    with api_cls.temp_local_database() as db_url:
+        db_api: DatabaseStorageApi = Storage.from_url(db_url).get_api()
+        conversion = Conversion(
+            StorageFormat(fs_storage.storage_engine, DelimitedFileFormat),
+            StorageFormat(s.storage_engine, DatabaseTableFormat),
+        )
+        copy_delim_file_to_db.copy(
+            name, name, conversion, fs_api, db_api, schema=TestSchema4
+        )
+        with db_api.execute_sql_result(f"select * from {name} order by f2") as res:
+            assert [dict(r) for r in res] == [
+                {"f1": "hi", "f2": 1},
+                {"f1": "bye", "f2": 2},
+                {"f1": None, "f2": 3},
+                {"f1": None, "f2": 4},
+                {"f1": None, "f2": 5},
+                {"f1": "ab", "f2": 6},
+            ]
+        # Without text columns postgres parses the file itself
+        numbers_name = name + "_numbers"
+        fs_api.write_lines_to_file(numbers_name, ["a,b", "1,1.5", ",2.5", "NA,3.5"])
+        copy_delim_file_to_db.copy(
+            numbers_name,
+            numbers_name,
+            conversion,
+            fs_api,
+            db_api,
+            schema=NumbersSchema,
+        )
+        with db_api.execute_sql_result(
+            f"select * from {numbers_name} order by b"
+        ) as res:
+            assert [dict(r) for r in res] == [
+                {"a": 1, "b": 1.5},
+                {"a": None, "b": 2.5},
+                {"a": None, "b": 3.5},
+            ]
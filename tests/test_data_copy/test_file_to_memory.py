@@ -2,9 +2,33 @@ from __future__ import annotations
 
 import tempfile
 
+from pandas import DataFrame
+from snapflow.schema.base import create_quick_schema
 from snapflow.storage.data_copy.base import Conversion, StorageFormat
-from snapflow.storage.data_copy.file_to_memory import copy_delim_file_to_records
-from snapflow.storage.data_formats import DelimitedFileFormat, RecordsFormat
+from snapflow.storage.data_copy.file_to_memory import (
+    copy_delim_file_to_df_iterator,
+    copy_delim_file_to_records,
+    copy_delim_file_to_records_iterator,
+    copy_json_lines_file_to_df_iterator,
+    copy_json_lines_file_to_records,
+    copy_json_lines_file_to_records_iterator,
+    copy_parquet_file_to_df_iterator,
+    copy_parquet_file_to_records,
+)
+from snapflow.storage.data_copy.memory_to_file import (
+    copy_df_to_parquet_file,
+    copy_records_to_json_lines_file,
+    copy_records_to_parquet_file,
+)
+from snapflow.storage.data_formats import (
+    DataFrameIteratorFormat,
+    DelimitedFileFormat,
+    JsonLinesFileFormat,
+    ParquetFileFormat,
+    RecordsFormat,
+    RecordsIteratorFormat,
+)
+from snapflow.storage.data_records import as_records
 from snapflow.storage.file_system import FileSystemStorageApi
 from snapflow.storage.storage import (
     LocalPythonStorageEngine,
@@ -12,8 +36,13 @@ from snapflow.storage.storage import (
     Storage,
     new_local_python_storage,
 )
+from snapflow.utils.arrow import ARROW_SUPPORTED
 from tests.utils import TestSchema4
 
+ParquetSchema = create_quick_schema(
+    "ParquetSchema", [("a", "Text"), ("b", "Float")], module_name="_test"
+)
+
 
 def test_file_to_mem():
     dr = tempfile.gettempdir()
@@ -32,3 +61,148 @@ def test_file_to_mem():
         name, name, conversion, fs_api, mem_api, schema=TestSchema4
     )
     assert mem_api.get(name).records_object == records_obj
+    # Records iterator
+    conversion = Conversion(
+        StorageFormat(s.storage_engine, DelimitedFileFormat),
+        StorageFormat(LocalPythonStorageEngine, RecordsIteratorFormat),
+    )
+    copy_delim_file_to_records_iterator.copy(
+        name, name, conversion, fs_api, mem_api, schema=TestSchema4
+    )
+    assert list(mem_api.get(name).records_object) == [records_obj]
+    # DataFrame iterator
+    conversion = Conversion(
+        StorageFormat(s.storage_engine, DelimitedFileFormat),
+        StorageFormat(LocalPythonStorageEngine, DataFrameIteratorFormat),
+    )
+    copy_delim_file_to_df_iterator.copy(
+        name, name, conversion, fs_api, mem_api, schema=TestSchema4
+    )
+    dfs = list(mem_api.get(name).records_object)
+    assert [len(df) for df in dfs] == [1]
+    mem_api.close_all()
+
+
+def test_parquet_file_to_mem():
+    if not ARROW_SUPPORTED:
+        return
+    s: Storage = Storage.from_url(f"file://{tempfile.mkdtemp()}")
+    fs_api: FileSystemStorageApi = s.get_api()
+    mem_api: PythonStorageApi = new_local_python_storage().get_api()
+    name = "_test"
+    records = [{"f1": "hi", "f2": 1}, {"f1": "bye", "f2": 2}]
+    mem_api.put(name, as_records(iter([records[:1], records[1:]])))
+    conversion = Conversion(
+        StorageFormat(LocalPythonStorageEngine, RecordsIteratorFormat),
+        StorageFormat(s.storage_engine, ParquetFileFormat),
+    )
+    copy_records_to_parquet_file.copy(
+        name, name, conversion, mem_api, fs_api, schema=TestSchema4
+    )
+    # Records
+    conversion = Conversion(
+        StorageFormat(s.storage_engine, ParquetFileFormat),
+        StorageFormat(LocalPythonStorageEngine, RecordsFormat),
+    )
+    copy_parquet_file_to_records.copy(
+        name, name, conversion, fs_api, mem_api, schema=TestSchema4
+    )
+    assert mem_api.get(name).records_object == records
+    # One DataFrame per row group
+    conversion = Conversion(
+        StorageFormat(s.storage_engine, ParquetFileFormat),
+        StorageFormat(LocalPythonStorageEngine, DataFrameIteratorFormat),
+    )
+    copy_parquet_file_to_df_iterator.copy(
+        name, name, conversion, fs_api, mem_api, schema=TestSchema4
+    )
+    dfs = list(mem_api.get(name).records_object)
+    assert [len(df) for df in dfs] == [1, 1]
+
+
+def test_parquet_file_types_from_schema():
+    if not ARROW_SUPPORTED:
+        return
+    s: Storage = Storage.from_url(f"file://{tempfile.mkdtemp()}")
+    fs_api: FileSystemStorageApi = s.get_api()
+    mem_api: PythonStorageApi = new_local_python_storage().get_api()
+    to_file = Conversion(
+        StorageFormat(LocalPythonStorageEngine, DataFrameIteratorFormat),
+        StorageFormat(s.storage_engine, ParquetFileFormat),
+    )
+    to_records = Conversion(
+        StorageFormat(s.storage_engine, ParquetFileFormat),
+        StorageFormat(LocalPythonStorageEngine, RecordsFormat),
+    )
+    # First frame's columns are all null / ints, later ones text / floats
+    dfs = [
+        DataFrame({"a": [None], "b": [1]}),
+        DataFrame({"a": ["hi"], "b": [1.5]}),
+    ]
+    mem_api.put("_test", as_records(iter(dfs)))
+    copy_df_to_parquet_file.copy(
+        "_test", "_test", to_file, mem_api, fs_api, schema=ParquetSchema
+    )
+    copy_parquet_file_to_records.copy(
+        "_test", "_test", to_records, fs_api, mem_api, schema=ParquetSchema
+    )
+    assert mem_api.get("_test").records_object == [
+        {"a": None, "b": 1.0},
+        {"a": "hi", "b": 1.5},
+    ]
+    # No frames still writes a file to read back
+    mem_api.put("_empty", as_records(iter([]), data_format=DataFrameIteratorFormat))
+    copy_df_to_parquet_file.copy(
+        "_empty", "_empty", to_file, mem_api, fs_api, schema=ParquetSchema
+    )
+    copy_parquet_file_to_records.copy(
+        "_empty", "_empty", to_records, fs_api, mem_api, schema=ParquetSchema
+    )
+    assert mem_api.get("_empty").records_object == []
+
+
+def test_json_lines_file_to_mem():
+    s: Storage = Storage.from_url(f"file://{tempfile.mkdtemp()}")
+    fs_api: FileSystemStorageApi = s.get_api()
+    mem_api: PythonStorageApi = new_local_python_storage().get_api()
+    name = "_test"
+    records = [{"f1": "hi", "f2": 1}, {"f1": "bye", "f2": 2}]
+    mem_api.put(name, as_records(iter([records[:1], records[1:]])))
+    conversion = Conversion(
+        StorageFormat(LocalPythonStorageEngine, RecordsIteratorFormat),
+        StorageFormat(s.storage_engine, JsonLinesFileFormat),
+    )
+    copy_records_to_json_lines_file.copy(
+        name, name, conversion, mem_api, fs_api, schema=TestSchema4
+    )
+    with fs_api.open(name) as f:
+        assert f.read() == '{"f1": "hi", "f2": 1}\n{"f1": "bye", "f2": 2}\n'
+    # Records
+    conversion = Conversion(
+        StorageFormat(s.storage_engine, JsonLinesFileFormat),
+        StorageFormat(LocalPythonStorageEngine, RecordsFormat),
+    )
+    copy_json_lines_file_to_records.copy(
+        name, name, conversion, fs_api, mem_api, schema=TestSchema4
+    )
+    assert mem_api.get(name).records_object == records
+    # Records iterator
+    conversion = Conversion(
+        StorageFormat(s.storage_engine, JsonLinesFileFormat),
+        StorageFormat(LocalPythonStorageEngine, RecordsIteratorFormat),
+    )
+    copy_json_lines_file_to_records_iterator.copy(
+        name, name, conversion, fs_api, mem_api, schema=TestSchema4
+    )
+    assert list(mem_api.get(name).records_object) == [records]
+    # DataFrame iterator
+    conversion = Conversion(
+        StorageFormat(s.storage_engine, JsonLinesFileFormat),
+        StorageFormat(LocalPythonStorageEngine, DataFrameIteratorFormat),
+    )
+    copy_json_lines_file_to_df_iterator.copy(
+        name, name, conversion, fs_api, mem_api, schema=TestSchema4
+    )
+    dfs = list(mem_api.get(name).records_object)
+    assert [len(df) for df in dfs] == [2]
+    mem_api.close_all()
@@ -21,6 +21,7 @@ from snapflow.storage.data_copy.base import (
 from snapflow.storage.data_copy.database_to_memory import copy_db_to_records
 from snapflow.storage.data_copy.memory_to_database import copy_records_to_db
 from snapflow.storage.data_formats import (
+    ArrowTableFormat,
     DatabaseCursorFormat,
     DatabaseTableFormat,
     DatabaseTableRefFormat,
@@ -48,6 +49,7 @@ from snapflow.storage.storage import (
     clear_local_storage,
     new_local_python_storage,
 )
+from snapflow.utils.arrow import ARROW_SUPPORTED
 from snapflow.utils.pandas import assert_dataframes_are_almost_equal
 from tests.utils import TestSchema1, TestSchema4
 
@@ -98,3 +100,30 @@ def test_record_count():
     for fmt, obj in [rf, dff]:
         cnt = fmt.get_record_count(obj())
         assert cnt == 2
+
+
+def test_arrow_table_format():
+    if not ARROW_SUPPORTED:
+        return
+    import pyarrow as pa
+
+    table = pa.Table.from_pylist(records)
+    assert ArrowTableFormat.definitely_instance(table)
+    assert ArrowTableFormat.get_record_count(table) == 2
+    schema = ArrowTableFormat.infer_schema_from_records(table)
+    assert [(f.name, f.field_type.name) for f in schema.fields] == [
+        ("f1", "Text"),
+        ("f2", "Integer"),
+    ]
+    mem_api: PythonStorageApi = new_local_python_storage().get_api()
+    mem_api.put("_test", as_records(table, data_format=ArrowTableFormat))
+    conversion = Conversion(
+        StorageFormat(LocalPythonStorageEngine, ArrowTableFormat),
+        StorageFormat(LocalPythonStorageEngine, DataFrameFormat),
+    )
+    pth = get_datacopy_lookup().get_lowest_cost_path(conversion)
+    assert len(pth.conversions) == 1
+    pth.conversions[0].copier.copy(
+        "_test", "_test_df", conversion, mem_api, mem_api, schema=TestSchema4
+    )
+    assert_dataframes_are_almost_equal(mem_api.get("_test_df").records_object, dff[1]())
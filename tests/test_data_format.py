@@ -20,6 +20,7 @@ from snapflow.storage.data_formats.delimited_file_object import (
     DelimitedFileObjectFormat,
     DelimitedFileObjectIteratorFormat,
 )
+from snapflow.storage.data_records import as_records
 
 # Example formats
 df = pd.DataFrame({"a": range(10)})
@@ -91,3 +92,30 @@ def test_not_maybe_is_instance():
     for obj, formats in maybe_instances:
         for fmt in formats:
             assert not fmt.maybe_instance(obj)
+
+
+def test_dataframe_schema_inference():
+    n = 1000
+    big_df = pd.DataFrame(
+        {
+            "i": range(n),
+            "f": [i / 2 for i in range(n)],
+            "s": ["hi"] * n,
+            "d": pd.date_range("2020-01-01", periods=n),
+            "j": [{"a": i} for i in range(n)],
+        }
+    )
+    schema = DataFrameFormat.infer_schema_from_records(big_df)
+    assert {f.name: f.field_type.name for f in schema.fields} == {
+        "i": "Integer",
+        "f": "Float",
+        "s": "Text",
+        "d": "DateTime",
+        "j": "JSON",
+    }
+    assert DataFrameFormat.infer_schema_from_records(big_df.iloc[:0]).fields == []
+    # Iterators infer from their first chunk only
+    dfs = as_records(iter([big_df, pd.DataFrame({"x": ["y"]})]))
+    schema = DataFrameIteratorFormat.infer_schema_from_records(dfs.records_object)
+    assert schema.field_names() == ["i", "f", "s", "d", "j"]
+    assert len(list(dfs.records_object)) == 2
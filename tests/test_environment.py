@@ -22,3 +22,31 @@ def test_env_init():
         env.add_storage("postgresql://test")
         assert len(env.storages) == 2  # added plus default local memory
         assert len(env.runtimes) == 2  # added plus default local python
+
+
+def test_env_global_settings_reset(tmp_path):
+    from snapflow.storage.data_copy import base
+    from snapflow.storage.data_formats import DelimitedFileFormat, ParquetFileFormat
+    from snapflow.storage.storage import (
+        LOCAL_PYTHON_STORAGE,
+        LocalFileSystemStorageEngine,
+    )
+
+    pth = str(tmp_path / "calibration.json")
+    base.save_copier_cost_coefficients(pth, {"copier": 2.0})
+    Environment(
+        metadata_storage="sqlite://",
+        settings={
+            "DATACOPY_CALIBRATION_PATH": pth,
+            "FILE_STORAGE_FORMAT": "ParquetFileFormat",
+            "LOCAL_STORAGE_MAX_BYTES": 10 ** 9,
+        },
+    )
+    assert base.copier_cost_coefficients == {"copier": 2.0}
+    assert LocalFileSystemStorageEngine.get_natural_format() is ParquetFileFormat
+    assert LOCAL_PYTHON_STORAGE.max_bytes == 10 ** 9
+    # Unset settings go back to their defaults, not the last env's
+    Environment(metadata_storage="sqlite://")
+    assert base.copier_cost_coefficients == {}
+    assert LocalFileSystemStorageEngine.get_natural_format() is DelimitedFileFormat
+    assert LOCAL_PYTHON_STORAGE.max_bytes is None
@@ -1,25 +1,34 @@
 from __future__ import annotations
 
-from typing import Optional
+import pickle
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
 
 import pandas as pd
 import pytest
 from loguru import logger
 from pandas import DataFrame
 from snapflow.core.data_block import Alias, DataBlock, DataBlockMetadata
+from snapflow.core.environment import Environment
 from snapflow.core.execution import (
     CompiledSnap,
     Executable,
     ExecutionManager,
     ExecutionSession,
+    MetadataWriteBuffer,
     Worker,
 )
 from snapflow.core.graph import Graph
 from snapflow.core.node import DataBlockLog, Direction, SnapLog
 from snapflow.core.snap import Input
 from snapflow.core.snap_interface import NodeInterfaceManager
+from snapflow.core.streams import DataBlockStream
 from snapflow.modules import core
-from snapflow.storage.data_formats import Records
+from snapflow.storage.data_formats import Records, RecordsIterator
+from snapflow.storage.db.postgres import PostgresDatabaseApi
+from snapflow.storage.db.utils import get_tmp_sqlite_db_url
+from snapflow.storage.storage import Storage
 from tests.utils import (
     TestSchema1,
     TestSchema4,
@@ -42,6 +51,10 @@ def snap_error() -> Records[TestSchema4]:
     raise Exception("snap FAIL")
 
 
+def snap_union(input1: DataBlock, input2: DataBlock) -> Records[TestSchema4]:
+    return input1.as_records() + input2.as_records()
+
+
 def test_worker():
     env = make_test_env()
     g = Graph(env)
@@ -140,3 +153,205 @@ def test_non_terminating_snap_with_reference_input():
     output = em.execute(source, to_exhaustion=True)
     output = em.execute(node, to_exhaustion=True)
     assert output is None
+
+
+@contextmanager
+def concurrent_test_env() -> Iterator[Optional[Environment]]:
+    # sqlite metadata storage always runs serially, so concurrent runs need postgres
+    if not PostgresDatabaseApi("postgresql://localhost").dialect_is_supported():
+        yield None
+        return
+    with PostgresDatabaseApi.temp_local_database() as db_url:
+        env = make_test_env(metadata_storage=Storage.from_url(db_url))
+        try:
+            yield env
+        finally:
+            env.clean_up_db_sessions()
+
+
+def test_sqlite_metadata_runs_serially():
+    env = make_test_env()
+    assert env._get_max_workers(4) == 1
+    assert not env._supports_concurrency()
+
+
+def test_concurrent_execution():
+    # Both sources must be running at the same time to get past the barrier
+    barrier = threading.Barrier(2, timeout=5)
+
+    def source1() -> Records[TestSchema4]:
+        barrier.wait()
+        return [{"f1": "a", "f2": 1}]
+
+    def source2() -> Records[TestSchema4]:
+        barrier.wait()
+        return [{"f1": "b", "f2": 2}]
+
+    def union(input1: DataBlock, input2: DataBlock) -> Records[TestSchema4]:
+        return input1.as_records() + input2.as_records()
+
+    with concurrent_test_env() as env:
+        if env is None:
+            return
+        g = Graph(env)
+        n1 = g.create_node(key="source1", snap=source1)
+        n2 = g.create_node(key="source2", snap=source2)
+        g.create_node(key="union", snap=union, inputs={"input1": n1, "input2": n2})
+        output = env.produce("union", g, max_workers=2)
+        assert sorted(r["f1"] for r in output.as_records()) == ["a", "b"]
+        with env.session_scope() as sess:
+            assert sess.query(SnapLog).count() == 3
+            assert sess.query(SnapLog).filter(SnapLog.error.isnot(None)).count() == 0
+
+
+def test_pipelined_execution():
+    # Source only continues once downstream has received its first block
+    first_block_received = threading.Event()
+
+    def source() -> RecordsIterator[TestSchema4]:
+        yield [{"f1": "a", "f2": 1}]
+        assert first_block_received.wait(5)
+        yield [{"f1": "b", "f2": 2}]
+        yield [{"f1": "c", "f2": 3}]
+
+    def collect(input: DataBlockStream) -> Records[TestSchema4]:
+        records = []
+        for block in input:
+            first_block_received.set()
+            records.extend(block.as_records())
+        return records
+
+    with concurrent_test_env() as env:
+        if env is None:
+            return
+        g = Graph(env)
+        n1 = g.create_node(key="source", snap=source)
+        g.create_node(key="collect", snap=collect, input=n1)
+        output = env.produce("collect", g, pipelined=True)
+        assert [r["f1"] for r in output.as_records()] == ["a", "b", "c"]
+        with env.session_scope() as sess:
+            assert (
+                sess.query(DataBlockLog)
+                .filter(DataBlockLog.direction == Direction.INPUT)
+                .count()
+                == 3
+            )
+
+
+def test_executable_is_picklable():
+    env = make_test_env()
+    g = Graph(env)
+    node = g.create_node(key="node", snap=snap_dl_source, params={"a": 1})
+    ec = env.get_run_context(g)
+    exe = Executable(node.key, CompiledSnap(node.snap.key, node.snap), params={"a": 1})
+    exe2 = pickle.loads(pickle.dumps(exe))
+    assert exe2.node_key == exe.node_key
+    assert exe2.compiled_snap.snap.snap_callable is snap_dl_source
+    assert exe2.bound_interface is None
+    ec2 = pickle.loads(pickle.dumps(ec))
+    assert ec2.env.metadata_storage.url == env.metadata_storage.url
+    assert ec2.graph.get_node("node").params == {"a": 1}
+    with ec2.env.session_scope() as sess:
+        assert sess.query(SnapLog).count() == 0
+
+
+def test_process_pool_execution():
+    env = make_test_env()
+    target = env.add_storage(get_tmp_sqlite_db_url())
+    g = Graph(env)
+    n1 = g.create_node(key="source1", snap=snap_dl_source)
+    n2 = g.create_node(key="source2", snap=snap_dl_source)
+    g.create_node(key="union", snap=snap_union, inputs={"input1": n1, "input2": n2})
+    output = env.produce(
+        "union", g, target_storage=target, max_workers=2, use_processes=True
+    )
+    records = output.as_records()
+    assert len(records) == 4
+    assert [r["f1"] for r in records] == ["2", None, "2", None]
+    with env.session_scope() as sess:
+        assert sess.query(SnapLog).count() == 3
+        assert sess.query(SnapLog).filter(SnapLog.error.isnot(None)).count() == 0
+    with env.run(g) as em:
+        with pytest.raises(ValueError):
+            em.execute_nodes(
+                g.get_all_nodes_in_execution_order(),
+                pipelined=True,
+                use_processes=True,
+            )
+
+
+def snap_chunks() -> RecordsIterator[TestSchema4]:
+    for i in range(5):
+        yield [{"f1": f"chunk{i}", "f2": i}]
+
+
+def snap_passthrough(input: DataBlockStream) -> RecordsIterator[TestSchema4]:
+    for block in input:
+        yield block.as_records()
+
+
+@pytest.mark.parametrize("max_rows", [1, 1000])
+def test_buffered_metadata_writes(max_rows: int):
+    env = make_test_env(settings={"METADATA_BUFFER_MAX_ROWS": max_rows})
+    g = Graph(env)
+    source = g.create_node(key="source", snap=snap_chunks)
+    g.create_node(key="sink", snap=snap_passthrough, input=source)
+    output = env.produce("sink", g)
+    assert output.as_records() == [{"f1": "chunk4", "f2": 4}]
+    with env.session_scope() as sess:
+        source_log, sink_log = sess.query(SnapLog).order_by(SnapLog.id).all()
+        source_outputs = [
+            d.data_block_id
+            for d in source_log.data_block_logs
+            if d.direction == Direction.OUTPUT
+        ]
+        assert len(source_outputs) == 5
+        # One sink run consumes the whole stream: each input is logged once, even
+        # though its logs are written again on every emit
+        sink_inputs = [
+            d.data_block_id
+            for d in sink_log.data_block_logs
+            if d.direction == Direction.INPUT
+        ]
+        assert sorted(sink_inputs) == sorted(source_outputs)
+        sink_outputs = [
+            d.data_block_id
+            for d in sink_log.data_block_logs
+            if d.direction == Direction.OUTPUT
+        ]
+        assert len(sink_outputs) == 5
+        assert sess.query(DataBlockLog).count() == 15
+        alias = sess.query(Alias).filter(Alias.alias == source.get_alias()).one()
+        assert alias.data_block_id == max(source_outputs)
+
+
+def test_metadata_write_buffer_flushes_at_max_rows():
+    env = make_test_env()
+    g = Graph(env)
+    with env.session_scope() as sess:
+        node = g.create_node(key="node", snap=snap_dl_source)
+        pl = SnapLog(
+            graph_id=g.ensure_metadata_obj(sess).hash,
+            node_key=node.key,
+            snap_key=node.snap.key,
+            runtime_url="python://local",
+        )
+        buffer = MetadataWriteBuffer(sess, pl, max_rows=2, flush_interval_seconds=60)
+        blocks = [
+            DataBlockMetadata(
+                id=f"block{i}", nominal_schema_key="Any", realized_schema_key="Any"
+            )
+            for i in range(3)
+        ]
+        sess.add_all(blocks)
+        buffer.add_data_block_log(blocks[0].id, Direction.OUTPUT)
+        assert sess.query(DataBlockLog).count() == 0
+        buffer.add_data_block_log(blocks[1].id, Direction.OUTPUT)
+        assert len(buffer) == 0
+        assert sess.query(DataBlockLog).count() == 2
+        buffer.add_data_block_log(blocks[2].id, Direction.OUTPUT)
+        buffer.flush()
+        assert (
+            sess.query(DataBlockLog).filter(DataBlockLog.snap_log_id == pl.id).count()
+            == 3
+        )
@@ -6,7 +6,12 @@ from typing import Any, List, Type
 import pandas as pd
 import pytest
 from dateutil.tz import tzoffset
-from snapflow.schema.casting import cast_python_object_to_field_type
+from snapflow.schema.base import create_quick_schema
+from snapflow.schema.casting import (
+    RecordsCastPlan,
+    cast_python_object_to_field_type,
+    python_caster,
+)
 from snapflow.schema.field_types import (
     DEFAULT_FIELD_TYPE,
     JSON,
@@ -24,7 +29,13 @@ from snapflow.schema.field_types import (
     all_types,
     ensure_field_type,
 )
-from snapflow.schema.inference import pandas_series_to_field_type, select_field_type
+from snapflow.schema.inference import (
+    _detect_field_type_fast,
+    infer_column_field_type,
+    pandas_series_to_field_type,
+    select_field_type,
+    select_field_type_per_value,
+)
 
 nullish = [None, "None", "null", "none"]
 bool_ = True
@@ -205,6 +216,31 @@ def test_select_field_type():
         assert ft == expected_field_types[k], k
 
 
+@pytest.mark.parametrize(
+    "values",
+    [[r.get(k) for r in sample_records] for k in sample_records[0].keys()]
+    + [[case.obj] for case in cases]
+    + [
+        ["1", "2.5", " 3 ", "1e5"],
+        ["2020-01-01", "2020-02-30", "2020-03-01"],
+        ["2020-01-01 10:00", "2020-01-01T10:00:00.5Z", "Jan 3 2020"],
+        ["true", "false", "True"],
+        ["true", "1"],
+        ["15:09:26", "15:10"],
+        ["a", "b", "c", "a"],
+        [1, 2.5, decimal_, None, float("nan")],
+        [date_, datetime_, pd.Timestamp("2020-01-01")],
+        ["null", "NA", None],
+        [],
+    ],
+    ids=lambda x: str(x)[:30],
+)
+def test_infer_column_field_type(values):
+    # Same type as detecting value by value
+    expected = select_field_type_per_value(values, _detect_field_type_fast)
+    assert infer_column_field_type(values) == expected
+
+
 ERROR = "_ERROR"
 
 D = decimal.Decimal
@@ -296,8 +332,32 @@ def test_value_soft_casting(ftype, obj, expected):
     if expected == ERROR:
         with pytest.raises(Exception):
             cast_python_object_to_field_type(obj, ftype)
+        with pytest.raises(Exception):
+            python_caster(ftype)(obj)
     else:
         assert cast_python_object_to_field_type(obj, ftype) == expected
+        assert python_caster(ftype)(obj) == expected
+
+
+def test_records_cast_plan():
+    schema = create_quick_schema(
+        "CastPlanSchema", [("a", "Integer"), ("b", "Float"), ("c", "Text")]
+    )
+    plan = RecordsCastPlan(["a", "b", "d"], schema)
+    assert [name for name, _, _ in plan.casters] == ["a", "b"]
+    records = [{"a": "1", "b": float("nan"), "d": "x"}, {"a": 2, "d": None}]
+    assert plan.apply(records) == [
+        {"a": 1, "b": None, "d": "x"},
+        {"a": 2, "d": None},
+    ]
+    # Input records aren't modified
+    assert records[0]["a"] == "1"
+    # Columns already of the fields' types need no casts (or copies)
+    typed = [{"a": 1, "b": 1.5, "d": "x"}, {"a": None}]
+    conformed = plan.apply(typed)
+    assert conformed == typed
+    assert conformed[0] is typed[0]
+    assert plan.apply([{"b": 1.5}, {"b": float("nan")}]) == [{"b": 1.5}, {"b": None}]
 
 
 def test_pandas_series_to_field_type():
@@ -9,7 +9,10 @@ import pandas as pd
 import pytest
 from snapflow.core.module import DEFAULT_LOCAL_MODULE_NAME
 from snapflow.core.snap_interface import get_schema_translation
-from snapflow.core.typing.inference import infer_schema_from_records
+from snapflow.core.typing.inference import (
+    conform_dataframe_to_schema,
+    infer_schema_from_records,
+)
 from snapflow.modules import core
 from snapflow.schema.base import (
     DEFAULT_UNICODE_TEXT_TYPE,
@@ -221,3 +224,63 @@ def test_cast_to_schema(cast_level, inferred, nominal, expected):
             for f in s.fields:
                 e = expected.get_field(f.name)
                 assert f == e
+
+
+def test_conform_dataframe_to_schema_cast_levels():
+    schema = create_quick_schema(
+        "ConformSchema",
+        [("i", "Integer"), ("f", "Float"), ("dt", "DateTime"), ("t", "Text")],
+    )
+
+    def make_df():
+        return pd.DataFrame(
+            {
+                "i": ["1", "2", "bad", None],
+                "f": ["1.5", "2", "3", "bad"],
+                "dt": ["2020-01-01", "2020-01-02", "Jan 3 2020", None],
+            }
+        )
+
+    with pytest.warns(UserWarning):
+        df = conform_dataframe_to_schema(make_df(), schema, CastToSchemaLevel.SOFT)
+    assert df["i"].dtype.name == "Int64"
+    assert list(df["i"][:2]) == [1, 2]
+    assert df["i"][2:].isna().all()
+    assert list(df["f"][:3]) == [1.5, 2.0, 3.0]
+    assert pd.isna(df["f"][3])
+    # Off-format value parsed without the guessed format
+    assert df["dt"].dtype.name == "datetime64[ns]"
+    assert list(df["dt"][:3]) == [
+        datetime(2020, 1, 1),
+        datetime(2020, 1, 2),
+        datetime(2020, 1, 3),
+    ]
+    assert df["t"].dtype.name == "string"
+    with pytest.warns(UserWarning):
+        df = conform_dataframe_to_schema(make_df(), schema, CastToSchemaLevel.NONE)
+    assert df["i"][2] == "bad"
+    assert df["f"][3] == "bad"
+    with pytest.raises(SchemaTypeError):
+        conform_dataframe_to_schema(make_df(), schema, CastToSchemaLevel.HARD)
+    # Raises by default
+    with pytest.raises(SchemaTypeError):
+        conform_dataframe_to_schema(make_df(), schema)
+
+
+def test_conform_dataframe_to_schema_mixed_datetime_formats():
+    schema = create_quick_schema("DateTimeSchema", [("dt", "DateTime")])
+    df = pd.DataFrame({"dt": ["2020-01-01 00:00:00", "1/2/2020"]})
+    df = conform_dataframe_to_schema(df, schema)
+    assert df["dt"].dtype.name == "datetime64[ns]"
+    assert list(df["dt"]) == [datetime(2020, 1, 1), datetime(2020, 1, 2)]
+
+
+def test_conform_dataframe_to_schema_big_ints():
+    schema = create_quick_schema("BigIntSchema", [("i", "Integer")])
+    # The bad value makes the column numeric as floats, which round big ints
+    df = pd.DataFrame({"i": ["9007199254740993", "2", "x"]})
+    with pytest.warns(UserWarning):
+        df = conform_dataframe_to_schema(df, schema, CastToSchemaLevel.SOFT)
+    assert df["i"][0] == 9007199254740993
+    assert df["i"][1] == 2
+    assert pd.isna(df["i"][2])
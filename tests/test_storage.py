@@ -5,11 +5,18 @@ import tempfile
 from typing import Type
 
 import pytest
+from pandas import DataFrame
+from pandas.testing import assert_frame_equal
 from snapflow.storage.data_records import MemoryDataRecords, as_records
 from snapflow.storage.db.api import DatabaseApi, DatabaseStorageApi
 from snapflow.storage.db.mysql import MysqlDatabaseStorageApi
-from snapflow.storage.db.postgres import PostgresDatabaseStorageApi
+from snapflow.storage.db.postgres import (
+    CopyCsvFile,
+    PostgresDatabaseStorageApi,
+    iterate_copy_rows,
+)
 from snapflow.storage.file_system import FileSystemStorageApi
+from snapflow.storage.memory_store import LocalPythonStore
 from snapflow.storage.storage import (
     LOCAL_PYTHON_STORAGE,
     LocalFileSystemStorageEngine,
@@ -19,6 +26,7 @@ from snapflow.storage.storage import (
     PythonStorageApi,
     SqliteStorageEngine,
     Storage,
+    closing_local_records,
 )
 
 
@@ -74,6 +82,22 @@ def test_database_api_core_operations(url):
         assert api.record_count(name + "copy") == 1
 
 
+def test_postgres_copy_csv():
+    records = [
+        {"a": 1, "b": None, "c": 'say "hi"', "d": {"k": [1, 2]}, "e": True},
+        {"a": 2, "b": "", "c": "x,y\nz", "d": None, "e": False},
+    ]
+    f = CopyCsvFile(iterate_copy_rows([records, []], ["a", "b", "c", "d", "e"]))
+    expected = "".join(
+        [
+            '"1",,"say ""hi""","{""k"": [1, 2]}","true"\n',
+            '"2","","x,y\nz",,"false"\n',
+        ]
+    )
+    assert f.read(5) + f.read(7) + f.read() == expected
+    assert f.read() == ""
+
+
 @pytest.mark.parametrize(
     "url",
     [
@@ -112,3 +136,71 @@ def test_filesystem_api_core_operations(url):
     assert api.record_count(name + "alias") == 2
     api.copy(name, name + "copy")
     assert api.record_count(name + "copy") == 2
+
+
+def test_python_storage_closes_records():
+    api: PythonStorageApi = Storage.from_url("python://_test_close").get_api()
+    closed = []
+    mdr = as_records(iter([[{"a": 1}]]))
+    mdr.closeable = lambda: closed.append(1)
+    api.put("_test", mdr)
+    api.close_all()
+    api.close_all()
+    assert closed == [1]
+    mdr.closeable = lambda: closed.append(2)
+    api.remove("_test")
+    assert closed == [1, 2]
+    assert not api.exists("_test")
+
+
+def test_closing_local_records_only_closes_own_records():
+    api: PythonStorageApi = Storage.from_url("python://_test_close_run").get_api()
+    closed = []
+    other = as_records(iter([[{"a": 1}]]))
+    other.closeable = lambda: closed.append("other")
+    api.put("_other", other)
+    with closing_local_records():
+        mdr = as_records(iter([[{"a": 1}]]))
+        mdr.closeable = lambda: closed.append("run")
+        api.put("_run", mdr)
+    assert closed == ["run"]
+    api.remove("_other")
+    assert closed == ["run", "other"]
+
+
+def test_local_python_store_spills_lru():
+    store = LocalPythonStore(max_bytes=1, spill_dir=tempfile.mkdtemp())
+    records = [{"a": i, "b": str(i)} for i in range(10)]
+    store["s1"] = as_records(records)
+    store["s2"] = as_records([dict(r) for r in records])
+    assert store.is_spilled("s1")
+    assert not store.is_spilled("s2")
+    assert "s1" in store
+    assert len(os.listdir(store.spill_dir)) == 1
+    mdr = store.get("s1")
+    assert mdr.records_object == records
+    assert mdr.record_count == 10
+    assert store.is_spilled("s2")
+    assert store.pop("s2") is None
+    assert "s2" not in store
+    store.clear()
+    assert os.listdir(store.spill_dir) == []
+
+
+def test_local_python_store_spills_exactly():
+    store = LocalPythonStore(max_bytes=1, spill_dir=tempfile.mkdtemp())
+    # Arrow would drop keys missing from the first record and pad dicts with nulls
+    records = [{"a": 1, "j": {"x": 1}}, {"a": 2, "j": {"y": [2]}, "c": "c"}]
+    dfs = {
+        "object": DataFrame({"a": [1, 2], "j": [{"x": 1}, {"y": [2]}]}),
+        "typed": DataFrame({"a": [1, 2], "b": [1.5, None]}),
+    }
+    store["records"] = as_records(records)
+    for name, df in dfs.items():
+        store[name] = as_records(df.copy())
+    store["last"] = as_records([])
+    assert store.get("records").records_object == records
+    for name, df in dfs.items():
+        assert store.is_spilled(name)
+        assert_frame_equal(store.get(name).records_object, df)
+    store.clear()
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+from datetime import datetime
+
 import pytest
 from snapflow.core.data_block import DataBlockMetadata
 from snapflow.core.graph import Graph
-from snapflow.core.node import DataBlockLog, Direction, SnapLog
+from snapflow.core.node import DataBlockLog, Direction, SnapLog, set_input_watermark
 from snapflow.core.operators import filter, latest, operator
 from snapflow.core.streams import (
     DataBlockStream,
@@ -67,6 +69,7 @@ class TestStreams:
         s = stream(nodes=self.node_source)
         s = s.filter_unprocessed(self.node1)
         assert s.get_query(self.ctx, self.sess).first() is None
+        assert not s.has_any(self.ctx, self.sess)
 
     def test_stream_unprocessed_eligible(self):
         dfl = SnapLog(
@@ -85,6 +88,9 @@ class TestStreams:
         s = stream(nodes=self.node_source)
         s = s.filter_unprocessed(self.node1)
         assert s.get_query(self.ctx, self.sess).first() == self.dr1t1
+        assert s.has_any(self.ctx, self.sess)
+        assert s.is_unprocessed(self.ctx, self.sess, self.dr1t1, self.node1)
+        assert not s.is_unprocessed(self.ctx, self.sess, self.dr2t1, self.node1)
 
     def test_stream_unprocessed_ineligible_already_input(self):
         dfl = SnapLog(
@@ -254,3 +260,148 @@ class TestStreams:
             dbs = ManagedDataBlockStream(ctx, sess, stream_builder=s)
             with pytest.raises(StopIteration):
                 assert next(dbs) is None
+
+    def test_stream_unprocessed_watermark(self):
+        # Blocks from the current second are never passed, so use older ids
+        self.dr1t1.id = "200101000000_00000_aaa"
+        self.dr2t1.id = "200101000001_00000_aaa"
+        dfl = SnapLog(
+            graph_id=self.graph.hash,
+            node_key=self.node_source.key,
+            snap_key=self.node_source.snap.key,
+            runtime_url="test",
+        )
+        drl = DataBlockLog(
+            snap_log=dfl,
+            data_block=self.dr1t1,
+            direction=Direction.OUTPUT,
+        )
+        drl2 = DataBlockLog(
+            snap_log=dfl,
+            data_block=self.dr2t1,
+            direction=Direction.OUTPUT,
+        )
+        dfl2 = SnapLog(
+            graph_id=self.graph.hash,
+            node_key=self.node1.key,
+            snap_key=self.node1.snap.key,
+            runtime_url="test",
+        )
+        drl3 = DataBlockLog(
+            snap_log=dfl2,
+            data_block=self.dr1t1,
+            direction=Direction.INPUT,
+        )
+        self.sess.add_all([dfl, drl, drl2, dfl2, drl3])
+        self.sess.flush()
+        assert self.dr1t1.id < self.dr2t1.id
+
+        s = stream(nodes=self.node_source)
+        s = s.filter_unprocessed(self.node1, input_name="input")
+        assert s.get_watermark(self.sess) is None
+        assert s.advance_watermark(self.ctx, self.sess) == self.dr1t1.id
+        assert s.get_watermark(self.sess) == self.dr1t1.id
+        assert s.get_query(self.ctx, self.sess).all() == [self.dr2t1]
+
+        # Doesn't pass the unprocessed block
+        assert s.advance_watermark(self.ctx, self.sess) == self.dr1t1.id
+        drl4 = DataBlockLog(
+            snap_log=dfl2,
+            data_block=self.dr2t1,
+            direction=Direction.INPUT,
+        )
+        self.sess.add(drl4)
+        # Not past blocks a still running source snap may yet commit
+        running = SnapLog(
+            graph_id=self.graph.hash,
+            node_key=self.node_source.key,
+            snap_key=self.node_source.snap.key,
+            runtime_url="test",
+            started_at=datetime(2020, 1, 1, 0, 0, 1),
+        )
+        self.sess.add(running)
+        self.env.settings.SNAP_RUN_STALE_SECONDS = None
+        assert s.advance_watermark(self.ctx, self.sess) == self.dr1t1.id
+        # Unless the run is so old it must have been abandoned
+        self.env.settings.SNAP_RUN_STALE_SECONDS = 60
+        assert s.advance_watermark(self.ctx, self.sess) == self.dr2t1.id
+        set_input_watermark(
+            self.sess, self.node1.key, "input", s.upstream_key(), self.dr1t1.id
+        )
+        self.env.settings.SNAP_RUN_STALE_SECONDS = None
+        running.completed_at = datetime(2020, 1, 1, 0, 0, 2)
+        assert s.advance_watermark(self.ctx, self.sess) == self.dr2t1.id
+        assert s.get_query(self.ctx, self.sess).first() is None
+        # Nor past blocks from the current second
+        dr3t1 = DataBlockMetadata(
+            nominal_schema_key="_test.TestSchema1",
+            realized_schema_key="_test.TestSchema1",
+        )
+        drl5 = DataBlockLog(snap_log=dfl, data_block=dr3t1, direction=Direction.OUTPUT)
+        drl6 = DataBlockLog(snap_log=dfl2, data_block=dr3t1, direction=Direction.INPUT)
+        self.sess.add_all([dr3t1, drl5, drl6])
+        assert s.advance_watermark(self.ctx, self.sess) == self.dr2t1.id
+
+    def test_stream_unprocessed_watermark_rewired(self):
+        self.dr1t1.id = "200101000000_00000_aaa"
+        self.dr2t1.id = "200101000001_00000_aaa"
+        for node, block in [(self.node_source, self.dr2t1), (self.node2, self.dr1t1)]:
+            dfl = SnapLog(
+                graph_id=self.graph.hash,
+                node_key=node.key,
+                snap_key=node.snap.key,
+                runtime_url="test",
+            )
+            drl = DataBlockLog(
+                snap_log=dfl, data_block=block, direction=Direction.OUTPUT
+            )
+            self.sess.add_all([dfl, drl])
+        dfl = SnapLog(
+            graph_id=self.graph.hash,
+            node_key=self.node1.key,
+            snap_key=self.node1.snap.key,
+            runtime_url="test",
+        )
+        drl = DataBlockLog(
+            snap_log=dfl, data_block=self.dr2t1, direction=Direction.INPUT
+        )
+        self.sess.add_all([dfl, drl])
+        self.sess.flush()
+
+        s = stream(nodes=self.node_source).filter_unprocessed(
+            self.node1, input_name="input"
+        )
+        assert s.advance_watermark(self.ctx, self.sess) == self.dr2t1.id
+        # Input now fed by another node: its older block is still unprocessed
+        s = stream(nodes=self.node2).filter_unprocessed(self.node1, input_name="input")
+        assert s.get_watermark(self.sess) is None
+        assert s.get_query(self.ctx, self.sess).all() == [self.dr1t1]
+
+    def test_managed_stream_paged(self):
+        dfl = SnapLog(
+            graph_id=self.graph.hash,
+            node_key=self.node_source.key,
+            snap_key=self.node_source.snap.key,
+            runtime_url="test",
+        )
+        drls = [
+            DataBlockLog(snap_log=dfl, data_block=db, direction=Direction.OUTPUT)
+            for db in [self.dr1t1, self.dr2t1, self.dr1t2]
+        ]
+        self.sess.add_all([dfl] + drls)
+        self.sess.flush()
+
+        s = stream(nodes=self.node_source)
+        dbs = ManagedDataBlockStream(self.ctx, self.sess, stream_builder=s, page_size=2)
+        assert dbs.count() == 3
+        first = next(dbs)
+        assert first.data_block_id == self.dr1t1.id
+        assert dbs.count() == 3
+        assert [b.data_block_id for b in dbs.all_blocks] == [
+            self.dr1t1.id,
+            self.dr2t1.id,
+            self.dr1t2.id,
+        ]
+        assert [b.data_block_id for b in dbs] == [self.dr2t1.id, self.dr1t2.id]
+        # One translation lookup per nominal schema
+        assert len(dbs._schema_translations) == 2
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import json
 from datetime import date, datetime, time, timedelta
+from io import StringIO
 
 import pytest
 from numpy import NaN
@@ -18,6 +19,7 @@ from snapflow.utils.pandas import (
     assert_dataframes_are_almost_equal,
     dataframe_to_records,
     empty_dataframe_for_schema,
+    read_csv_chunks,
 )
 from tests.utils import TestSchema4
 
@@ -130,6 +132,27 @@ def test_dataframe_to_records():
             assert r["c"] is None
 
 
+def test_read_csv_chunks():
+    f = StringIO('a,b\n1,NULL\n"x,\\"y",\nN/A,None other\n')
+    dfs = list(read_csv_chunks(f, chunk_size=2))
+    assert [len(df) for df in dfs] == [2, 1]
+    records = [r for df in dfs for r in dataframe_to_records(df)]
+    assert records == [
+        {"a": "1", "b": None},
+        {"a": 'x,"y', "b": None},
+        {"a": None, "b": "None other"},
+    ]
+    assert list(read_csv_chunks(StringIO(""))) == []
+    # Ragged rows and repeated headers read like `read_csv`
+    f = StringIO("a,b,a\n1,2,3,4\n5\n6,7,8\n")
+    records = [r for df in read_csv_chunks(f) for r in dataframe_to_records(df)]
+    assert records == [
+        {"a": "3", "b": "2"},
+        {"a": None, "b": None},
+        {"a": "8", "b": "7"},
+    ]
+
+
 def test_with_header():
     i2 = (range(i) for i in range(1, 6))
     i2h = with_header(i2)